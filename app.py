@@ -2,23 +2,40 @@
 import dash 
 
 # Modules standards pour la gestion des flux de données (comme les fichiers) et pour l'encodage/décodage en base64 (utile pour les fichiers uploadés dans Dash)
-import io       # Utilisé pour manipuler des fichiers en mémoire
 import base64   # Permet d'encoder et de décoder des fichiers en base64, format utilisé dans Dash pour transmettre les fichiers via le web
 
 # Modules pour interagir avec le système de fichiers et effectuer des recherches ou validations via des expressions régulières
 import os       # Permet d'interagir avec le système de fichiers (par ex : vérifier si un fichier existe, créer un dossier temporaire, etc.)
 import re       # Permet de manipuler des expressions régulières, utile pour valider des noms de fichiers, des URL, des types de variables, etc.
+import json     # Métadonnées des uploads par morceaux
+import tempfile # Fichiers temporaires pour décoder les fichiers uploadés sur disque plutôt qu'en mémoire
 
 # Gestion des dates/heures pour les rapports et exports
 import datetime
 
+# Registre des jeux de données côté serveur (identifiants uniques, accès concurrent, ordre LRU)
+import uuid
+import hashlib
+import time
+import threading
+import multiprocessing
+import sys
+from collections import OrderedDict
+
+# Exécution parallèle des calculs par colonne et des rééchantillonnages
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from resampling import resampling_batch, resampling_statistic
+
 # Composants de base de Dash (Contrôles, HTML, callbacks)
 from dash import dcc, html, Input, Output, State, dash_table, callback_context
 
-# Preprocessing des données : Normalisation/Standardisation
-from sklearn.preprocessing import StandardScaler, MinMaxScaler, RobustScaler
-# Import KNN imputer for missing values
-from sklearn.impute import KNNImputer
+# Callbacks en arrière-plan : processus séparés, avancement et résultats dans un cache disque
+from dash import DiskcacheManager
+import diskcache
+
+# Requêtes HTTP des routes Flask (upload par morceaux, plans d'imputation)
+from flask import request, send_file, Response, stream_with_context
 
 # Exception pour arrêter la mise à jour des callbacks
 from dash.exceptions import PreventUpdate
@@ -32,6 +49,11 @@ import pandas as pd
 # Calculs numériques et manipulations de tableaux
 import numpy as np
 
+# Format colonnaire Arrow pour le cache disque des jeux de données (lecture en mémoire mappée)
+import pyarrow as pa
+# Lecteur CSV Arrow en flux (analyse bloc par bloc des gros fichiers)
+import pyarrow.csv as pacsv
+
 # Sélection dynamique de composants dans les callbacks
 from dash import ALL
 
@@ -48,7 +70,7 @@ import plotly.graph_objects as go
 import plotly.express as px
 
 # Importation des tests statistiques de scipy.stats
-from scipy.stats import shapiro, pearsonr, chi2_contingency, ttest_ind, spearmanr, kstest
+from scipy.stats import shapiro, pearsonr, chi2_contingency, spearmanr, kstest
 
 # Importation de Dash Bootstrap Components pour améliorer l'esthétique du dashboard
 import dash_bootstrap_components as dbc
@@ -65,18 +87,2033 @@ from dash import no_update  # Déjà présent mais important pour la gestion des
 # Importation de stats de scipy pour avoir accès à diverses fonctions statistiques
 from scipy import stats
 
+# Convolution par FFT pour l'estimation de densité sur grille
+from scipy.signal import fftconvolve
+
+# Classification hiérarchique pour réordonner les grandes matrices de corrélation
+from scipy.cluster.hierarchy import linkage, leaves_list
+from scipy.spatial.distance import squareform
+from scipy.spatial import cKDTree
+
 #-------------------
 # Initialize the app
 #-------------------
 
+# Cache disque des tâches en arrière-plan (voir « Tâches en arrière-plan »)
+JOB_DIR = os.environ.get('EXPLORA_JOB_DIR', os.path.join('cache', 'jobs'))
+
 app = dash.Dash(__name__, 
                external_stylesheets=[dbc.themes.BOOTSTRAP, dbc.icons.FONT_AWESOME],
                suppress_callback_exceptions=True,
+               background_callback_manager=DiskcacheManager(diskcache.Cache(JOB_DIR)),
                title="Data Analysis Dashboard",
                meta_tags=[{'name': 'viewport', 
                           'content': 'width=device-width, initial-scale=1.0'}])
 global_df = None
 
+#------------------------------------------
+# Registre des jeux de données côté serveur
+#------------------------------------------
+# Le store 'store-data' ne contient plus que la référence du jeu de données
+# ({'dataset_id': ..., 'n_rows': ..., 'n_cols': ...}) ; le DataFrame reste sur le serveur
+# et chaque callback le récupère en O(1) au lieu de reconstruire les enregistrements JSON.
+# Chaque jeu de données importé est aussi écrit au format Arrow dans un cache disque partagé,
+# ce qui permet à n'importe quel worker (gunicorn) de le servir, même après un redémarrage.
+# Les versions issues du prétraitement ne sont écrites que si une tâche en arrière-plan (un autre
+# processus) les calcule : leur référence porte le pipeline qui les recalcule depuis le jeu importé
+# (voir « Pipeline de prétraitement »).
+DATASET_REGISTRY = OrderedDict()
+DATASET_REGISTRY_LOCK = threading.Lock()
+MAX_DATASETS_IN_MEMORY = int(os.environ.get('EXPLORA_MAX_DATASETS', 16))
+
+DATASET_CACHE_DIR = os.environ.get('EXPLORA_CACHE_DIR', os.path.join('cache', 'datasets'))
+DATASET_CACHE_MAX_BYTES = int(os.environ.get('EXPLORA_CACHE_MAX_MB', 2048)) * 1024 * 1024
+DATASET_CACHE_STATS = {'memory_hits': 0, 'disk_hits': 0, 'pipeline_runs': 0, 'misses': 0, 'evictions': 0, 'write_errors': 0}
+
+def dataset_cache_path(dataset_id):
+    return os.path.join(DATASET_CACHE_DIR, f"{dataset_id}.arrow")
+
+def persist_dataset(dataset_id, df):
+    """Write a dataset to the columnar disk cache (Arrow IPC file)"""
+    os.makedirs(DATASET_CACHE_DIR, exist_ok=True)
+    path = dataset_cache_path(dataset_id)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        # Renommage atomique : un autre worker ne lit jamais un fichier incomplet
+        os.replace(tmp_path, path)
+    except (pa.ArrowException, OSError) as e:
+        # Colonnes de types mixtes non représentables en Arrow : le jeu reste en mémoire seulement
+        with DATASET_REGISTRY_LOCK:
+            DATASET_CACHE_STATS['write_errors'] += 1
+        print(f"Cache disque indisponible pour {dataset_id}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return
+    evict_dataset_cache(keep=path)
+
+def load_persisted_dataset(dataset_id):
+    """Read a dataset from the disk cache through a memory map, or return None"""
+    path = dataset_cache_path(dataset_id)
+    try:
+        with pa.memory_map(path, 'r') as source:
+            table = pa.ipc.open_file(source).read_all()
+        # Mise à jour de la date d'accès utilisée pour l'ordre LRU entre workers
+        os.utime(path)
+    except (FileNotFoundError, pa.ArrowException):
+        return None
+    return table.to_pandas(split_blocks=True)
+
+def evict_dataset_cache(keep=None):
+    """Remove the least recently used cache files until the size cap is respected"""
+    try:
+        entries = []
+        for name in os.listdir(DATASET_CACHE_DIR):
+            if name.endswith('.arrow'):
+                file_stat = os.stat(os.path.join(DATASET_CACHE_DIR, name))
+                entries.append((file_stat.st_mtime, file_stat.st_size, name))
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total <= DATASET_CACHE_MAX_BYTES:
+            break
+        path = os.path.join(DATASET_CACHE_DIR, name)
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        with DATASET_REGISTRY_LOCK:
+            DATASET_CACHE_STATS['evictions'] += 1
+
+def register_dataset(df, parent=None, touched_columns=None):
+    """Store a DataFrame server-side and return the reference to keep in store-data.
+
+    When df derives from the dataset referenced by parent with the same rows,
+    touched_columns lists the changed or added columns: only their statistics are recomputed.
+    """
+    dataset_id = uuid.uuid4().hex
+    with DATASET_REGISTRY_LOCK:
+        DATASET_REGISTRY[dataset_id] = df
+        # Éviction des jeux de données les moins récemment utilisés
+        while len(DATASET_REGISTRY) > MAX_DATASETS_IN_MEMORY:
+            DATASET_REGISTRY.popitem(last=False)
+    persist_dataset(dataset_id, df)
+    if parent is not None and touched_columns is not None:
+        derive_dataset_stats(parent, dataset_id, df, touched_columns)
+    return {'dataset_id': dataset_id, 'n_rows': len(df), 'n_cols': df.shape[1]}
+
+def get_dataset(stored_data, progress=None):
+    """Return the live DataFrame referenced by store-data, or None if unknown.
+
+    The DataFrame is shared between callbacks: copy it before modifying it.
+    progress(fraction) is called if a preprocessing pipeline has to be computed.
+    """
+    if not stored_data or not isinstance(stored_data, dict):
+        return None
+    dataset_id = stored_data.get('dataset_id')
+    if not dataset_id or not re.match(r'^[0-9a-f]{32}$', dataset_id):
+        return None
+    with DATASET_REGISTRY_LOCK:
+        df = DATASET_REGISTRY.get(dataset_id)
+        if df is not None:
+            DATASET_REGISTRY.move_to_end(dataset_id)
+            DATASET_CACHE_STATS['memory_hits'] += 1
+            return df
+
+    # Jeu de données absent de ce worker : lecture depuis le cache disque partagé
+    df = load_persisted_dataset(dataset_id)
+    if stored_data.get('pipeline'):
+        if df is None:
+            # Version issue du pipeline de prétraitement : calculée à sa première lecture
+            return compute_pipeline_dataset(stored_data, progress)
+        # Version calculée par une tâche en arrière-plan
+        derive_pipeline_stats(stored_data, df)
+    return keep_dataset(dataset_id, df, 'disk_hits')
+
+def keep_dataset(dataset_id, df, counter):
+    """Add a dataset read or computed by this worker to the registry and count it; returns df"""
+    with DATASET_REGISTRY_LOCK:
+        if df is None:
+            DATASET_CACHE_STATS['misses'] += 1
+            return None
+        DATASET_CACHE_STATS[counter] += 1
+        DATASET_REGISTRY[dataset_id] = df
+        while len(DATASET_REGISTRY) > MAX_DATASETS_IN_MEMORY:
+            DATASET_REGISTRY.popitem(last=False)
+    return df
+
+def get_dataset_cache_stats():
+    """Return the hit/miss counters and the disk usage of the dataset cache"""
+    try:
+        files = [os.path.join(DATASET_CACHE_DIR, name) for name in os.listdir(DATASET_CACHE_DIR) if name.endswith('.arrow')]
+    except OSError:
+        files = []
+    with DATASET_REGISTRY_LOCK:
+        counters = {**DATASET_CACHE_STATS, 'in_memory': len(DATASET_REGISTRY)}
+    return {
+        **counters,
+        'disk_files': len(files),
+        'disk_bytes': sum(os.path.getsize(path) for path in files if os.path.exists(path)),
+        'disk_max_bytes': DATASET_CACHE_MAX_BYTES
+    }
+
+@app.server.route('/api/cache/stats')
+def dataset_cache_stats_route():
+    return get_dataset_cache_stats()
+
+#---------------------------------------------------------
+# Esquisses de quantiles et d'histogrammes (grandes colonnes)
+#---------------------------------------------------------
+# Au-delà de SKETCH_MIN_ROWS valeurs, une colonne numérique n'est plus triée en entier :
+# une esquisse de quantiles KLL (fusionnable, erreur de rang bornée) et un histogramme à
+# classes fixes sont construits en un seul passage par blocs, puis le résumé et les graphiques
+# répondent depuis l'esquisse. Le mode « Calcul exact » revient au parcours complet.
+SKETCH_MIN_ROWS = int(os.environ.get('EXPLORA_SKETCH_MIN_ROWS', 1_000_000))
+QUANTILE_SKETCH_K = 1024
+HISTOGRAM_SKETCH_BINS = 2048
+SKETCH_BLOCK_SIZE = 1 << 20
+SKETCH_RNG = np.random.default_rng()
+
+def kll_rank_error(k=QUANTILE_SKETCH_K):
+    """Normalized rank error bound of a KLL sketch (99% confidence, Apache DataSketches approximation)"""
+    # Borne affichée vérifiée contre les quantiles exacts (99 centiles, k = 1024) : erreur de rang
+    # maximale observée 0,09 % à 1e6 valeurs, 0,22 % à 1e7 et 3e7 (normale, lognormale, données triées,
+    # ex-aequo), pour une borne de 0,35 %
+    return 2.446 / k ** 0.9433
+
+def kll_capacity(level, n_levels, k):
+    return max(8, int(np.ceil(k * (2 / 3) ** (n_levels - 1 - level))))
+
+def kll_compress(sketch):
+    """Compact every level above its capacity: sort it and promote one item out of two"""
+    levels = sketch['levels']
+    level = 0
+    while level < len(levels):
+        if len(levels[level]) > kll_capacity(level, len(levels), sketch['k']):
+            if level + 1 == len(levels):
+                levels.append(np.empty(0))
+            items = np.sort(levels[level])
+            odd = len(items) % 2
+            levels[level + 1] = np.concatenate([levels[level + 1], items[odd:][SKETCH_RNG.integers(2)::2]])
+            levels[level] = items[:odd]
+        level += 1
+
+def kll_merge(sketch, other):
+    """Merge other into sketch (both KLL sketches with the same k) and return sketch"""
+    levels = sketch['levels']
+    for level, items in enumerate(other['levels']):
+        if level == len(levels):
+            levels.append(np.empty(0))
+        levels[level] = np.concatenate([levels[level], items])
+    sketch['n'] += other['n']
+    kll_compress(sketch)
+    return sketch
+
+def kll_from_sorted_block(sorted_block, k=QUANTILE_SKETCH_K):
+    """Sketch a sorted block directly at the level where it fits (one decimation of stride 2^level)"""
+    level = max(0, int(np.ceil(np.log2(len(sorted_block) / k)))) if len(sorted_block) else 0
+    stride = 1 << level
+    return {'k': k, 'n': len(sorted_block), 'levels': [np.empty(0)] * level + [sorted_block[SKETCH_RNG.integers(stride)::stride]]}
+
+def kll_quantiles(sketch, quantiles):
+    """Approximate quantiles from a KLL sketch (items weighted by 2^level)"""
+    items = np.concatenate(sketch['levels'])
+    weights = np.concatenate([np.full(len(level_items), 1 << level) for level, level_items in enumerate(sketch['levels'])])
+    order = np.argsort(items, kind='stable')
+    items = items[order]
+    cumulative = np.cumsum(weights[order])
+    positions = np.searchsorted(cumulative, np.asarray(quantiles) * cumulative[-1])
+    return items[np.minimum(positions, len(items) - 1)]
+
+def build_column_sketch(values, low, high):
+    """Build the KLL quantile sketch and the fixed-bin histogram of a float array in one pass by blocks"""
+    quantile_sketch = {'k': QUANTILE_SKETCH_K, 'n': 0, 'levels': []}
+    counts = np.zeros(HISTOGRAM_SKETCH_BINS, dtype=np.int64)
+    scale = HISTOGRAM_SKETCH_BINS / (high - low) if high > low else 0.0
+    for start in range(0, len(values), SKETCH_BLOCK_SIZE):
+        block = values[start:start + SKETCH_BLOCK_SIZE]
+        kll_merge(quantile_sketch, kll_from_sorted_block(np.sort(block)))
+        bins = np.minimum(((block - low) * scale).astype(np.int64), HISTOGRAM_SKETCH_BINS - 1)
+        counts += np.bincount(bins, minlength=HISTOGRAM_SKETCH_BINS)
+    return {'quantiles': quantile_sketch, 'histogram': {'low': low, 'high': high, 'counts': counts}}
+
+def rebin_histogram(histogram, n_bins):
+    """Aggregate the fixed-bin histogram into n_bins equal-width classes (counts interpolated within a fine bin)"""
+    fine_edges = np.linspace(histogram['low'], histogram['high'], len(histogram['counts']) + 1)
+    cumulative = np.concatenate([[0], np.cumsum(histogram['counts'])])
+    edges = np.linspace(histogram['low'], histogram['high'], n_bins + 1)
+    return edges, np.rint(np.diff(np.interp(edges, fine_edges, cumulative)))
+
+def approximation_note(col_stats):
+    """Describe the error bound of a column answered from its sketch"""
+    return f"Approximation sur {col_stats['count']:,} valeurs (erreur de rang ≤ ±{col_stats['rank_error'] * 100:.2f} %)".replace(',', ' ')
+
+#------------------------------------------
+# Statistiques mémorisées par jeu de données
+#------------------------------------------
+# Un jeu de données enregistré n'est jamais modifié en place : chaque transformation
+# enregistre un nouvel identifiant, qui sert donc de version. Les statistiques par colonne
+# (effectifs, moyenne, écart-type, quantiles, manquants, cardinalité, modalités fréquentes)
+# sont calculées une seule fois par version puis partagées entre le résumé, la vue des
+# valeurs manquantes et les listes déroulantes.
+DATASET_STATS_CACHE = OrderedDict()
+DATASET_STATS_LOCK = threading.Lock()
+SUMMARY_QUANTILES = (0.25, 0.5, 0.75)
+TOP_VALUES_COUNT = 5
+
+def column_kind(series):
+    """Classify a column as numeric, boolean, qualitative, datetime or other"""
+    if pd.api.types.is_bool_dtype(series):
+        return 'boolean'
+    if pd.api.types.is_numeric_dtype(series):
+        return 'numeric'
+    if isinstance(series.dtype, pd.CategoricalDtype) or series.dtype == 'object':
+        return 'qualitative'
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return 'datetime'
+    return 'other'
+
+def sorted_quantiles(sorted_values, quantiles):
+    """Linear-interpolated quantiles (same definition as pandas) of an already sorted array"""
+    positions = np.asarray(quantiles) * (len(sorted_values) - 1)
+    lower = np.floor(positions).astype(int)
+    upper = np.ceil(positions).astype(int)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (positions - lower)
+
+def compute_column_stats(series, exact=False):
+    """Compute the summary statistics of one column in a single pass over its values.
+
+    Large numeric columns are sketched instead of sorted unless exact is True.
+    """
+    kind = column_kind(series)
+    nulls = int(series.isna().sum())
+    col_stats = {'dtype': str(series.dtype), 'kind': kind, 'count': len(series) - nulls, 'nulls': nulls}
+
+    if kind == 'numeric' and not exact and col_stats['count'] >= SKETCH_MIN_ROWS:
+        values = series.to_numpy(dtype='float64', na_value=np.nan)
+        values = values[~np.isnan(values)]
+        col_stats.update({
+            'mean': float(values.mean()),
+            'std': float(values.std(ddof=1)),
+            'min': float(values.min()),
+            'max': float(values.max()),
+            # La cardinalité exacte demanderait un tri ou un hachage complet
+            'unique': None,
+            'rank_error': kll_rank_error()
+        })
+        col_stats['sketch'] = build_column_sketch(values, col_stats['min'], col_stats['max'])
+        col_stats['quantiles'] = [float(q) for q in kll_quantiles(col_stats['sketch']['quantiles'], SUMMARY_QUANTILES)]
+    elif kind == 'numeric':
+        values = series.to_numpy(dtype='float64', na_value=np.nan)
+        values = np.sort(values[~np.isnan(values)])
+        n = len(values)
+        col_stats['unique'] = int(np.count_nonzero(np.diff(values))) + 1 if n else 0
+        if n:
+            col_stats['mean'] = float(values.mean())
+            col_stats['std'] = float(values.std(ddof=1)) if n > 1 else np.nan
+            col_stats['min'] = float(values[0])
+            col_stats['max'] = float(values[-1])
+            col_stats['quantiles'] = [float(q) for q in sorted_quantiles(values, SUMMARY_QUANTILES)]
+        else:
+            col_stats.update({'mean': np.nan, 'std': np.nan, 'min': np.nan, 'max': np.nan,
+                              'quantiles': [np.nan] * len(SUMMARY_QUANTILES)})
+    elif kind == 'qualitative':
+        # Comptage par codes pour les catégories, par hachage pour le texte
+        counts = series.value_counts(sort=True)
+        counts = counts[counts > 0]
+        col_stats['unique'] = len(counts)
+        col_stats['top_values'] = [(value, int(count)) for value, count in counts.head(TOP_VALUES_COUNT).items()]
+    else:
+        col_stats['unique'] = int(series.nunique())
+    return col_stats
+
+def compute_dataset_stats(df, exact=False):
+    """Compute the statistics of every column of a DataFrame"""
+    return {
+        'n_rows': len(df),
+        'columns': {col: compute_column_stats(df[col], exact) for col in df.columns}
+    }
+
+def get_dataset_stats(stored_data, df=None, exact=False):
+    """Return the memoized statistics of the dataset referenced by store-data, or None.
+
+    With exact=True, sketched columns are recomputed with a full scan (cached separately).
+    """
+    if df is None:
+        df = get_dataset(stored_data)
+    if df is None:
+        return None
+    dataset_id = stored_data['dataset_id']
+    cache_key = f"{dataset_id}:exact" if exact else dataset_id
+    with DATASET_STATS_LOCK:
+        dataset_stats = DATASET_STATS_CACHE.get(dataset_id)
+        # Sans colonne esquissée, les statistiques par défaut sont déjà exactes
+        if exact and dataset_stats is not None and not any('sketch' in col_stats for col_stats in dataset_stats['columns'].values()):
+            cache_key = dataset_id
+        dataset_stats = DATASET_STATS_CACHE.get(cache_key)
+        if dataset_stats is not None:
+            DATASET_STATS_CACHE.move_to_end(cache_key)
+            return dataset_stats
+
+    dataset_stats = compute_dataset_stats(df, exact)
+    cache_dataset_stats(cache_key, dataset_stats)
+    return dataset_stats
+
+def sketched_column_stats(stored_data, df, col, exact=False):
+    """Return the cached statistics of a column when charts can answer from its sketch, else None"""
+    if exact:
+        return None
+    col_stats = get_dataset_stats(stored_data, df)['columns'].get(col)
+    return col_stats if col_stats is not None and 'sketch' in col_stats else None
+
+def cache_dataset_stats(dataset_id, dataset_stats):
+    with DATASET_STATS_LOCK:
+        DATASET_STATS_CACHE[dataset_id] = dataset_stats
+        while len(DATASET_STATS_CACHE) > MAX_DATASETS_IN_MEMORY:
+            DATASET_STATS_CACHE.popitem(last=False)
+
+def derive_dataset_stats(parent, dataset_id, df, touched_columns):
+    """Build the statistics of a derived dataset from its parent's, recomputing only the touched columns"""
+    with DATASET_STATS_LOCK:
+        parent_stats = DATASET_STATS_CACHE.get(parent.get('dataset_id'))
+    # Statistiques du parent jamais calculées ou lignes modifiées : calcul complet à la demande
+    if parent_stats is None or parent_stats['n_rows'] != len(df):
+        return
+    touched_columns = set(touched_columns)
+    cache_dataset_stats(dataset_id, {
+        'n_rows': len(df),
+        'columns': {
+            col: parent_stats['columns'][col] if col not in touched_columns and col in parent_stats['columns']
+            else compute_column_stats(df[col])
+            for col in df.columns
+        }
+    })
+
+def columns_of_kind(dataset_stats, *kinds, with_missing=False):
+    """List the columns of the given kinds, optionally only those with missing values"""
+    return [col for col, col_stats in dataset_stats['columns'].items()
+            if col_stats['kind'] in kinds and (not with_missing or col_stats['nulls'] > 0)]
+
+def summary_tables(dataset_stats):
+    """Build the quantitative and qualitative summary tables (describe() layout) from the cached statistics"""
+    quantitative = {}
+    qualitative = {}
+    for col, col_stats in dataset_stats['columns'].items():
+        if col_stats['kind'] == 'numeric':
+            quantitative[col] = {
+                'count': float(col_stats['count']),
+                'mean': col_stats['mean'],
+                'std': col_stats['std'],
+                'min': col_stats['min'],
+                **{f"{int(q * 100)}%": value for q, value in zip(SUMMARY_QUANTILES, col_stats['quantiles'])},
+                'max': col_stats['max'],
+                'Valeurs manquantes': col_stats['nulls']
+            }
+        elif col_stats['kind'] == 'qualitative':
+            top, freq = col_stats['top_values'][0] if col_stats['top_values'] else (np.nan, np.nan)
+            qualitative[col] = {
+                'count': col_stats['count'],
+                'unique': col_stats['unique'],
+                'top': top,
+                'freq': freq,
+                'Valeurs manquantes': col_stats['nulls']
+            }
+    return pd.DataFrame.from_dict(quantitative, orient='index'), pd.DataFrame.from_dict(qualitative, orient='index')
+
+#-----------------------------------------------------------
+# Index trié par colonne et histogrammes calculés côté serveur
+#-----------------------------------------------------------
+# Les valeurs triées d'une colonne sont calculées une fois par version du jeu de données
+# et partagées : histogrammes (une recherche dichotomique par borne de classe), QQ-plots,
+# médianes et écarts interquartiles, normalisation robuste et rangs de Spearman.
+# Les colonnes sont binnées avec NumPy et seules les bornes et effectifs des classes
+# sont envoyés au navigateur (trace en barres, taille O(classes) au lieu de O(lignes)).
+# Le cache est borné en octets (valeurs triées et rangs), les colonnes les moins récemment
+# utilisées étant oubliées en premier.
+SORTED_COLUMN_CACHE = OrderedDict()
+SORTED_COLUMN_LOCK = threading.Lock()
+SORTED_COLUMN_MAX_BYTES = int(os.environ.get('EXPLORA_SORTED_COLUMNS_MAX_MB', 512)) * 1024 * 1024
+QQ_PLOT_POINTS = 500
+
+def evict_to_budget(cache, max_bytes, nbytes):
+    """Drop the least recently used entries of a cache until their nbytes total fits in max_bytes.
+
+    The most recent entry is always kept. Call it with the cache's lock held.
+    """
+    total = sum(nbytes(value) for value in cache.values())
+    while total > max_bytes and len(cache) > 1:
+        _, value = cache.popitem(last=False)
+        total -= nbytes(value)
+
+def index_nbytes(index):
+    return index['sorted'].nbytes + (index['ranks'].nbytes if index['ranks'] is not None else 0)
+
+def get_column_index(stored_data, df, col):
+    """Return the sorted index of a column: sorted non-missing float64 values, ranks computed on demand"""
+    key = (stored_data['dataset_id'], col)
+    with SORTED_COLUMN_LOCK:
+        index = SORTED_COLUMN_CACHE.get(key)
+        if index is not None:
+            SORTED_COLUMN_CACHE.move_to_end(key)
+            return index
+
+    values = df[col].to_numpy(dtype='float64', na_value=np.nan)
+    index = {'sorted': np.sort(values[~np.isnan(values)]), 'ranks': None}
+    with SORTED_COLUMN_LOCK:
+        SORTED_COLUMN_CACHE[key] = index
+        evict_to_budget(SORTED_COLUMN_CACHE, SORTED_COLUMN_MAX_BYTES, index_nbytes)
+    return index
+
+def get_sorted_column(stored_data, df, col):
+    """Return the sorted non-missing values of a column as float64 (cached per dataset version)"""
+    return get_column_index(stored_data, df, col)['sorted']
+
+def column_ranks(stored_data, df, col):
+    """Average ranks (as scipy.stats.rankdata) of a column from its sorted index; missing values stay NaN"""
+    index = get_column_index(stored_data, df, col)
+    if index['ranks'] is None:
+        values = df[col].to_numpy(dtype='float64', na_value=np.nan)
+        left = np.searchsorted(index['sorted'], values, side='left')
+        right = np.searchsorted(index['sorted'], values, side='right')
+        index['ranks'] = np.where(np.isnan(values), np.nan, (left + right + 1) / 2)
+        with SORTED_COLUMN_LOCK:
+            evict_to_budget(SORTED_COLUMN_CACHE, SORTED_COLUMN_MAX_BYTES, index_nbytes)
+    return index['ranks']
+
+def qq_points(sorted_values=None, quantile_sketch=None, n_values=None):
+    """Theoretical vs observed normal QQ-plot quantiles, downsampled to at most QQ_PLOT_POINTS points"""
+    n = len(sorted_values) if sorted_values is not None else n_values
+    fractions = np.linspace(0, 1, min(n, QQ_PLOT_POINTS))
+    theoretical = stats.norm.ppf(0.01 + 0.98 * fractions)
+    if sorted_values is not None:
+        observed = sorted_quantiles(sorted_values, fractions)
+    else:
+        observed = kll_quantiles(quantile_sketch, fractions)
+    return theoretical, observed
+
+def histogram_edges(low, high, n_bins):
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    return np.linspace(low, high, n_bins + 1)
+
+def histogram_from_sorted(sorted_values, n_bins):
+    """Equal-width histogram (same classes as np.histogram) of a sorted array in O(bins log n)"""
+    edges = histogram_edges(sorted_values[0], sorted_values[-1], n_bins)
+    positions = np.searchsorted(sorted_values, edges, side='left')
+    # Dernière classe fermée à droite, comme np.histogram
+    positions[-1] = len(sorted_values)
+    return edges, np.diff(positions)
+
+def histogram_trace(edges, counts, density=False, **trace_kwargs):
+    """Bar trace drawing a precomputed histogram (classes contiguous when the layout bargap is 0)"""
+    heights = counts / (counts.sum() * np.diff(edges)) if density else counts
+    return go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=heights,
+        customdata=np.column_stack([edges[:-1], edges[1:], counts]),
+        hovertemplate="[%{customdata[0]:.2f} ; %{customdata[1]:.2f}]<br>Effectif: %{customdata[2]}<extra></extra>",
+        **trace_kwargs
+    )
+
+#------------------------------------------------
+# Estimation de densité (KDE) par binning et FFT
+#------------------------------------------------
+# Les valeurs sont réparties sur une grille régulière (binning linéaire, O(n)) puis
+# convoluées avec le noyau gaussien par FFT (O(g log g)) ; la courbe est interpolée
+# aux points affichés. Pour une colonne esquissée, l'histogramme de l'esquisse sert
+# directement de grille. Bande passante de Scott, comme scipy.stats.gaussian_kde,
+# au moins quatre pas de grille quand la grille atteint sa taille maximale.
+# Les courbes calculées sont gardées dans un cache borné en octets (ordre LRU).
+KDE_GRID_SIZE = 2048
+KDE_MAX_GRID_SIZE = 1 << 20
+KDE_CACHE = OrderedDict()
+KDE_CACHE_LOCK = threading.Lock()
+KDE_CACHE_MAX_BYTES = int(os.environ.get('EXPLORA_KDE_CACHE_MAX_MB', 64)) * 1024 * 1024
+
+def scott_bandwidth(n, std):
+    return std * n ** (-1 / 5)
+
+def linear_binning(values, grid):
+    """Spread each value over its two neighbouring grid points, weighted by proximity"""
+    step = grid[1] - grid[0]
+    positions = (values - grid[0]) / step
+    lower = np.minimum(positions.astype(np.int64), len(grid) - 2)
+    weights = positions - lower
+    return (np.bincount(lower, weights=1 - weights, minlength=len(grid))
+            + np.bincount(lower + 1, weights=weights, minlength=len(grid)))
+
+def binned_kde(grid, counts, bandwidth):
+    """Gaussian KDE of binned counts on their grid, computed by FFT convolution"""
+    step = grid[1] - grid[0]
+    half_width = int(np.ceil(4 * bandwidth / step))
+    offsets = np.arange(-half_width, half_width + 1) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+    return np.maximum(fftconvolve(counts, kernel, mode='same'), 0) / counts.sum()
+
+def column_kde(stored_data, df, col, col_stats=None):
+    """Return (grid, density) of a column's KDE, cached per (dataset version, column, bandwidth)"""
+    if col_stats is not None:
+        n, std, low, high = col_stats['count'], col_stats['std'], col_stats['min'], col_stats['max']
+    else:
+        sorted_values = get_sorted_column(stored_data, df, col)
+        n = len(sorted_values)
+        std = sorted_values.std(ddof=1) if n > 1 else 0.0
+        low, high = (sorted_values[0], sorted_values[-1]) if n else (0.0, 0.0)
+    if not std > 0:
+        raise ValueError("Variance nulle : la densité ne peut pas être estimée")
+    bandwidth = scott_bandwidth(n, std)
+    # L'histogramme de l'esquisse n'est utilisable que si ses classes sont fines devant la bande passante
+    histogram = col_stats['sketch']['histogram'] if col_stats is not None else None
+    from_sketch = histogram is not None and (high - low) / len(histogram['counts']) <= bandwidth / 4
+    if not from_sketch:
+        # Pas de grille d'au plus un quart de bande passante. Si le plafond de la grille l'empêche
+        # (valeurs extrêmes très éloignées du reste), la bande passante est élargie à quatre pas
+        grid_size = int(min(KDE_MAX_GRID_SIZE, max(KDE_GRID_SIZE, np.ceil(4 * (high - low) / bandwidth) + 1)))
+        bandwidth = max(bandwidth, 4 * (high - low) / (grid_size - 1))
+
+    key = (stored_data['dataset_id'], col, bandwidth, from_sketch)
+    with KDE_CACHE_LOCK:
+        cached = KDE_CACHE.get(key)
+        if cached is not None:
+            KDE_CACHE.move_to_end(key)
+            return cached
+
+    if from_sketch:
+        edges = np.linspace(histogram['low'], histogram['high'], len(histogram['counts']) + 1)
+        grid, counts = (edges[:-1] + edges[1:]) / 2, histogram['counts'].astype('float64')
+    else:
+        grid = np.linspace(low, high, grid_size)
+        if col_stats is None:
+            values = sorted_values
+        else:
+            values = df[col].to_numpy(dtype='float64', na_value=np.nan)
+            values = values[~np.isnan(values)]
+        counts = linear_binning(values, grid)
+    result = (grid, binned_kde(grid, counts, bandwidth))
+    with KDE_CACHE_LOCK:
+        KDE_CACHE[key] = result
+        evict_to_budget(KDE_CACHE, KDE_CACHE_MAX_BYTES, lambda curve: curve[0].nbytes + curve[1].nbytes)
+    return result
+
+#---------------------------------------------
+# Matrices de corrélation (produits matriciels)
+#---------------------------------------------
+# Corrélations calculées sur les paires complètes (chaque paire garde toutes ses lignes
+# renseignées) à partir de produits matriciels BLAS sur des blocs de lignes centrés-réduits.
+# La matrice complète des variables numériques est mise en cache par version et par méthode :
+# choisir un sous-ensemble de variables ne fait qu'en extraire une partie.
+# Spearman utilise les rangs de chaque colonne sur toutes ses valeurs, ce qui n'est exact que
+# pour les paires sans ligne écartée ; les autres paires sont reclassées sur leurs seules lignes
+# complètes (comme spearmanr sur ces lignes), une fois par couple de motifs de valeurs manquantes.
+# Au-delà de EXPLORA_SPEARMAN_EXACT_CELLS rangs recomptés, les paires restantes (celles qui perdent
+# le moins de lignes) gardent les rangs des colonnes entières : leur coefficient est approché.
+CORRELATION_CACHE = OrderedDict()
+CORRELATION_CACHE_LOCK = threading.Lock()
+CORRELATION_BLOCK_ELEMENTS = 1 << 22
+SPEARMAN_EXACT_CELLS = int(os.environ.get('EXPLORA_SPEARMAN_EXACT_CELLS', 50_000_000))
+
+def pairwise_correlation(columns):
+    """Pairwise-complete Pearson correlation matrix of equal-length float arrays (NaN = missing).
+
+    Returns the correlation matrix and the number of complete rows of each pair.
+    """
+    k = len(columns)
+    n_rows = len(columns[0]) if k else 0
+    n_pairs = np.zeros((k, k))
+    sums = np.zeros((k, k))
+    squares = np.zeros((k, k))
+    products = np.zeros((k, k))
+    shift = scale = None
+    block_rows = max(1, CORRELATION_BLOCK_ELEMENTS // max(k, 1))
+    for start in range(0, n_rows, block_rows):
+        block = np.column_stack([values[start:start + block_rows] for values in columns])
+        valid = ~np.isnan(block)
+        if shift is None:
+            # Centrage-réduction approximatif (premier bloc) pour la précision numérique
+            counts = np.maximum(valid.sum(axis=0), 1)
+            shift = np.where(valid, block, 0).sum(axis=0) / counts
+            scale = np.sqrt(np.where(valid, (block - shift) ** 2, 0).sum(axis=0) / counts)
+            scale[~(scale > 0)] = 1.0
+        mask = valid.astype('float64')
+        z = np.where(valid, (block - shift) / scale, 0.0)
+        # [i, j] : sommes sur les lignes où i et j sont renseignées
+        n_pairs += mask.T @ mask
+        sums += z.T @ mask
+        squares += (z * z).T @ mask
+        products += z.T @ z
+    with np.errstate(divide='ignore', invalid='ignore'):
+        covariance = products - sums * sums.T / n_pairs
+        variance = squares - sums ** 2 / n_pairs
+        corr = covariance / np.sqrt(variance * variance.T)
+    return np.clip(corr, -1, 1), n_pairs
+
+def restricted_ranks(order, first, last, keep):
+    """Average ranks of sorted series counted only on the rows flagged in keep.
+
+    All arguments have one series per row: order is its argsort, first and last give at each
+    sorted position the bounds of its tie group, keep flags the kept rows in sorted order.
+    Returns the ranks in the original order, 0 on the rows that are not kept.
+    """
+    prefix = np.zeros((keep.shape[0], keep.shape[1] + 1))
+    np.cumsum(keep, axis=1, out=prefix[:, 1:])
+    before = np.take_along_axis(prefix, first, axis=1)
+    tied = np.take_along_axis(prefix, last + 1, axis=1) - before
+    ranks = np.where(keep, before + (tied + 1) / 2, 0.0)
+    result = np.empty_like(ranks)
+    np.put_along_axis(result, order, ranks, axis=1)
+    return result
+
+def complete_rows_spearman(values, budget=SPEARMAN_EXACT_CELLS):
+    """Spearman coefficients, on their complete rows, of the column pairs of a float matrix
+    whose complete rows differ from the observed rows of one of the columns.
+
+    Columns sharing a missing-value pattern are re-ranked together, once per pair of patterns,
+    the pairs losing the largest share of rows first, until budget ranks have been recounted.
+    Returns {(i, j): coefficient} and the number of such pairs left out.
+    """
+    # Une série par ligne : tris, cumuls et indexations restent contigus en mémoire
+    series = np.ascontiguousarray(values.T)
+    observed = ~np.isnan(series)
+    patterns = OrderedDict()
+    for col, key in enumerate(np.packbits(observed, axis=1)):
+        patterns.setdefault(key.tobytes(), []).append(col)
+    groups = [(np.array(cols), observed[cols[0]]) for cols in patterns.values()]
+    tasks = []
+    for g, h in zip(*np.triu_indices(len(groups), 1)):
+        both = groups[g][1] & groups[h][1]
+        lost = 1 - both.sum() / max(groups[g][1].sum(), groups[h][1].sum(), 1)
+        tasks.append((-lost, g, h, both))
+    tasks.sort(key=lambda task: task[0])
+    result = {}
+    if not tasks:
+        return result, 0
+    n_rows = series.shape[1]
+    positions = np.arange(n_rows)
+    order = np.argsort(series, axis=1, kind='stable')
+    ordered = np.take_along_axis(series, order, axis=1)
+    observed_sorted = ~np.isnan(ordered)
+    # Bornes du groupe d'ex aequo de chaque position triée (les NaN, en fin, restent isolés)
+    starts = np.ones(series.shape, dtype=bool)
+    starts[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    ends = np.ones(series.shape, dtype=bool)
+    ends[:, :-1] = starts[:, 1:]
+    first = np.maximum.accumulate(np.where(starts, positions, 0), axis=1)
+    last = np.minimum.accumulate(np.where(ends, positions, n_rows - 1)[:, ::-1], axis=1)[:, ::-1]
+    skipped = 0
+    for _, g, h, both in tasks:
+        left, right = groups[g][0], groups[h][0]
+        cols = np.concatenate([left, right])
+        if budget < n_rows * len(cols):
+            skipped += len(left) * len(right)
+            continue
+        budget -= n_rows * len(cols)
+        # Rangs de toutes les colonnes des deux motifs sur leurs seules lignes communes
+        ranks = restricted_ranks(order[cols], first[cols], last[cols], both[order[cols]] & observed_sorted[cols])
+        count = both.sum()
+        center = count * ((count + 1) / 2) ** 2
+        spread = (ranks * ranks).sum(axis=1) - center
+        with np.errstate(divide='ignore', invalid='ignore'):
+            coefficients = (ranks[:len(left)] @ ranks[len(left):].T - center) / np.sqrt(
+                np.outer(spread[:len(left)], spread[len(left):])
+            )
+        if count < 2:
+            coefficients[:] = np.nan
+        for a, i in enumerate(left):
+            for b, j in enumerate(right):
+                result[min(i, j), max(i, j)] = coefficients[a, b]
+    return result, skipped
+
+def get_correlation_matrix(stored_data, df, method='pearson', with_counts=False):
+    """Return the cached correlation matrix (DataFrame) of all numeric columns for a method.
+
+    With with_counts=True, also return the matrix of complete-row counts of each pair.
+    """
+    key = (stored_data['dataset_id'], method)
+    with CORRELATION_CACHE_LOCK:
+        cached = CORRELATION_CACHE.get(key)
+        if cached is not None:
+            CORRELATION_CACHE.move_to_end(key)
+            return cached if with_counts else cached[0]
+
+    numeric_cols = columns_of_kind(get_dataset_stats(stored_data, df), 'numeric', 'boolean')
+    if method == 'spearman':
+        # Rangs lus depuis l'index trié de chaque colonne
+        columns = [column_ranks(stored_data, df, col) for col in numeric_cols]
+    else:
+        columns = [df[col].to_numpy(dtype='float64', na_value=np.nan) for col in numeric_cols]
+    corr, n_pairs = pairwise_correlation(columns)
+    if method == 'spearman':
+        # Paire dont une colonne perd des lignes : les rangs de la colonne entière ne conviennent plus
+        counts = np.diag(n_pairs)
+        approximate = 0
+        if (n_pairs < np.maximum.outer(counts, counts)).any():
+            values = np.column_stack([
+                df[col].to_numpy(dtype='float64', na_value=np.nan) for col in numeric_cols
+            ])
+            exact, approximate = complete_rows_spearman(values)
+            for (i, j), coefficient in exact.items():
+                corr[i, j] = corr[j, i] = coefficient
+    cached = (
+        pd.DataFrame(corr, index=numeric_cols, columns=numeric_cols),
+        pd.DataFrame(n_pairs, index=numeric_cols, columns=numeric_cols)
+    )
+    if method == 'spearman':
+        cached[0].attrs['approximate_pairs'] = approximate
+    with CORRELATION_CACHE_LOCK:
+        CORRELATION_CACHE[key] = cached
+        while len(CORRELATION_CACHE) > MAX_DATASETS_IN_MEMORY:
+            CORRELATION_CACHE.popitem(last=False)
+    return cached if with_counts else cached[0]
+
+def correlation_p_values(r, n):
+    """Two-sided p-values of correlation coefficients from the t distribution (as pearsonr/spearmanr)"""
+    r = np.asarray(r, dtype='float64')
+    dof = np.asarray(n, dtype='float64') - 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_stat = r * np.sqrt(dof / np.maximum(1 - r ** 2, 0))
+        p = 2 * stats.t.sf(np.abs(t_stat), dof)
+    return np.where(dof > 0, p, np.nan)
+
+def adjust_p_values(p, method='bh'):
+    """Bonferroni or Benjamini-Hochberg adjusted p-values (NaN entries are ignored)"""
+    p = np.asarray(p, dtype='float64')
+    adjusted = np.full(len(p), np.nan)
+    tested = np.flatnonzero(~np.isnan(p))
+    m = len(tested)
+    if m == 0:
+        return adjusted
+    if method == 'bonferroni':
+        adjusted[tested] = np.minimum(p[tested] * m, 1)
+    else:
+        order = tested[np.argsort(p[tested])]
+        scaled = p[order] * m / np.arange(1, m + 1)
+        # Minimum cumulé depuis la plus grande valeur p
+        adjusted[order] = np.minimum(np.minimum.accumulate(scaled[::-1])[::-1], 1)
+    return adjusted
+
+def all_pairs_correlation_tests(stored_data, df, method='pearson', correction='bh', alpha=0.05):
+    """Coefficient, p-value and corrected p-value of every pair of numeric columns, in one vectorized pass"""
+    corr_matrix, n_pairs = get_correlation_matrix(stored_data, df, method, with_counts=True)
+    rows, cols = np.triu_indices(len(corr_matrix), 1)
+    r = corr_matrix.values[rows, cols]
+    n = n_pairs.values[rows, cols]
+    p = correlation_p_values(r, n)
+    adjusted = adjust_p_values(p, correction)
+    results = pd.DataFrame({
+        'Variable 1': corr_matrix.index[rows],
+        'Variable 2': corr_matrix.columns[cols],
+        'n': n.astype(int),
+        'Coefficient': r.round(4),
+        'Valeur p': p,
+        'Valeur p corrigée': adjusted,
+        'Significatif': np.where(adjusted < alpha, 'Oui', 'Non')
+    })
+    return results.sort_values('Valeur p corrigée', na_position='last').reset_index(drop=True)
+
+HEATMAP_MAX_TILES = 60
+TOP_CORRELATION_PAIRS = 20
+
+def cluster_order(corr_matrix):
+    """Leaf order of an average-linkage clustering on the 1 - |r| distance"""
+    if len(corr_matrix) < 3:
+        return np.arange(len(corr_matrix))
+    distance = 1 - np.abs(np.nan_to_num(corr_matrix.values))
+    distance = np.clip((distance + distance.T) / 2, 0, None)
+    np.fill_diagonal(distance, 0)
+    return leaves_list(linkage(squareform(distance, checks=False), method='average'))
+
+def tile_matrix(values, labels, max_tiles=HEATMAP_MAX_TILES):
+    """Aggregate a correlation matrix over contiguous tiles so that each axis has at most max_tiles cells.
+
+    Each tile keeps its strongest coefficient (largest |r|, with its sign), so that opposite
+    correlations do not cancel out; diagonal tiles ignore the correlation of a variable with itself.
+    """
+    if len(labels) <= max_tiles:
+        return values, list(labels)
+    bounds = np.linspace(0, len(labels), max_tiles + 1).astype(int)
+    values = values.astype('float64')
+    np.fill_diagonal(values, np.nan)
+    # fmax/fmin ignorent les NaN (tuile entièrement NaN -> NaN)
+    highest = np.fmax.reduceat(np.fmax.reduceat(values, bounds[:-1], axis=0), bounds[:-1], axis=1)
+    lowest = np.fmin.reduceat(np.fmin.reduceat(values, bounds[:-1], axis=0), bounds[:-1], axis=1)
+    tiles = np.where(np.abs(lowest) > np.abs(highest), lowest, highest)
+    # Variable seule dans sa tuile : sa corrélation avec elle-même
+    single = np.flatnonzero(np.diff(bounds) == 1)
+    tiles[single, single] = 1.0
+    tile_labels = [labels[start] if end - start == 1 else f"{labels[start]} … {labels[end - 1]} ({end - start})"
+                   for start, end in zip(bounds[:-1], bounds[1:])]
+    return tiles, tile_labels
+
+def top_correlation_pairs(corr_matrix, k=TOP_CORRELATION_PAIRS):
+    """The k strongest pairs (in absolute value) of the upper triangle, selected with argpartition"""
+    rows, cols = np.triu_indices(len(corr_matrix), 1)
+    values = corr_matrix.values[rows, cols]
+    strength = np.nan_to_num(np.abs(values), nan=-1.0)
+    top = np.argpartition(-strength, k - 1)[:k] if len(values) > k else np.arange(len(values))
+    top = top[np.argsort(-strength[top])]
+    return pd.DataFrame({
+        'Variable 1': corr_matrix.index[rows[top]],
+        'Variable 2': corr_matrix.columns[cols[top]],
+        'Corrélation': values[top].round(4)
+    })
+
+#---------------------------------------
+# Dépistage de normalité de toutes les colonnes
+#---------------------------------------
+# Asymétrie, aplatissement, D'Agostino-Pearson et Jarque-Bera sont calculés pour toutes les
+# colonnes numériques à partir des moments accumulés sur des blocs 2-D (un seul passage).
+# Kolmogorov-Smirnov réutilise l'index trié de chaque colonne ; Shapiro-Wilk, dont la valeur p
+# n'est fiable que jusqu'à 5000 observations (limite documentée par scipy), est calculé sur un
+# sous-échantillon aléatoire de SHAPIRO_MAX_SAMPLE valeurs tiré avec une graine fixe.
+# Les calculs par colonne sont répartis sur un pool de threads (NumPy libère le GIL).
+SHAPIRO_MAX_SAMPLE = 5000
+SHAPIRO_SEED = 0
+STATS_WORKERS = min(8, os.cpu_count() or 1)
+
+def shapiro_sample(values):
+    """Reproducible random subsample of at most SHAPIRO_MAX_SAMPLE values for Shapiro-Wilk"""
+    if len(values) <= SHAPIRO_MAX_SAMPLE:
+        return values
+    return np.random.default_rng(SHAPIRO_SEED).choice(values, SHAPIRO_MAX_SAMPLE, replace=False)
+
+def column_moments(columns):
+    """Count, mean and biased central moments m2, m3, m4 of float arrays (NaN = missing), by 2-D row blocks"""
+    k = len(columns)
+    n_rows = len(columns[0]) if k else 0
+    sums = np.zeros((5, k))
+    shift = None
+    block_rows = max(1, CORRELATION_BLOCK_ELEMENTS // max(k, 1))
+    for start in range(0, n_rows, block_rows):
+        block = np.column_stack([values[start:start + block_rows] for values in columns])
+        valid = ~np.isnan(block)
+        if shift is None:
+            # Décalage par la moyenne approximative du premier bloc pour limiter les erreurs d'arrondi
+            shift = np.where(valid, block, 0).sum(axis=0) / np.maximum(valid.sum(axis=0), 1)
+        centered = np.where(valid, block - shift, 0.0)
+        sums[0] += valid.sum(axis=0)
+        power = valid.astype('float64')
+        for order in range(1, 5):
+            power = power * centered
+            sums[order] += power.sum(axis=0)
+    n = sums[0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        d1, d2, d3, d4 = sums[1] / n, sums[2] / n, sums[3] / n, sums[4] / n
+        m2 = d2 - d1 ** 2
+        m3 = d3 - 3 * d1 * d2 + 2 * d1 ** 3
+        m4 = d4 - 4 * d1 * d3 + 6 * d1 ** 2 * d2 - 3 * d1 ** 4
+    return n, (shift if shift is not None else np.zeros(k)) + d1, m2, m3, m4
+
+def dagostino_pearson(n, skewness, kurtosis):
+    """Vectorized D'Agostino-Pearson K² test (same formulas as scipy.stats.normaltest)"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        y = skewness * np.sqrt(((n + 1) * (n + 3)) / (6.0 * (n - 2)))
+        beta2 = 3.0 * (n ** 2 + 27 * n - 70) * (n + 1) * (n + 3) / ((n - 2.0) * (n + 5) * (n + 7) * (n + 9))
+        w2 = -1 + np.sqrt(2 * (beta2 - 1))
+        delta = 1 / np.sqrt(0.5 * np.log(w2))
+        alpha = np.sqrt(2.0 / (w2 - 1))
+        y = np.where(y == 0, 1, y)
+        z_skew = delta * np.log(y / alpha + np.sqrt((y / alpha) ** 2 + 1))
+
+        b2 = kurtosis + 3
+        expected = 3.0 * (n - 1) / (n + 1)
+        variance = 24.0 * n * (n - 2) * (n - 3) / ((n + 1) * (n + 1.0) * (n + 3) * (n + 5))
+        x = (b2 - expected) / np.sqrt(variance)
+        sqrt_beta1 = 6.0 * (n * n - 5 * n + 2) / ((n + 7) * (n + 9)) * np.sqrt((6.0 * (n + 3) * (n + 5)) / (n * (n - 2) * (n - 3)))
+        a = 6.0 + 8.0 / sqrt_beta1 * (2.0 / sqrt_beta1 + np.sqrt(1 + 4.0 / sqrt_beta1 ** 2))
+        term1 = 1 - 2 / (9.0 * a)
+        denom = 1 + x * np.sqrt(2 / (a - 4.0))
+        term2 = np.sign(denom) * np.where(denom == 0.0, np.nan, ((1 - 2.0 / a) / np.abs(denom)) ** (1 / 3.0))
+        z_kurt = (term1 - term2) / np.sqrt(2 / (9.0 * a))
+
+        k2 = z_skew ** 2 + z_kurt ** 2
+    # Le test d'asymétrie demande au moins 8 observations
+    k2 = np.where(n >= 8, k2, np.nan)
+    return k2, stats.chi2.sf(k2, 2)
+
+def ks_and_shapiro(sorted_values):
+    """KS statistic and p-value against the fitted normal, and Shapiro-Wilk on a subsample, for one sorted column"""
+    n = len(sorted_values)
+    if n < 3:
+        return np.nan, np.nan, np.nan, np.nan, n
+    cdf = stats.norm.cdf((sorted_values - sorted_values.mean()) / sorted_values.std(ddof=1))
+    d_stat = max((np.arange(1, n + 1) / n - cdf).max(), (cdf - np.arange(n) / n).max())
+    ks_p = stats.kstwo.sf(d_stat, n)
+    sample = shapiro_sample(sorted_values)
+    w_stat, shapiro_p = shapiro(sample)
+    return d_stat, ks_p, w_stat, shapiro_p, len(sample)
+
+def normality_screen(stored_data, df, alpha=0.05, progress=None):
+    """Normality statistics and tests of every numeric column as a DataFrame"""
+    numeric_cols = columns_of_kind(get_dataset_stats(stored_data, df), 'numeric')
+    if not numeric_cols:
+        return pd.DataFrame()
+    n, _, m2, m3, m4 = column_moments([df[col].to_numpy(dtype='float64', na_value=np.nan) for col in numeric_cols])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        skewness = m3 / m2 ** 1.5
+        kurtosis = m4 / m2 ** 2 - 3
+        jarque_bera = n / 6 * (skewness ** 2 + kurtosis ** 2 / 4)
+    k2, k2_p = dagostino_pearson(n, skewness, kurtosis)
+
+    per_column = []
+    with ThreadPoolExecutor(max_workers=STATS_WORKERS) as executor:
+        for result in executor.map(lambda col: ks_and_shapiro(get_sorted_column(stored_data, df, col)), numeric_cols):
+            per_column.append(result)
+            if progress is not None:
+                progress(len(per_column) / len(numeric_cols))
+    d_stat, ks_p, w_stat, shapiro_p, shapiro_n = (np.array(values) for values in zip(*per_column))
+
+    return pd.DataFrame({
+        'Variable': numeric_cols,
+        'n': n.astype(int),
+        'Asymétrie': skewness.round(4),
+        'Aplatissement': kurtosis.round(4),
+        "K² D'Agostino": k2.round(4),
+        "p D'Agostino": k2_p,
+        'Jarque-Bera': jarque_bera.round(4),
+        'p Jarque-Bera': stats.chi2.sf(jarque_bera, 2),
+        'D KS': d_stat.round(4),
+        'p KS': ks_p,
+        'W Shapiro': w_stat.round(4),
+        'n Shapiro': shapiro_n.astype(int),
+        'p Shapiro': shapiro_p,
+        'Conclusion': np.where(k2_p > alpha, 'Normale', np.where(np.isnan(k2_p), 'Effectif insuffisant', 'Non normale'))
+    })
+
+#---------------------------------------
+# Matrice du Chi-carré entre variables qualitatives
+#---------------------------------------
+# Chaque colonne qualitative est codée une seule fois en entiers ; la table de contingence d'une
+# paire est obtenue par np.bincount sur les codes combinés (code1 * n_modalités2 + code2), ou sous
+# forme creuse (cellules non vides seulement, via np.unique) quand le produit des cardinalités est
+# trop grand. Le Chi-carré se calcule sur les seules cellules non vides :
+# chi² = n * (somme des O² / (total_ligne * total_colonne) - 1).
+DENSE_CONTINGENCY_CELLS = 1 << 20
+
+def category_codes(series):
+    """Integer codes of a qualitative column (-1 for missing values) and its number of categories"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(dtype='int64'), len(series.cat.categories)
+    codes, uniques = pd.factorize(series)
+    return codes.astype('int64'), len(uniques)
+
+def contingency_cells(codes1, n1, codes2, n2):
+    """Non-empty cells of the contingency table of two coded columns as (rows, cols, counts)"""
+    valid = (codes1 >= 0) & (codes2 >= 0)
+    combined = codes1[valid] * n2 + codes2[valid]
+    if n1 * n2 <= DENSE_CONTINGENCY_CELLS:
+        counts = np.bincount(combined, minlength=n1 * n2)
+        cells = np.flatnonzero(counts)
+        counts = counts[cells]
+    else:
+        cells, counts = np.unique(combined, return_counts=True)
+    return cells // n2, cells % n2, counts
+
+def chi2_from_cells(rows, cols, counts):
+    """Pearson chi² (without Yates correction), p-value, degrees of freedom, Cramér's V and n from non-empty cells"""
+    n = counts.sum()
+    # Les modalités absentes de la paire (totaux nuls) sont ignorées, comme dans pd.crosstab
+    _, rows = np.unique(rows, return_inverse=True)
+    _, cols = np.unique(cols, return_inverse=True)
+    row_totals = np.bincount(rows, weights=counts)
+    col_totals = np.bincount(cols, weights=counts)
+    n_rows, n_cols = len(row_totals), len(col_totals)
+    if n == 0 or min(n_rows, n_cols) < 2:
+        return np.nan, np.nan, 0, np.nan, int(n)
+    chi2 = max(n * ((counts.astype('float64') ** 2 / (row_totals[rows] * col_totals[cols])).sum() - 1), 0.0)
+    dof = (n_rows - 1) * (n_cols - 1)
+    cramer_v = np.sqrt(chi2 / (n * (min(n_rows, n_cols) - 1)))
+    return chi2, stats.chi2.sf(chi2, dof), dof, cramer_v, int(n)
+
+def chi2_matrix(stored_data, df, progress=None):
+    """Chi², p-value, degrees of freedom, Cramér's V and n of every pair of qualitative columns as square arrays"""
+    columns = columns_of_kind(get_dataset_stats(stored_data, df), 'qualitative', 'boolean')
+    coded = [category_codes(df[col]) for col in columns]
+    k = len(columns)
+    results = {name: np.full((k, k), np.nan) for name in ('chi2', 'p', 'dof', 'cramer_v', 'n')}
+    n_pairs = max(k * (k - 1) // 2, 1)
+    for i in range(k):
+        for j in range(i + 1, k):
+            values = chi2_from_cells(*contingency_cells(*coded[i], *coded[j]))
+            for name, value in zip(('chi2', 'p', 'dof', 'cramer_v', 'n'), values):
+                results[name][i, j] = results[name][j, i] = value
+        if progress is not None:
+            progress((i + 1) * (2 * k - i - 2) / 2 / n_pairs)
+    np.fill_diagonal(results['cramer_v'], 1.0)
+    return columns, results
+
+#---------------------------------------
+# Comparaison de k groupes
+#---------------------------------------
+# Les valeurs sont triées une fois par groupe (tranches contiguës) : effectifs, moyennes et
+# variances en découlent, et tous les tests paramétriques (t de Student et de Welch, ANOVA,
+# post-hoc de Tukey-Kramer et t de Welch par paires) se calculent à partir de ces statistiques
+# suffisantes. Kruskal-Wallis n'a besoin que de la somme des rangs de chaque groupe.
+# Les mêmes tranches triées fournissent les quartiles du boxplot.
+POSTHOC_MAX_GROUPS = 20
+
+def group_sufficient_stats(sorted_values, bounds):
+    """Size, mean and unbiased variance of each contiguous group slice"""
+    n = np.diff(bounds)
+    means = np.add.reduceat(sorted_values, bounds[:-1]) / n
+    squares = np.add.reduceat((sorted_values - np.repeat(means, n)) ** 2, bounds[:-1])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        variances = np.where(n > 1, squares / (n - 1), np.nan)
+    return n, means, variances
+
+def welch_t(n1, m1, v1, n2, m2, v2):
+    """Welch t statistic, Welch-Satterthwaite degrees of freedom and two-sided p-value"""
+    se1, se2 = v1 / n1, v2 / n2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = (m1 - m2) / np.sqrt(se1 + se2)
+        dof = (se1 + se2) ** 2 / (se1 ** 2 / (n1 - 1) + se2 ** 2 / (n2 - 1))
+    return t, dof, 2 * stats.t.sf(np.abs(t), dof)
+
+def kruskal_from_groups(codes, values, n):
+    """Kruskal-Wallis H (with tie correction) and p-value from group codes and pooled values"""
+    ranks = stats.rankdata(values)
+    rank_sums = np.bincount(codes, weights=ranks, minlength=len(n))
+    total = len(values)
+    h = 12.0 / (total * (total + 1)) * (rank_sums ** 2 / n).sum() - 3 * (total + 1)
+    _, ties = np.unique(values, return_counts=True)
+    correction = 1 - (ties ** 3 - ties).sum() / (total ** 3 - total)
+    h = h / correction if correction > 0 else np.nan
+    return h, stats.chi2.sf(h, len(n) - 1)
+
+def group_comparison(df, num_var, cat_var):
+    """Descriptive statistics, global tests and pairwise post-hoc tests of a numeric variable across the groups of a categorical one"""
+    subset = df[[num_var, cat_var]].dropna()
+    values = subset[num_var].to_numpy(dtype='float64')
+    codes, labels, sorted_values, bounds = group_sorted_values(subset[cat_var].to_numpy(), values)
+    n, means, variances = group_sufficient_stats(sorted_values, bounds)
+    k, total = len(labels), len(values)
+    if k < 2:
+        raise ValueError("La variable catégorique doit avoir au moins 2 groupes")
+
+    # ANOVA à un facteur
+    grand_mean = (n * means).sum() / total
+    between = (n * (means - grand_mean) ** 2).sum()
+    within = np.nansum((n - 1) * variances)
+    mse = within / (total - k)
+    f_stat = (between / (k - 1)) / mse
+    tests = {
+        'ANOVA à un facteur': (f_stat, stats.f.sf(f_stat, k - 1, total - k), f"({k - 1}, {total - k})"),
+        'Kruskal-Wallis': (*kruskal_from_groups(codes, values, n), f"{k - 1}")
+    }
+    if k == 2:
+        t_stat = (means[0] - means[1]) / np.sqrt(mse * (1 / n[0] + 1 / n[1]))
+        tests['t de Student'] = (t_stat, 2 * stats.t.sf(abs(t_stat), total - 2), f"{total - 2}")
+        t_stat, dof, p = welch_t(n[0], means[0], variances[0], n[1], means[1], variances[1])
+        tests['t de Welch'] = (t_stat, p, f"{dof:.1f}")
+
+    posthoc = pd.DataFrame()
+    if 2 < k <= POSTHOC_MAX_GROUPS:
+        i, j = np.triu_indices(k, 1)
+        t_stat, dof, p = welch_t(n[i], means[i], variances[i], n[j], means[j], variances[j])
+        # Tukey-Kramer : étendue studentisée avec la variance intra-groupes commune
+        q = np.abs(means[i] - means[j]) / np.sqrt(mse / 2 * (1 / n[i] + 1 / n[j]))
+        posthoc = pd.DataFrame({
+            'Groupe 1': labels[i].astype(str),
+            'Groupe 2': labels[j].astype(str),
+            'Différence': (means[i] - means[j]).round(4),
+            't de Welch': t_stat.round(3),
+            'p Welch (Bonferroni)': adjust_p_values(p, 'bonferroni'),
+            'p Tukey-Kramer': stats.studentized_range.sf(q, k, total - k)
+        })
+
+    summary = pd.DataFrame({
+        'Groupe': labels.astype(str),
+        'n': n,
+        'Moyenne': means.round(4),
+        'Écart-type': np.sqrt(variances).round(4)
+    })
+    return {
+        'summary': summary,
+        'tests': tests,
+        'posthoc': posthoc,
+        'figure': grouped_box_figure(labels, sorted_values, bounds)
+    }
+
+#---------------------------------------
+# Tâches en arrière-plan
+#---------------------------------------
+# Les traitements longs (nettoyage, export, tests en lot, rééchantillonnage) sont des callbacks
+# Dash « background » : chacun s'exécute dans un processus séparé (DiskcacheManager), et son
+# avancement comme son résultat passent par le cache disque JOB_DIR, partagé par tous les workers
+# (gunicorn). Le navigateur interroge l'avancement ; l'annulation termine le processus de la tâche,
+# et le cache disque oublie les résultats jamais relus au-delà de sa taille maximale.
+# Le processus d'une tâche est une copie (fork) du serveur : il hérite des jeux de données en
+# mémoire. Les verrous qu'un autre thread du serveur pouvait tenir au moment de la copie y sont
+# remplacés, et les versions du pipeline qu'il calcule sont écrites dans le cache des jeux de données
+# pour que le serveur les relise au lieu de les recalculer.
+JOB_PROGRESS_INTERVAL = 0.25  # secondes entre deux envois de l'avancement
+JOB_PROCESS = False
+
+def renew_locks_after_fork():
+    """In a forked job process, replace the module locks another server thread may have held at fork time"""
+    global JOB_PROCESS, RESAMPLING_POOL
+    JOB_PROCESS = True
+    RESAMPLING_POOL = None
+    for name in [name for name in globals() if name.endswith('_LOCK')]:
+        globals()[name] = threading.Lock()
+    for plan in PLAN_REGISTRY.values():
+        plan['search_lock'] = threading.Lock()
+    PIPELINE_RUNS.clear()
+
+os.register_at_fork(after_in_child=renew_locks_after_fork)
+
+def job_panel(prefix, label):
+    """Progress bar and cancel button of a background callback, shown only while it runs"""
+    return html.Div([
+        html.Small(label, className="text-muted"),
+        dbc.Progress(id=f"{prefix}-job-progress", value=0, striped=True, animated=True, className="mt-2"),
+        dbc.Button("Annuler", id=f"{prefix}-job-cancel", color="secondary",
+                   outline=True, size="sm", className="mt-2")
+    ], id=f"{prefix}-job-panel", style={'display': 'none'}, className="mt-3")
+
+def job_callback(prefix, trigger):
+    """Keyword arguments of a background callback started by the trigger button and shown in the job panel prefix"""
+    return {
+        'background': True,
+        'progress': [Output(f"{prefix}-job-progress", 'value'), Output(f"{prefix}-job-progress", 'label')],
+        'progress_default': [0, ""],
+        'cancel': [Input(f"{prefix}-job-cancel", 'n_clicks')],
+        'running': [
+            (Output(f"{prefix}-job-panel", 'style'), {'display': 'block'}, {'display': 'none'}),
+            (Output(trigger, 'disabled'), True, False)
+        ],
+        'prevent_initial_call': True
+    }
+
+def run_job(set_progress, func, *args):
+    """Run func(job, *args) inside a background callback; returns (result, None), or (None, alert) if it failed"""
+    job = {'set_progress': set_progress, 'message': '', 'sent_at': 0.0}
+    try:
+        return func(job, *args), None
+    except Exception as e:
+        app.logger.exception("Échec de la tâche %s", func.__name__)
+        return None, dbc.Alert(f"Erreur : {str(e)}", color="danger")
+
+def report_progress(job, fraction, message=None):
+    """Send the progress of a running job to the browser, at most every JOB_PROGRESS_INTERVAL seconds"""
+    if job is None:
+        return
+    changed = message is not None and message != job['message']
+    if message is not None:
+        job['message'] = message
+    now = time.monotonic()
+    if changed or now - job['sent_at'] >= JOB_PROGRESS_INTERVAL:
+        job['sent_at'] = now
+        percent = int(100 * min(max(fraction, 0.0), 1.0))
+        job['set_progress']((percent, job['message'] or f"{percent}%"))
+
+def compute_job_dataset(stored_data, progress=None):
+    """Compute a recorded version inside a job; a job process writes it to the disk cache for the server"""
+    df = get_dataset(stored_data, progress)
+    if JOB_PROCESS and df is not None:
+        persist_dataset(stored_data['dataset_id'], df)
+    return df
+
+#---------------------------------------
+# Tests par rééchantillonnage (permutation et bootstrap)
+#---------------------------------------
+# Les rééchantillonnages sont calculés par lots vectorisés (une matrice lots × observations) et
+# répartis sur un pool de processus. Chaque lot reçoit sa propre graine dérivée de la graine de
+# l'utilisateur (SeedSequence.spawn) : le résultat ne dépend pas du nombre de processus.
+# Le pool est créé une fois par processus. Dans le serveur multithread, il utilise la méthode
+# forkserver : ses processus ne sont pas des copies (fork) du serveur, dont un verrou pourrait être
+# tenu par un autre thread au moment de la copie. Dans le processus d'une tâche (un seul thread),
+# où forkserver n'est pas utilisable, ils en sont des copies. Les lots sont calculés par les fonctions
+# du module resampling, passées par référence : les processus démarrés par forkserver n'importent
+# pas l'application. Les données d'un calcul passent par un fichier temporaire que chaque processus
+# ne lit qu'une fois.
+RESAMPLING_BATCH_ELEMENTS = 1 << 22
+RESAMPLING_WORKERS = int(os.environ.get('EXPLORA_RESAMPLING_WORKERS', os.cpu_count() or 1))
+RESAMPLING_CONFIDENCE = 0.95
+RESAMPLING_POOL = None
+RESAMPLING_POOL_LOCK = threading.Lock()
+
+def resampling_pool():
+    """Process pool shared by the resampling runs of this process, started on first use"""
+    global RESAMPLING_POOL
+    with RESAMPLING_POOL_LOCK:
+        if RESAMPLING_POOL is None:
+            context = multiprocessing.get_context('fork' if JOB_PROCESS else 'forkserver')
+            if not JOB_PROCESS:
+                # Le serveur forkserver ne précharge que numpy et les fonctions des lots
+                context.set_forkserver_preload(['resampling'])
+            RESAMPLING_POOL = ProcessPoolExecutor(max_workers=RESAMPLING_WORKERS, mp_context=context)
+        return RESAMPLING_POOL
+
+def discard_resampling_pool(pool):
+    """Forget a broken pool so that the next run starts a new one"""
+    global RESAMPLING_POOL
+    with RESAMPLING_POOL_LOCK:
+        if RESAMPLING_POOL is pool:
+            RESAMPLING_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def submit_resampling_batches(pool, path, seeds, sizes):
+    """Submit the batches of a run to the pool; returns {future: batch index}"""
+    main_module = sys.modules['__main__']
+    with RESAMPLING_POOL_LOCK:
+        # Les processus du pool démarrent pendant les soumissions. Sans chemin du module principal,
+        # multiprocessing ne le leur fait pas réexécuter : ils n'importent que le module resampling
+        main_path = main_module.__dict__.pop('__file__', None)
+        try:
+            return {pool.submit(resampling_batch, path, batch_seed, size): i
+                    for i, (batch_seed, size) in enumerate(zip(seeds, sizes))}
+        finally:
+            if main_path is not None:
+                main_module.__file__ = main_path
+
+def run_resampling(kind, x, y, n_resamples, seed, progress=None):
+    """Permutation p-value and percentile bootstrap interval of a statistic, batches fanned out over a process pool"""
+    batch_size = max(1, min(n_resamples, RESAMPLING_BATCH_ELEMENTS // len(x)))
+    sizes = [min(batch_size, n_resamples - start) for start in range(0, n_resamples, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    permuted, boot = [None] * len(sizes), [None] * len(sizes)
+    fd, path = tempfile.mkstemp(prefix='explora-resampling-', suffix='.npz')
+    futures = {}
+    pool = resampling_pool()
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, kind=kind, x=x, y=y)
+        futures = submit_resampling_batches(pool, path, seeds, sizes)
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            permuted[i], boot[i] = future.result()
+            if progress is not None:
+                progress(done / len(sizes))
+    except BrokenProcessPool:
+        discard_resampling_pool(pool)
+        raise
+    finally:
+        # En cas d'annulation, les lots pas encore commencés sont abandonnés
+        for future in futures:
+            future.cancel()
+        os.remove(path)
+    permuted, boot = np.concatenate(permuted), np.concatenate(boot)
+    observed = resampling_statistic(kind, x, y)
+    # Valeur p bilatérale avec la correction +1 (la statistique observée compte comme une permutation)
+    extreme = np.abs(permuted) >= np.abs(observed) * (1 - 1e-12)
+    alpha = 1 - RESAMPLING_CONFIDENCE
+    ci_low, ci_high = np.nanquantile(boot, [alpha / 2, 1 - alpha / 2])
+    return {
+        'observed': observed,
+        'p_value': (extreme.sum() + 1) / (n_resamples + 1),
+        'ci': (ci_low, ci_high),
+        'n_resamples': n_resamples,
+        'seed': seed
+    }
+
+#---------------------------------------
+# Imputation KNN
+#---------------------------------------
+# Les voisins sont cherchés parmi les lignes complètes, avec la distance euclidienne sur les
+# colonnes renseignées de chaque ligne incomplète. Les lignes incomplètes sont regroupées par
+# motif de valeurs manquantes :
+# - les motifs peu fréquents sont traités ensemble par recherche exhaustive, les distances
+#   restreintes aux colonnes renseignées s'écrivant comme des produits matriciels masqués ;
+# - chaque motif fréquent interroge un index sur les lignes complètes, par blocs de lignes : arbre
+#   k-d exact (requêtes parallèles) en petite dimension, NN-descent approché au-delà.
+# Les index construits sont gardés avec le plan d'imputation qui les utilise, au plus
+# KNN_MAX_KEPT_INDEXES par plan (les moins récemment utilisés sont oubliés).
+# Sans aucune ligne complète, les donneurs sont les lignes partiellement renseignées et la recherche,
+# exhaustive, suit KNNImputer : pour chaque colonne manquante, les voisins où elle est renseignée,
+# à la distance euclidienne sur les colonnes renseignées des deux lignes.
+KNN_BRUTE_FORCE_PAIRS = 1 << 26
+KNN_BRUTE_BLOCK_ELEMENTS = 1 << 22
+KNN_TREE_MAX_DIM = 16
+KNN_ANN_MIN_ROWS = 10_000
+KNN_QUERY_CHUNK_ROWS = 1 << 16
+KNN_MAX_KEPT_INDEXES = 32
+
+def masked_brute_force_neighbours(points, queries, observed, k, progress=None):
+    """Positions of the k nearest points of each query (unordered), distances restricted to its observed columns"""
+    squares = points ** 2
+    block_rows = max(1, KNN_BRUTE_BLOCK_ELEMENTS // len(points))
+    neighbours = np.empty((len(queries), k), dtype='int64')
+    for start in range(0, len(queries), block_rows):
+        mask = observed[start:start + block_rows].astype('float64')
+        block = np.where(mask > 0, queries[start:start + block_rows], 0.0)
+        # Somme sur les colonnes renseignées de (p - q)², à la constante |q|² près qui ne change pas le classement ;
+        # une ligne par requête pour que la sélection des k plus proches parcoure une mémoire contiguë
+        distances = mask @ squares.T - 2 * block @ points.T
+        if k < len(points):
+            neighbours[start:start + block_rows] = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        else:
+            neighbours[start:start + block_rows] = np.arange(len(points))
+        if progress is not None:
+            progress(min(start + block_rows, len(queries)) / len(queries))
+    return neighbours
+
+def nan_euclidean_fill(donors, queries, n_neighbors, aggregation, progress=None):
+    """Fill the NaNs of the query rows from donor rows that have NaNs themselves.
+
+    As scikit-learn's KNNImputer: each missing value is the mean or median of the k nearest donors
+    where its column is observed, by Euclidean distance on the columns observed in both rows; the
+    column mean or median of the donors when none shares a column with the row.
+    """
+    reduce = np.nanmedian if aggregation == 'median' else np.nanmean
+    donor_observed = ~np.isnan(donors)
+    donor_mask = donor_observed.astype('float64')
+    donor_values = np.where(donor_observed, donors, 0.0)
+    squares = donor_values ** 2
+    column_values = reduce(donors, axis=0)
+    k = min(n_neighbors, len(donors))
+    filled = queries.copy()
+    rows = np.flatnonzero(np.isnan(queries).any(axis=1))
+    block_rows = max(1, KNN_BRUTE_BLOCK_ELEMENTS // len(donors))
+    for start in range(0, len(rows), block_rows):
+        chunk = rows[start:start + block_rows]
+        missing = np.isnan(queries[chunk])
+        mask = (~missing).astype('float64')
+        block = np.where(missing, 0.0, queries[chunk])
+        # Moyenne sur les colonnes communes de (p - q)², même classement que la distance de KNNImputer
+        common = mask @ donor_mask.T
+        with np.errstate(divide='ignore', invalid='ignore'):
+            distances = (block ** 2 @ donor_mask.T + mask @ squares.T - 2 * block @ donor_values.T) / common
+        distances[common == 0] = np.inf
+        for j in np.flatnonzero(missing.any(axis=0)):
+            targets = np.flatnonzero(missing[:, j])
+            candidates = np.where(donor_observed[:, j], distances[targets], np.inf)
+            if k < len(donors):
+                neighbours = np.argpartition(candidates, k - 1, axis=1)[:, :k]
+            else:
+                neighbours = np.broadcast_to(np.arange(len(donors)), (len(targets), k))
+            usable = np.isfinite(np.take_along_axis(candidates, neighbours, axis=1))
+            picked = np.where(usable, donors[neighbours, j], np.nan)
+            picked[~usable.any(axis=1)] = column_values[j]
+            filled[chunk[targets], j] = reduce(picked, axis=1)
+        if progress is not None:
+            progress(min(start + block_rows, len(rows)) / len(rows))
+    return filled
+
+def knn_donors(values):
+    """Donor rows of a KNN imputation: the complete rows, or the partially observed ones if none is complete"""
+    observed = ~np.isnan(values)
+    complete = observed.all(axis=1)
+    return values[complete] if complete.any() else values[observed.any(axis=1)]
+
+def neighbour_search(points):
+    """Return a function (queries, k) -> neighbour positions among points"""
+    if points.shape[1] > KNN_TREE_MAX_DIM and len(points) >= KNN_ANN_MIN_ROWS:
+        # Import différé : pynndescent (et numba) prennent plusieurs secondes à charger
+        from pynndescent import NNDescent
+        index = NNDescent(points, random_state=0)
+        index.prepare()
+        return lambda queries, k: index.query(queries, k=k)[0]
+    tree = cKDTree(points)
+    return lambda queries, k: tree.query(queries, k=k, workers=-1)[1].reshape(len(queries), k)
+
+def knn_fill(donors, queries, n_neighbors=5, aggregation='mean', progress=None, searches=None):
+    """Fill the NaNs of the query rows with the mean or median of their k nearest donor rows.
+
+    searches, if given (OrderedDict), keeps the index built for each missing-value pattern between calls,
+    at most KNN_MAX_KEPT_INDEXES of them (least recently used dropped first).
+    """
+    if len(donors) == 0:
+        raise ValueError("Aucune ligne renseignée pour l'imputation KNN")
+    if np.isnan(donors).any():
+        return nan_euclidean_fill(donors, queries, n_neighbors, aggregation, progress)
+    missing = np.isnan(queries)
+    filled = queries.copy()
+    k = min(n_neighbors, len(donors))
+    reduce = np.median if aggregation == 'median' else np.mean
+
+    incomplete = np.flatnonzero(missing.any(axis=1))
+    # Ligne entièrement manquante : agrégat de toutes les lignes complètes
+    empty = incomplete[missing[incomplete].all(axis=1)]
+    filled[empty] = reduce(donors, axis=0)
+    incomplete = np.setdiff1d(incomplete, empty)
+
+    patterns, pattern_ids, pattern_sizes = np.unique(missing[incomplete], axis=0, return_inverse=True, return_counts=True)
+    pattern_ids = pattern_ids.ravel()
+    small = pattern_sizes * len(donors) <= KNN_BRUTE_FORCE_PAIRS
+    if searches is not None:
+        # Index gardés d'un appel à l'autre : un motif rare en profite aussi s'il reste de la place
+        # une fois comptés les index des motifs fréquents
+        budget = KNN_MAX_KEPT_INDEXES - len(searches) - sum(
+            patterns[p].tobytes() not in searches for p in np.flatnonzero(~small))
+        for p in np.flatnonzero(small):
+            if patterns[p].tobytes() in searches:
+                small[p] = False
+            elif budget > 0:
+                small[p] = False
+                budget -= 1
+    rare = small[pattern_ids]
+    total = max(len(incomplete), 1)
+
+    rows = incomplete[rare]
+    if len(rows):
+        neighbours = masked_brute_force_neighbours(
+            donors, queries[rows], ~missing[rows], k,
+            progress=None if progress is None else lambda fraction: progress(fraction * len(rows) / total))
+        aggregated = reduce(donors[neighbours], axis=1)
+        filled[rows] = np.where(missing[rows], aggregated, queries[rows])
+    done = len(rows)
+
+    for p in np.unique(pattern_ids[~rare]):
+        rows = incomplete[pattern_ids == p]
+        pattern = patterns[p]
+        observed = ~pattern
+        search = None if searches is None else searches.pop(pattern.tobytes(), None)
+        if search is None:
+            search = neighbour_search(np.ascontiguousarray(donors[:, observed]))
+        if searches is not None:
+            # Index le plus récemment utilisé en dernier, les plus anciens oubliés au-delà de la limite
+            searches[pattern.tobytes()] = search
+            while len(searches) > KNN_MAX_KEPT_INDEXES:
+                searches.popitem(last=False)
+        donor_values = donors[:, pattern]
+        for start in range(0, len(rows), KNN_QUERY_CHUNK_ROWS):
+            chunk = rows[start:start + KNN_QUERY_CHUNK_ROWS]
+            neighbours = search(queries[np.ix_(chunk, observed)], k)
+            filled[np.ix_(chunk, pattern)] = reduce(donor_values[neighbours], axis=1)
+            done += len(chunk)
+            if progress is not None:
+                progress(done / total)
+    return filled
+
+def knn_columns(stored_data, df, columns):
+    """Columns that can be imputed: those with at least one observed value"""
+    column_stats = get_dataset_stats(stored_data, df)['columns']
+    return [col for col in columns if column_stats[col]['count'] > 0]
+
+#---------------------------------------
+# Aperçu du remplacement des valeurs manquantes
+#---------------------------------------
+# L'aperçu ne montre que quelques lignes par variable : il se contente des premières positions
+# manquantes de chaque colonne et des valeurs de remplacement (moyenne, mode), calculées une fois
+# par jeu de données. Pour le KNN, seules les lignes affichées sont imputées et le résultat est
+# mémorisé par jeu de colonnes et paramètres. Cocher une case ne relit donc pas le tableau.
+PREVIEW_ROWS_PER_COLUMN = 3
+MAX_PREVIEW_ENTRIES = 256
+PREVIEW_CACHE = OrderedDict()
+PREVIEW_LOCK = threading.Lock()
+
+def cached_preview_entry(key, compute):
+    """Value of PREVIEW_CACHE for key, computed and stored on a miss"""
+    with PREVIEW_LOCK:
+        if key in PREVIEW_CACHE:
+            PREVIEW_CACHE.move_to_end(key)
+            return PREVIEW_CACHE[key]
+    value = compute()
+    with PREVIEW_LOCK:
+        PREVIEW_CACHE[key] = value
+        while len(PREVIEW_CACHE) > MAX_PREVIEW_ENTRIES:
+            PREVIEW_CACHE.popitem(last=False)
+    return value
+
+def missing_value_sample(stored_data, df):
+    """First positions of the missing values of every column that has some"""
+    def compute():
+        column_stats = get_dataset_stats(stored_data, df)['columns']
+        return {col: np.flatnonzero(df[col].isna().to_numpy())[:PREVIEW_ROWS_PER_COLUMN]
+                for col in df.columns if column_stats[col]['nulls'] > 0}
+    return cached_preview_entry((stored_data['dataset_id'], 'sample'), compute)
+
+def fill_value(stored_data, df, col, method):
+    """Mean or mode used to replace the missing values of a column (None if the column has no mode)"""
+    def compute():
+        if method == 'mean':
+            return to_fillable_float(df[col]).mean()
+        mode_values = df[col].mode().values
+        return mode_values[0] if len(mode_values) > 0 else None
+    return cached_preview_entry((stored_data['dataset_id'], col, method), compute)
+
+def knn_preview_values(stored_data, df, columns, positions, n_neighbors, aggregation):
+    """KNN-imputed values of the given rows only, against the cached complete rows of the columns"""
+    columns = knn_columns(stored_data, df, columns)
+    if not columns:
+        return columns, np.empty((len(positions), 0))
+
+    def compute():
+        values = np.column_stack([df[col].to_numpy(dtype='float64', na_value=np.nan) for col in columns])
+        return knn_fill(knn_donors(values), values[positions], n_neighbors, aggregation)
+
+    key = (stored_data['dataset_id'], 'knn', tuple(columns), tuple(positions), n_neighbors, aggregation)
+    return columns, cached_preview_entry(key, compute)
+
+#---------------------------------------
+# Plans d'imputation réutilisables
+#---------------------------------------
+# Un plan fige ce que le nettoyage a appris sur un jeu de données : la méthode et la valeur de
+# remplacement de chaque colonne (moyenne, zéro, mode) et, pour le KNN, les lignes complètes (à
+# défaut les lignes partiellement renseignées) qui servent de donneurs avec k et l'agrégation. Il est écrit au format Arrow (donneurs en colonnes,
+# description JSON dans les métadonnées du schéma) dans un cache disque partagé, puis appliqué sans
+# réapprentissage à un autre fichier de même structure, ou lot par lot à des lignes ajoutées via la
+# route /api/plans/<plan_id>/apply. Les index de voisins construits à la première application
+# restent en mémoire avec le plan, dans la limite de KNN_MAX_KEPT_INDEXES, sous le verrou du plan.
+# La réponse de la route étant envoyée au fil des lots, un lot invalide après le premier ne peut
+# plus changer son statut : la réponse se termine alors par une ligne PLAN_STREAM_ERROR_MARKER.
+PLAN_DIR = os.environ.get('EXPLORA_PLAN_DIR', os.path.join('cache', 'plans'))
+PLAN_FORMAT_VERSION = 1
+PLAN_METADATA_KEY = b'explora_plan'
+PLAN_FIELDS = ('plan_id', 'version', 'created', 'source_rows', 'steps', 'knn')
+PLAN_METHOD_LABELS = {'mean': 'Moyenne', 'knn': 'KNN', 'zero': 'Zéro', 'mode': 'Mode'}
+PLAN_STREAM_ERROR_MARKER = '#ERREUR'
+MAX_PLANS_IN_MEMORY = 8
+PLAN_REGISTRY = OrderedDict()
+PLAN_LOCK = threading.Lock()
+
+def plan_path(plan_id):
+    return os.path.join(PLAN_DIR, f"{plan_id}.arrow")
+
+def plan_json_value(value):
+    """Fill value as a plain Python object that JSON can encode"""
+    if isinstance(value, (pd.Timestamp, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+def fit_imputation_plan(stored_data, df, mean_cols, knn_cols, zero_cols, mode_cols, n_neighbors, aggregation):
+    """Learn the replacement of every selected column on a dataset and return the (unsaved) plan"""
+    steps = [{'column': col, 'method': 'mean', 'value': plan_json_value(fill_value(stored_data, df, col, 'mean'))}
+             for col in mean_cols if col in df.columns]
+    steps += [{'column': col, 'method': 'zero', 'value': 0} for col in zero_cols if col in df.columns]
+    for col in mode_cols:
+        if col in df.columns:
+            mode_value = fill_value(stored_data, df, col, 'mode')
+            if mode_value is not None:
+                steps.append({'column': col, 'method': 'mode', 'value': plan_json_value(mode_value)})
+
+    numeric_cols = df.select_dtypes(include=['number']).columns
+    knn_cols = knn_columns(stored_data, df, [col for col in knn_cols if col in numeric_cols])
+    donors = np.empty((0, len(knn_cols)))
+    if knn_cols:
+        values = np.column_stack([df[col].to_numpy(dtype='float64', na_value=np.nan) for col in knn_cols])
+        donors = knn_donors(values)
+        steps += [{'column': col, 'method': 'knn', 'value': None} for col in knn_cols]
+
+    return {
+        'plan_id': uuid.uuid4().hex,
+        'version': PLAN_FORMAT_VERSION,
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'source_rows': len(df),
+        'steps': steps,
+        'knn': {'columns': knn_cols, 'n_neighbors': n_neighbors, 'aggregation': aggregation},
+        'donors': donors,
+        'searches': OrderedDict(),
+        'search_lock': threading.Lock()
+    }
+
+def cache_imputation_plan(plan):
+    with PLAN_LOCK:
+        PLAN_REGISTRY[plan['plan_id']] = plan
+        PLAN_REGISTRY.move_to_end(plan['plan_id'])
+        while len(PLAN_REGISTRY) > MAX_PLANS_IN_MEMORY:
+            PLAN_REGISTRY.popitem(last=False)
+
+def register_imputation_plan(plan):
+    """Write a plan to the disk cache (Arrow IPC file) and keep it in memory"""
+    os.makedirs(PLAN_DIR, exist_ok=True)
+    table = pa.table({str(col): plan['donors'][:, i] for i, col in enumerate(plan['knn']['columns'])})
+    description = json.dumps({field: plan[field] for field in PLAN_FIELDS})
+    table = table.replace_schema_metadata({PLAN_METADATA_KEY: description})
+    path = plan_path(plan['plan_id'])
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    cache_imputation_plan(plan)
+
+def check_imputation_plan(plan, n_donor_columns):
+    """Raise ValueError if a plan description read from a file is malformed"""
+    steps, knn = plan.get('steps'), plan.get('knn')
+    if any(field not in plan for field in PLAN_FIELDS) or not isinstance(steps, list) or not isinstance(knn, dict):
+        raise ValueError("Plan d'imputation incomplet")
+    for step in steps:
+        if not isinstance(step, dict) or 'column' not in step or 'value' not in step \
+                or step.get('method') not in PLAN_METHOD_LABELS:
+            raise ValueError("Étape de plan d'imputation invalide")
+    knn_cols = [step['column'] for step in steps if step['method'] == 'knn']
+    if knn.get('columns') != knn_cols or n_donor_columns != len(knn_cols) \
+            or not isinstance(knn.get('n_neighbors'), int) or knn['n_neighbors'] < 1 \
+            or knn.get('aggregation') not in ('mean', 'median'):
+        raise ValueError("Paramètres KNN du plan d'imputation invalides")
+
+def read_imputation_plan(path):
+    """Read a plan file written by register_imputation_plan; raises ValueError if it is not one"""
+    try:
+        with pa.memory_map(path, 'r') as source:
+            table = pa.ipc.open_file(source).read_all()
+    except (OSError, pa.ArrowException):
+        raise ValueError("Fichier de plan d'imputation illisible")
+    metadata = table.schema.metadata or {}
+    if PLAN_METADATA_KEY not in metadata:
+        raise ValueError("Ce fichier n'est pas un plan d'imputation")
+    try:
+        plan = json.loads(metadata[PLAN_METADATA_KEY])
+    except ValueError:
+        raise ValueError("Description du plan d'imputation illisible")
+    if not isinstance(plan, dict) or plan.get('version') != PLAN_FORMAT_VERSION \
+            or not re.match(r'^[0-9a-f]{32}$', str(plan.get('plan_id'))):
+        raise ValueError("Version de plan d'imputation non supportée")
+    check_imputation_plan(plan, table.num_columns)
+    plan['donors'] = np.column_stack([column.to_numpy() for column in table.columns]).astype('float64') \
+        if table.num_columns else np.empty((0, 0))
+    plan['searches'] = OrderedDict()
+    plan['search_lock'] = threading.Lock()
+    return plan
+
+def get_imputation_plan(plan_id):
+    """Return a saved plan from memory or from the disk cache, or None if unknown"""
+    if not re.match(r'^[0-9a-f]{32}$', plan_id or ''):
+        return None
+    with PLAN_LOCK:
+        plan = PLAN_REGISTRY.get(plan_id)
+        if plan is not None:
+            PLAN_REGISTRY.move_to_end(plan_id)
+            return plan
+    try:
+        plan = read_imputation_plan(plan_path(plan_id))
+    except ValueError:
+        return None
+    cache_imputation_plan(plan)
+    return plan
+
+def impute_columns(plan, columns, progress=None):
+    """Replace, with a fitted plan and without refitting, the missing values of a dict of columns (name -> Series)"""
+    absent = [step['column'] for step in plan['steps'] if step['column'] not in columns]
+    if absent:
+        raise ValueError(f"Colonnes du plan absentes du jeu de données : {', '.join(absent)}")
+
+    knn = plan['knn']
+    if knn['columns']:
+        values = np.column_stack([columns[col].to_numpy(dtype='float64', na_value=np.nan) for col in knn['columns']])
+        missing = np.isnan(values)
+        incomplete = missing.any(axis=1)
+        if incomplete.any():
+            # Un lot à la fois par plan : ses index de voisins ne sont ni modifiés ni interrogés en parallèle
+            with plan['search_lock']:
+                values[incomplete] = knn_fill(plan['donors'], values[incomplete], knn['n_neighbors'],
+                                              knn['aggregation'], progress, plan['searches'])
+            for i in np.flatnonzero(missing.any(axis=0)):
+                col = knn['columns'][i]
+                columns[col] = pd.Series(values[:, i], index=columns[col].index, name=col)
+
+    for step in plan['steps']:
+        col, value = step['column'], step['value']
+        if step['method'] == 'knn' or not columns[col].isna().any():
+            continue
+        if step['method'] == 'mean':
+            columns[col] = to_fillable_float(columns[col]).fillna(value)
+        elif step['method'] == 'mode' and pd.api.types.is_datetime64_any_dtype(columns[col]):
+            columns[col] = columns[col].fillna(pd.Timestamp(value))
+        else:
+            columns[col] = columns[col].fillna(value)
+
+def impute_frame(plan, df, progress=None):
+    """Copy of df with its missing values replaced by a fitted plan, without refitting"""
+    columns = {col: df[col] for col in df.columns}
+    impute_columns(plan, columns, progress)
+    return pd.DataFrame(columns)
+
+def plan_changes(plan, column_stats):
+    """(step, missing values before, missing values after) for each plan step that fills a column, from its statistics"""
+    changes = []
+    for step in plan['steps']:
+        missing_before = column_stats[step['column']]['nulls']
+        # Seule une moyenne indéfinie (colonne entièrement vide) ne remplace rien
+        if missing_before and (step['method'] in ('knn', 'zero') or not pd.isna(step['value'])):
+            changes.append((step, missing_before, 0))
+    return changes
+
+def open_plan_csv_stream(plan, source):
+    """Arrow CSV reader over a byte stream, with the numeric columns of the plan read as floats"""
+    numeric = {step['column'] for step in plan['steps'] if step['method'] in ('mean', 'zero', 'knn')}
+    return pacsv.open_csv(
+        source,
+        read_options=pacsv.ReadOptions(block_size=INGESTION_BLOCK_SIZE),
+        # Types fixés : un lot dont une colonne est vide au début reste numérique
+        convert_options=pacsv.ConvertOptions(strings_can_be_null=True,
+                                             column_types={col: pa.float64() for col in numeric})
+    )
+
+@app.server.route('/api/plans/<plan_id>', methods=['GET'])
+def download_imputation_plan(plan_id):
+    if get_imputation_plan(plan_id) is None or not os.path.exists(plan_path(plan_id)):
+        return {'error': "Plan d'imputation inconnu."}, 404
+    return send_file(os.path.abspath(plan_path(plan_id)), as_attachment=True,
+                     download_name=f"plan_imputation_{plan_id}.arrow")
+
+@app.server.route('/api/plans/<plan_id>/apply', methods=['POST'])
+def apply_imputation_plan_route(plan_id):
+    """Stream back the posted CSV with its missing values replaced, one block at a time"""
+    plan = get_imputation_plan(plan_id)
+    if plan is None:
+        return {'error': "Plan d'imputation inconnu."}, 404
+    try:
+        reader = open_plan_csv_stream(plan, request.stream)
+        first_block = impute_frame(plan, reader.read_next_batch().to_pandas())
+    except StopIteration:
+        return Response('', mimetype='text/csv')
+    except (pa.ArrowException, ValueError) as e:
+        return {'error': f"Erreur lors de l'imputation : {str(e)}"}, 400
+
+    def generate():
+        yield first_block.to_csv(index=False)
+        try:
+            for batch in reader:
+                yield impute_frame(plan, batch.to_pandas()).to_csv(index=False, header=False)
+        except (pa.ArrowException, ValueError) as e:
+            # Statut 200 déjà envoyé : la réponse tronquée est signalée par une dernière ligne
+            app.logger.warning("Plan %s : lot invalide (%s)", plan_id, e)
+            yield f"{PLAN_STREAM_ERROR_MARKER} Erreur lors de l'imputation : {str(e)}\n"
+
+    return Response(stream_with_context(generate()), mimetype='text/csv')
+
+#---------------------------------------
+# Pipeline de prétraitement à exécution différée
+#---------------------------------------
+# Nettoyage, conversion, normalisation et dédoublonnage ne copient plus le jeu de données : chaque
+# opération ajoute une étape (impute, cast, scale, dedupe) au pipeline que store-data enregistre
+# contre le jeu importé. Ce que l'étape apprend (plan d'imputation, paramètres de normalisation)
+# est figé à son enregistrement. Le jeu de données n'est calculé qu'à sa première lecture par
+# get_dataset, en une fois : les dédoublonnages sélectionnent les lignes conservées de la source,
+# puis les étapes par colonne s'enchaînent sur les seules colonnes utiles et le DataFrame est
+# assemblé à la fin. Les identifiants des versions sont chaînés depuis la source, n'importe quel
+# worker peut donc recalculer un pipeline. Les aperçus n'évaluent que les lignes affichées.
+# Le calcul part de la version antérieure la plus récente encore en mémoire (seules les étapes
+# suivantes sont appliquées) et un seul appelant calcule une version donnée, les autres attendent
+# son résultat. L'imputation, coûteuse, est calculée dans la tâche de nettoyage elle-même.
+PIPELINE_PREVIEW_ROWS = 5
+PIPELINE_CAST_TYPES = ('int64', 'float64', 'category', 'object', 'datetime64[ns]')
+MAX_PIPELINE_ROWS = 32
+PIPELINE_ROWS_CACHE = OrderedDict()  # Lignes conservées, par (version de départ, version se terminant par un dédoublonnage)
+PIPELINE_ROWS_LOCK = threading.Lock()
+PIPELINE_RUNS = {}  # Verrou du calcul en cours de chaque version
+PIPELINE_RUNS_LOCK = threading.Lock()
+
+def pipeline_parts(stored_data):
+    """Source dataset id, recorded steps and the dataset id after each step of a store-data reference"""
+    pipeline = stored_data.get('pipeline')
+    if not pipeline:
+        return stored_data['dataset_id'], [], []
+    return pipeline['source'], pipeline['steps'], pipeline['ids']
+
+def record_step(stored_data, step, **changes):
+    """Return the store-data reference of stored_data followed by one more step; nothing is computed"""
+    source_id, steps, ids = pipeline_parts(stored_data)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(stored_data['dataset_id'].encode())
+    digest.update(json.dumps(step, sort_keys=True).encode())
+    dataset_id = digest.hexdigest()
+    return {**stored_data, **changes, 'dataset_id': dataset_id,
+            'pipeline': {'source': source_id, 'steps': steps + [step], 'ids': ids + [dataset_id]}}
+
+def pipeline_available(stored_data):
+    """True when the source dataset and the imputation plans of the pipeline can still be loaded"""
+    if not stored_data or not isinstance(stored_data, dict) or not stored_data.get('dataset_id'):
+        return False
+    source_id, steps, _ = pipeline_parts(stored_data)
+    return get_dataset({'dataset_id': source_id}) is not None and all(
+        get_imputation_plan(step['plan_id']) is not None for step in steps if step['op'] == 'impute')
+
+def step_columns(step):
+    """Columns read and columns written by a column-wise step"""
+    if step['op'] == 'scale':
+        return [step['column']], [step['target']]
+    if step['op'] == 'impute':
+        return step['columns'], step['columns']
+    return [step['column']], [step['column']]
+
+def step_reads(step, written):
+    """Columns a column-wise step reads to produce the given written columns"""
+    if step['op'] != 'impute':
+        return step_columns(step)[0]
+    # Remplacement par valeur : chaque colonne ne dépend que d'elle-même ; le KNN lit toutes ses colonnes
+    knn_cols = get_imputation_plan(step['plan_id'])['knn']['columns']
+    return list(written) + (knn_cols if set(written).intersection(knn_cols) else [])
+
+def cast_column(series, dtype):
+    """Convert a column to one of PIPELINE_CAST_TYPES (missing values become 0 for integers)"""
+    if dtype == 'int64':
+        return series.fillna(0).astype('int64')
+    if dtype == 'datetime64[ns]':
+        return pd.to_datetime(series, errors='coerce')
+    return series.astype(dtype)
+
+def scale_step(column, method, sorted_values):
+    """Normalization step of a column, fitted on its sorted non-missing values (same results as the scikit-learn scalers)"""
+    step = {'op': 'scale', 'column': column, 'target': f"{column}_norm", 'method': method}
+    if method == 'log':
+        return step
+    if len(sorted_values) == 0:
+        shift, scale = 0.0, 1.0
+    elif method == 'standard':
+        shift, scale = sorted_values.mean(), sorted_values.std()
+    elif method == 'minmax':
+        shift, scale = sorted_values[0], sorted_values[-1] - sorted_values[0]
+    else:
+        q1, shift, q3 = sorted_quantiles(sorted_values, [0.25, 0.5, 0.75])
+        scale = q3 - q1
+    step.update({'shift': float(shift), 'scale': float(scale) if scale != 0 else 1.0})
+    return step
+
+def scale_values(values, step):
+    """Apply a normalization step to a float array (increasing transformation: sorted input stays sorted)"""
+    if step['method'] == 'log':
+        return np.log1p(values)
+    return (values - step['shift']) / step['scale']
+
+def apply_step(step, columns, progress=None):
+    """Apply one column-wise step to a dict of columns (name -> Series)"""
+    if step['op'] == 'cast':
+        columns[step['column']] = cast_column(columns[step['column']], step['dtype'])
+    elif step['op'] == 'scale':
+        series = columns[step['column']]
+        columns[step['target']] = pd.Series(scale_values(series.to_numpy(dtype='float64', na_value=np.nan), step),
+                                            index=series.index, name=step['target'])
+    elif step['op'] == 'impute':
+        # Plan restreint aux colonnes évaluées (le KNN n'est gardé que si toutes ses colonnes le sont)
+        plan = get_imputation_plan(step['plan_id'])
+        knn = plan['knn'] if all(col in columns for col in plan['knn']['columns']) else {**plan['knn'], 'columns': []}
+        steps = [plan_step for plan_step in plan['steps'] if plan_step['column'] in columns
+                 and (plan_step['method'] != 'knn' or knn['columns'])]
+        impute_columns({**plan, 'steps': steps, 'knn': knn}, columns, progress)
+
+def pipeline_base(stored_data):
+    """Starting point of an evaluation: (dataset id, frame, remaining steps, their ids).
+
+    The most recent version of the pipeline still in memory is used, else the source dataset.
+    """
+    source_id, steps, ids = pipeline_parts(stored_data)
+    with DATASET_REGISTRY_LOCK:
+        for i in range(len(ids) - 1, -1, -1):
+            df = DATASET_REGISTRY.get(ids[i])
+            if df is not None:
+                return ids[i], df, steps[i + 1:], ids[i + 1:]
+    return source_id, get_dataset({'dataset_id': source_id}), steps, ids
+
+def kept_rows(base_id, base, steps, ids):
+    """Positions in base of the rows left by the deduplication steps, or None if there is none"""
+    last = max((i for i, step in enumerate(steps) if step['op'] == 'dedupe'), default=None)
+    if last is None:
+        return None
+    key = (base_id, ids[last])
+    with PIPELINE_ROWS_LOCK:
+        if key in PIPELINE_ROWS_CACHE:
+            PIPELINE_ROWS_CACHE.move_to_end(key)
+            return PIPELINE_ROWS_CACHE[key]
+
+    # Doublons cherchés sur les seules colonnes comparées, après les étapes qui précèdent
+    subset, keep = steps[last]['subset'], steps[last]['keep']
+    frame = evaluate_steps(base_id, base, steps[:last], ids[:last], columns=subset)
+    unique = ~frame.duplicated(subset=subset, keep=keep).to_numpy()
+    previous = kept_rows(base_id, base, steps[:last], ids[:last])
+    rows = np.flatnonzero(unique) if previous is None else previous[unique]
+    with PIPELINE_ROWS_LOCK:
+        PIPELINE_ROWS_CACHE[key] = rows
+        while len(PIPELINE_ROWS_CACHE) > MAX_PIPELINE_ROWS:
+            PIPELINE_ROWS_CACHE.popitem(last=False)
+    return rows
+
+def pipeline_row_count(stored_data):
+    """Number of rows of a recorded version; only the compared columns of its deduplications are evaluated"""
+    base_id, base, steps, ids = pipeline_base(stored_data)
+    rows = kept_rows(base_id, base, steps, ids)
+    return len(base) if rows is None else len(rows)
+
+def evaluate_steps(base_id, base, steps, ids, rows=None, columns=None, progress=None):
+    """Evaluate steps on a starting frame, optionally on some output rows and columns only"""
+    positions = kept_rows(base_id, base, steps, ids)
+    if rows is not None:
+        positions = np.asarray(rows) if positions is None else positions[rows]
+
+    output_columns = list(base.columns)
+    for step in steps:
+        if step['op'] == 'scale' and step['target'] not in output_columns:
+            output_columns.append(step['target'])
+    wanted = output_columns if columns is None else [col for col in output_columns if col in columns]
+
+    # Colonnes à lire : celles demandées et celles dont elles dépendent
+    column_steps = [step for step in steps if step['op'] != 'dedupe']
+    needed = set(wanted)
+    for step in reversed(column_steps):
+        written = needed.intersection(step_columns(step)[1])
+        if written:
+            needed.update(step_reads(step, written))
+
+    data = {col: base[col] if positions is None else base[col].iloc[positions]
+            for col in base.columns if col in needed}
+    for step in column_steps:
+        if needed.intersection(step_columns(step)[1]):
+            apply_step(step, data, progress)
+    return pd.DataFrame({col: data[col] for col in wanted})
+
+def evaluate_pipeline(stored_data, rows=None, columns=None, progress=None):
+    """Evaluate the recorded steps of store-data from the nearest version in memory"""
+    return evaluate_steps(*pipeline_base(stored_data), rows, columns, progress)
+
+def materialize_pipeline(stored_data, progress=None):
+    """Compute the full dataset of a recorded pipeline, or None if its source is no longer available"""
+    if not pipeline_available(stored_data):
+        return None
+    df = evaluate_pipeline(stored_data, progress=progress)
+    derive_pipeline_stats(stored_data, df)
+    return df
+
+def derive_pipeline_stats(stored_data, df):
+    """Statistics of a recorded version, reused from the previous version for the columns its last step leaves unchanged"""
+    _, steps, ids = pipeline_parts(stored_data)
+    parent = {'dataset_id': ids[-2] if len(ids) > 1 else stored_data['pipeline']['source']}
+    derive_dataset_stats(parent, stored_data['dataset_id'], df, [] if steps[-1]['op'] == 'dedupe' else step_columns(steps[-1])[1])
+
+def compute_pipeline_dataset(stored_data, progress=None):
+    """Materialize a recorded version and keep it in memory; concurrent callers wait for the first computation"""
+    dataset_id = stored_data['dataset_id']
+    with PIPELINE_RUNS_LOCK:
+        run_lock = PIPELINE_RUNS.setdefault(dataset_id, threading.Lock())
+    try:
+        with run_lock:
+            with DATASET_REGISTRY_LOCK:
+                df = DATASET_REGISTRY.get(dataset_id)
+                if df is not None:
+                    DATASET_REGISTRY.move_to_end(dataset_id)
+                    DATASET_CACHE_STATS['memory_hits'] += 1
+                    return df
+            return keep_dataset(dataset_id, materialize_pipeline(stored_data, progress), 'pipeline_runs')
+    finally:
+        with PIPELINE_RUNS_LOCK:
+            if PIPELINE_RUNS.get(dataset_id) is run_lock:
+                del PIPELINE_RUNS[dataset_id]
+
+def pipeline_frame(stored_data, rows=None, columns=None):
+    """Rows and columns of the dataset referenced by store-data, evaluated without computing the rest (None if unavailable).
+
+    The result may be the shared dataset itself: copy it before modifying it.
+    """
+    if not pipeline_available(stored_data):
+        return None
+    _, steps, _ = pipeline_parts(stored_data)
+    if not steps or stored_data['dataset_id'] in DATASET_REGISTRY:
+        df = get_dataset(stored_data)
+        if rows is not None:
+            df = df.iloc[rows]
+        return df if columns is None else df[[col for col in df.columns if col in columns]]
+    return evaluate_pipeline(stored_data, rows, columns)
+
+def pipeline_preview(stored_data, columns=None):
+    """First rows of the dataset referenced by store-data, evaluated on those rows only"""
+    if not stored_data or not isinstance(stored_data, dict) or 'n_rows' not in stored_data:
+        return None
+    return pipeline_frame(stored_data, np.arange(min(stored_data['n_rows'], PIPELINE_PREVIEW_ROWS)), columns)
+
 # Store components 
 stores = html.Div([
     dcc.Store(id='store-data', storage_type='memory'),
@@ -237,7 +2274,8 @@ download_modal = dbc.Modal([
         dbc.FormText(
             "Caractères autorisés: lettres, chiffres, tirets et underscores",
             className="text-muted mt-2"
-        )
+        ),
+        job_panel('export', "Écriture du fichier CSV...")
     ]),
     dbc.ModalFooter([
         dbc.Button("Annuler", id="cancel-export", outline=True, className="me-2"),
@@ -367,10 +2405,56 @@ def format_numeric_values(df):
             df[col] = df[col].round(2)
     return df
 
+def build_summary_tables(dataset_stats):
+    """Build the quantitative and qualitative summary DataTables of the /summary page"""
+    summary_quantitative, summary_qualitative = summary_tables(dataset_stats)
+
+    if not summary_quantitative.empty:
+        summary_quantitative = format_numeric_values(summary_quantitative)
+    else:
+        summary_quantitative = pd.DataFrame(columns=["Aucune variable quantitative trouvée"])
+
+    if summary_qualitative.empty:
+        summary_qualitative = pd.DataFrame(columns=["Aucune variable qualitative trouvée"])
+
+    sketched = [col_stats for col_stats in dataset_stats['columns'].values() if 'sketch' in col_stats]
+    return [
+        html.H4("Résumé des variables quantitatives", className="text-primary"),
+        dash_table.DataTable(
+            data=summary_quantitative.reset_index().to_dict('records'),
+            columns=[{
+                'name': col,
+                'id': col,
+                'type': 'numeric',
+                'format': dash_table.Format.Format(
+                    precision=2,
+                    scheme=dash_table.Format.Scheme.fixed
+                ) if col != 'index' and pd.api.types.is_numeric_dtype(summary_quantitative[col]) else {}
+            } for col in summary_quantitative.reset_index().columns],
+            style_table={'overflowX': 'auto'},
+            page_size=10
+        ),
+        html.Small(
+            f"Quartiles approchés pour {len(sketched)} colonne(s) de plus de {SKETCH_MIN_ROWS:,} valeurs "
+            f"(erreur de rang ≤ ±{kll_rank_error() * 100:.2f} %).".replace(',', ' '),
+            className="text-muted"
+        ) if sketched else None,
+        html.H4("Résumé des variables qualitatives", className="mt-4 text-primary"),
+        dash_table.DataTable(
+            data=summary_qualitative.reset_index().to_dict('records'),
+            columns=[{'name': col, 'id': col} for col in summary_qualitative.reset_index().columns],
+            style_table={'overflowX': 'auto'},
+            page_size=10
+        ),
+    ]
+
 #---------------------------------------------------------------------------------------------------------------------------
 #téléchargement aprés modifications (partie prétraitement des données) bouton télechargement des données aprés modifictaion 
 #---------------------------------------------------------------------------------------------------------------------------
 
+# Taille des blocs de lignes écrits à chaque étape de l'export
+EXPORT_CHUNK_ROWS = 100_000
+
 # Callback pour gérer le workflow complet
 @app.callback(
     [Output('export-modal', 'is_open'),
@@ -379,63 +2463,81 @@ def format_numeric_values(df):
      Output('download-alert', 'color'),
      Output('download-alert', 'is_open')],
     [Input('btn-main-download', 'n_clicks'),
-     Input('confirm-export', 'n_clicks'),
-     Input('cancel-export', 'n_clicks')],
-    [State('store-data', 'data'),
-     State('export-filename', 'value'),
-     State('export-modal', 'is_open')]
+     Input('cancel-export', 'n_clicks')]
 )
 
-def handle_export_workflow(btn_clicks, confirm_clicks, cancel_clicks, data, filename, is_open):
+def handle_export_workflow(btn_clicks, cancel_clicks):
     ctx = dash.callback_context
     trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
     
     if trigger_id == 'btn-main-download':
         return True, None, None, None, False
     
-    if trigger_id == 'cancel-export':
-        return False, None, None, None, False
+    return False, None, None, None, False
 
-    if trigger_id == 'confirm-export':
-        if not data or not filename:
-            return dash.no_update, None, "Données ou nom de fichier manquant", "danger", True
-            
-        try:
-            if not re.match(r'^[\w-]{3,40}$', filename):
-                raise ValueError("Nom de fichier invalide")
-
-            df = pd.DataFrame(data)
-            df = format_numeric_values(df)  # Format before export
-            
-            export_dir = os.path.join('exports', datetime.datetime.now().strftime("%Y-%m-%d"))
-            os.makedirs(export_dir, exist_ok=True)
-            
-            sanitized_name = re.sub(r'[^\w-]', '', filename)
-            full_path = os.path.join(export_dir, f"{sanitized_name}.csv")
-            
-            if os.path.exists(full_path):
-                raise FileExistsError("Un fichier avec ce nom existe déjà")
-
-            df.to_csv(full_path, index=False, encoding='utf-8-sig', float_format="%.2f")
-            
-            return (
-                False,
-                dcc.send_file(full_path),
-                f"Export réussi : {full_path}",
-                "success",
-                True
-            )
+# L'écriture des gros fichiers s'exécute en arrière-plan
+@app.callback(
+    [Output('export-modal', 'is_open', allow_duplicate=True),
+     Output('final-export-trigger', 'data', allow_duplicate=True),
+     Output('download-alert', 'children', allow_duplicate=True),
+     Output('download-alert', 'color', allow_duplicate=True),
+     Output('download-alert', 'is_open', allow_duplicate=True)],
+    [Input('confirm-export', 'n_clicks')],
+    [State('store-data', 'data'),
+     State('export-filename', 'value')],
+    **job_callback('export', 'confirm-export')
+)
+def run_export(set_progress, confirm_clicks, data, filename):
+    if not confirm_clicks:
+        raise PreventUpdate
+    if not data or not filename:
+        return dash.no_update, None, "Données ou nom de fichier manquant", "danger", True
+        
+    try:
+        if not re.match(r'^[\w-]{3,40}$', filename):
+            raise ValueError("Nom de fichier invalide")
 
-        except Exception as e:
-            return (
-                dash.no_update,
-                None,
-                f"Erreur d'export : {str(e)}",
-                "danger",
-                True
-            )
+        if get_dataset(data) is None:
+            raise ValueError("Données expirées, veuillez recharger le fichier")
+        
+        export_dir = os.path.join('exports', datetime.datetime.now().strftime("%Y-%m-%d"))
+        os.makedirs(export_dir, exist_ok=True)
+        
+        sanitized_name = re.sub(r'[^\w-]', '', filename)
+        full_path = os.path.join(export_dir, f"{sanitized_name}.csv")
+        
+        if os.path.exists(full_path):
+            raise FileExistsError("Un fichier avec ce nom existe déjà")
 
-    return dash.no_update, None, None, None, False
+    except Exception as e:
+        return dash.no_update, None, f"Erreur d'export : {str(e)}", "danger", True
+
+    full_path, failure = run_job(set_progress, export_dataset, data, full_path)
+    if failure is not None:
+        return dash.no_update, None, f"Export interrompu : {failure.children}", failure.color, True
+    return False, dcc.send_file(full_path), f"Export réussi : {full_path}", "success", True
+
+def export_dataset(job, data, full_path):
+    """Background job: write the formatted dataset to CSV by blocks of rows; returns the file path"""
+    df = get_dataset(data)
+    if df is None:
+        raise ValueError("Données expirées, veuillez recharger le fichier")
+    # Nom provisoire jusqu'au dernier bloc : une tâche annulée (processus terminé) ne laisse pas de fichier partiel
+    part_path = f"{full_path}.part"
+    try:
+        n_rows = max(len(df), 1)
+        for start in range(0, n_rows, EXPORT_CHUNK_ROWS):
+            chunk = format_numeric_values(df.iloc[start:start + EXPORT_CHUNK_ROWS])  # Format before export
+            chunk.to_csv(part_path, index=False, float_format="%.2f",
+                         mode='w' if start == 0 else 'a', header=start == 0,
+                         encoding='utf-8-sig' if start == 0 else 'utf-8')
+            report_progress(job, min(start + EXPORT_CHUNK_ROWS, n_rows) / n_rows)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+    os.replace(part_path, full_path)
+    return full_path
 
 
 # Activation conditionnelle du bouton principal
@@ -458,7 +2560,9 @@ def update_download_button(ts, data):
 )
 def update_page(pathname, stored_data):  # Acceptation de 2 arguments
     global global_df
-    df = pd.DataFrame(stored_data)
+    df = get_dataset(stored_data)
+    if df is None:
+        df = pd.DataFrame()
     # Page d'accueil
     if pathname == '/' or pathname is None:
      return html.Div([
@@ -647,7 +2751,7 @@ def update_page(pathname, stored_data):  # Acceptation de 2 arguments
                     ], className="mb-2"),
                     html.Li([
                         html.Strong("Taille maximale: ", className="text-dark"), 
-                        html.Span("Jusqu'à 100 Mo (selon la mémoire disponible)", className="text-secondary")
+                        html.Span("Jusqu'à 100 Mo par la zone de dépôt ; au-delà, utilisez l'envoi par morceaux (reprise possible)", className="text-secondary")
                     ], className="mb-2"),
                     html.Li([
                         html.Strong("Options: ", className="text-dark"), 
@@ -931,6 +3035,16 @@ def update_page(pathname, stored_data):  # Acceptation de 2 arguments
                        'backgroundColor': '#f8f9fa', 'cursor': 'pointer', 'borderColor': '#007bff'},
                 multiple=False
             ),
+            # Envoi par morceaux pour les gros fichiers (voir assets/chunked_upload.js)
+            html.Div([
+                html.Label("Fichiers volumineux (envoi par morceaux, reprise possible) :", className="fw-bold"),
+                dbc.Button(
+                    [html.I(className="fas fa-file-upload me-2"), "Choisir un fichier volumineux"],
+                    id='chunked-upload-button', color="primary", outline=True, className="ms-2"
+                ),
+                dbc.Progress(id='chunked-upload-progress', value=0, className='mt-2'),
+                dcc.Store(id='chunked-upload-result')
+            ], style={'margin': '10px'}),
             html.Div(id='output-message', className='mt-2 text-success fw-bold'),
             html.Div([
                  dbc.Button("Réinitialiser les données", id="reset-btn", color="danger", className="mb-3"),
@@ -976,7 +3090,7 @@ def update_page(pathname, stored_data):  # Acceptation de 2 arguments
     #----------------------------------
 
     if pathname == '/summary':
-        if stored_data is None or not stored_data:
+        if stored_data is None or not stored_data or df.empty:
             return html.Div(
             "⚠️ Aucune donnée disponible. Veuillez télécharger un fichier.",
 
@@ -993,23 +3107,7 @@ def update_page(pathname, stored_data):  # Acceptation de 2 arguments
             }
         ),
 
-        global_df = pd.DataFrame(stored_data)
-        quantitative_df = global_df.select_dtypes(include=['number'])
-        qualitative_df = global_df.select_dtypes(exclude=['number'])
-
-        if not quantitative_df.empty:
-            summary_quantitative = quantitative_df.describe().transpose()
-            summary_quantitative = format_numeric_values(summary_quantitative)
-            summary_quantitative['Valeurs manquantes'] = quantitative_df.isnull().sum()
-        else:
-            summary_quantitative = pd.DataFrame(columns=["Aucune variable quantitative trouvée"])
-
-        if not qualitative_df.empty and not qualitative_df.columns.empty:
-            summary_qualitative = qualitative_df.describe(include=['object']).transpose()
-            summary_qualitative['Valeurs manquantes'] = qualitative_df.isnull().sum()
-        else:
-            summary_qualitative = pd.DataFrame(columns=["Aucune variable qualitative trouvée"])
-
+        global_df = df
         return html.Div([
             html.H3(
             "Résumé des Données",
@@ -1020,28 +3118,13 @@ def update_page(pathname, stored_data):  # Acceptation de 2 arguments
                 'fontWeight': 'bold'
             }),
             dbc.Button("← Retour", href="/upload", color="secondary", className="mb-3"),
-            html.H4("Résumé des variables quantitatives", className="text-primary"),
-            dash_table.DataTable(
-                data=summary_quantitative.reset_index().to_dict('records'),
-                columns=[{
-                    'name': col,
-                    'id': col,
-                    'type': 'numeric',
-                    'format': dash_table.Format.Format(
-                        precision=2,
-                        scheme=dash_table.Format.Scheme.fixed
-                    ) if col != 'index' and pd.api.types.is_numeric_dtype(summary_quantitative[col]) else {}
-                } for col in summary_quantitative.reset_index().columns],
-                style_table={'overflowX': 'auto'},
-                page_size=10
-            ),
-            html.H4("Résumé des variables qualitatives", className="mt-4 text-primary"),
-            dash_table.DataTable(
-                data=summary_qualitative.reset_index().to_dict('records'),
-                columns=[{'name': col, 'id': col} for col in summary_qualitative.reset_index().columns],
-                style_table={'overflowX': 'auto'},
-                page_size=10
+            dbc.Switch(
+                id='summary-exact-toggle',
+                label="Calcul exact (parcours complet des grandes colonnes)",
+                value=False,
+                className="mb-3"
             ),
+            html.Div(id='summary-tables', children=build_summary_tables(get_dataset_stats(stored_data, df))),
         ])
     
     #-----------------------------------
@@ -1117,6 +3200,8 @@ def update_page(pathname, stored_data):  # Acceptation de 2 arguments
             ),
             
             # Zone d'affichage
+            job_panel('cleaning', "Remplacement des valeurs manquantes en cours..."),
+            job_panel('plan', "Application du plan d'imputation en cours..."),
             html.Div(id='preprocessing-output', className="p-4")
         ], fluid=True)
     ])
@@ -1132,6 +3217,13 @@ def update_page(pathname, stored_data):  # Acceptation de 2 arguments
     
      return html.Div([
         dbc.Container(fluid=True, children=[
+            dbc.Switch(
+                id='viz-exact-toggle',
+                label="Calcul exact (sinon histogrammes et quantiles approchés au-delà de "
+                      f"{SKETCH_MIN_ROWS:,} valeurs)".replace(',', ' '),
+                value=False,
+                className="mb-3"
+            ),
              
             # Première ligne : 2 visualisations côte à côte
             dbc.Row([
@@ -1284,6 +3376,20 @@ def update_page(pathname, stored_data):  # Acceptation de 2 arguments
                                 value=True,
                                 className="mt-2"
                             ),
+                            dbc.RadioItems(
+                                id='corr-method',
+                                options=[
+                                    {'label': 'Pearson', 'value': 'pearson'},
+                                    {'label': 'Spearman', 'value': 'spearman'},
+                                ],
+                                value='pearson',
+                                inline=True
+                            ),
+                            dbc.Switch(
+                                id='corr-cluster',
+                                label="Vue d'ensemble regroupée (toutes les variables numériques)",
+                                value=False
+                            ),
                             dcc.Graph(
                                 id='correlation-chart',
                                 style={'height': '400px'},
@@ -1291,7 +3397,8 @@ def update_page(pathname, stored_data):  # Acceptation de 2 arguments
                                     'displayModeBar': True,
                                     'scrollZoom': True
                                 }
-                            )
+                            ),
+                            html.Div(id='corr-top-pairs', className="mt-3")
                         ])
                     ], style={'height': '100%', 'box-shadow': '0 4px 6px rgba(0,0,0,0.1)'})
                 ])
@@ -1362,10 +3469,11 @@ def update_page(pathname, stored_data):  # Acceptation de 2 arguments
             dbc.Container([  # Conteneur pour organiser les éléments
             # Groupe de boutons alignés horizontalement pour chaque test
             dbc.Row([
-                dbc.Col(dbc.Button("Test de Normalité", id="btn-normality", color="primary", style={'width': '100%'}), width=3),
-                dbc.Col(dbc.Button("Test de Corrélation", id="btn-correlation", color="secondary", style={'width': '100%'}), width=3),
-                dbc.Col(dbc.Button("Test Chi-carré", id="btn-chi-squared", color="primary", style={'width': '100%'}), width=3),
-                dbc.Col(dbc.Button("Test t de Student", id="btn-t-student", color="secondary", style={'width': '100%'}), width=3),
+                dbc.Col(dbc.Button("Test de Normalité", id="btn-normality", color="primary", style={'width': '100%'})),
+                dbc.Col(dbc.Button("Test de Corrélation", id="btn-correlation", color="secondary", style={'width': '100%'})),
+                dbc.Col(dbc.Button("Test Chi-carré", id="btn-chi-squared", color="primary", style={'width': '100%'})),
+                dbc.Col(dbc.Button("Test t de Student", id="btn-t-student", color="secondary", style={'width': '100%'})),
+                dbc.Col(dbc.Button("Rééchantillonnage", id="btn-resampling", color="primary", style={'width': '100%'})),
             ], className="mb-4"),
 
             # Zone d'affichage des résultats des tests
@@ -1411,6 +3519,19 @@ def update_page(pathname, stored_data):  # Acceptation de 2 arguments
 
 
 
+# Bascule du résumé entre quartiles approchés (esquisses) et calcul exact
+@app.callback(
+    Output('summary-tables', 'children'),
+    Input('summary-exact-toggle', 'value'),
+    State('store-data', 'data'),
+    prevent_initial_call=True
+)
+def update_summary_tables(exact, stored_data):
+    dataset_stats = get_dataset_stats(stored_data, exact=bool(exact))
+    if dataset_stats is None:
+        raise PreventUpdate
+    return build_summary_tables(dataset_stats)
+
 # Add this callback to synchronize the DataTable edits with the store
 @app.callback(
     Output('conversion-data-store', 'data'),
@@ -1419,10 +3540,10 @@ def update_page(pathname, stored_data):  # Acceptation de 2 arguments
     prevent_initial_call=True
 )
 def initialize_conversion_data(n_clicks, stored_data):
-    if not n_clicks or not stored_data:
+    df = get_dataset(stored_data)
+    if not n_clicks or df is None:
         raise PreventUpdate
     
-    df = pd.DataFrame(stored_data)
     # Create basic version of data for the table
     conversion_data = [{'variable': col, 'current_type': str(df[col].dtype), 'new_type': str(df[col].dtype)} 
                     for col in df.columns]
@@ -1440,17 +3561,484 @@ def make_hologram_card(mode_id, emoji, title, color):
         width=3, className="hologram-col"
     )
 
+#--------------------------------------------
+# Lecture des fichiers uploadés par blocs
+#--------------------------------------------
+# Le contenu base64 est décodé par morceaux dans un fichier temporaire, puis les CSV/TXT
+# sont analysés bloc par bloc par le lecteur Arrow : le pic mémoire reste de l'ordre d'un bloc
+# au lieu de trois copies du fichier (bytes décodés, str, StringIO).
+INGESTION_BLOCK_SIZE = int(os.environ.get('EXPLORA_INGESTION_BLOCK_MB', 16)) * 1024 * 1024
+BASE64_DECODE_CHUNK = 4 * 1024 * 1024  # Multiple de 4 : chaque morceau se décode indépendamment
+SUPPORTED_EXTENSIONS = ('.csv', '.txt', '.xls', '.xlsx')
+
+def spool_base64_upload(contents):
+    """Decode a dcc.Upload data URL chunk by chunk into a temporary file and return its path"""
+    start = contents.index(',') + 1
+    fd, path = tempfile.mkstemp(suffix='.upload')
+    with os.fdopen(fd, 'wb') as f:
+        for offset in range(start, len(contents), BASE64_DECODE_CHUNK):
+            f.write(base64.b64decode(contents[offset:offset + BASE64_DECODE_CHUNK]))
+    return path
+
+def read_delimited_in_blocks(path, delimiter=',', progress_callback=None):
+    """Parse a CSV/TXT file block by block with Arrow and return a DataFrame.
+
+    Each block is converted to pandas as soon as it is parsed. When a later block does not fit the
+    type inferred on the first one, the file is read again with that column widened (integers to
+    floats, anything else to text). progress_callback(bytes_read, total_bytes, rows_read) is called
+    after each block.
+    """
+    total_bytes = os.path.getsize(path)
+    column_types = {}
+    while True:
+        rows_read = 0
+        pieces = []
+        schema = None
+        try:
+            with pa.OSFile(path, 'rb') as source:
+                reader = pacsv.open_csv(
+                    source,
+                    read_options=pacsv.ReadOptions(block_size=INGESTION_BLOCK_SIZE),
+                    parse_options=pacsv.ParseOptions(delimiter=delimiter),
+                    # Cellules vides = valeurs manquantes, comme avec pd.read_csv
+                    convert_options=pacsv.ConvertOptions(strings_can_be_null=True, column_types=column_types)
+                )
+                schema = reader.schema
+                for batch in reader:
+                    # Le bloc Arrow est libéré dès sa conversion : pas de table entière en plus du DataFrame
+                    pieces.append(batch.to_pandas(split_blocks=True, date_as_object=False))
+                    rows_read += batch.num_rows
+                    batch = None
+                    if progress_callback:
+                        progress_callback(min(source.tell(), total_bytes), total_bytes, rows_read)
+        except pa.ArrowInvalid as e:
+            # Type d'une colonne incohérent entre blocs (inféré sur le premier bloc) : colonne élargie
+            conflict = re.search(r'column #(\d+).*conversion error to (\w+)', str(e))
+            pieces = None
+            if schema is None or conflict is None:
+                break
+            column_types[schema.field(int(conflict.group(1))).name] = pa.float64() if conflict.group(2) == 'int64' else pa.string()
+            continue
+        if not pieces:
+            return schema.empty_table().to_pandas()
+        return pd.concat(pieces, ignore_index=True, copy=False)
+    # Fichier que le lecteur Arrow ne sait pas découper : lecture pandas
+    df = pd.read_csv(path, sep=delimiter)
+    if progress_callback:
+        progress_callback(total_bytes, total_bytes, len(df))
+    return df
+
+def read_uploaded_file(path, filename, progress_callback=None):
+    """Parse an uploaded file stored on disk according to its extension"""
+    if filename.endswith('.csv'):
+        return read_delimited_in_blocks(path, ',', progress_callback)
+    elif filename.endswith(('.xls', '.xlsx')):
+        return pd.read_excel(path)
+    elif filename.endswith('.txt'):
+        return read_delimited_in_blocks(path, '\t', progress_callback)
+    raise ValueError("Format de fichier non supporté.")
+
+#--------------------------------------------
+# Inférence et réduction des types à l'import
+#--------------------------------------------
+CATEGORY_MAX_RATIO = 0.5  # Texte converti en catégorie si moins de 50% de valeurs distinctes
+DATE_PATTERN = re.compile(r'^\s*(\d{4}[-/]\d{1,2}[-/]\d{1,2}|\d{1,2}[-/]\d{1,2}[-/]\d{4})([ T]\d{1,2}:\d{2}(:\d{2})?)?\s*$')
+# Jour et mois avant l'année (31/12/2024 ou 12/31/2024) : ordre déduit des valeurs supérieures à 12
+DAY_MONTH_PATTERN = r'^\s*(\d{1,2})[-/](\d{1,2})[-/](\d{4})(?:[ T](\d{1,2}):(\d{2})(?::(\d{2}))?)?\s*$'
+
+def parse_dates(series):
+    """Parse a text column of dates, or return None when its day/month order is ambiguous.
+
+    Year-first dates are parsed as year-month-day. For day/month/year values the order is
+    taken from the values: a first number above 12 means day first, a second number above 12
+    means month first; without either (or with both) the column is left as text.
+    """
+    parts = series.str.extract(DAY_MONTH_PATTERN)
+    if parts[0].isna().all():
+        return pd.to_datetime(series, errors='coerce')
+    numbers = parts.astype('float64')
+    day_first, month_first = (numbers[0] > 12).any(), (numbers[1] > 12).any()
+    if day_first == month_first:
+        return None
+    day, month = (numbers[0], numbers[1]) if day_first else (numbers[1], numbers[0])
+    return pd.to_datetime(pd.DataFrame({
+        'year': numbers[2], 'month': month, 'day': day,
+        'hour': numbers[3].fillna(0), 'minute': numbers[4].fillna(0), 'second': numbers[5].fillna(0)
+    }), errors='coerce')
+
+def optimize_dtypes(df):
+    """Infer compact dtypes (category, small ints, float32, nullable ints, dates) in place.
+
+    Returns a report with the memory usage before and after and the converted columns.
+    """
+    memory_before = int(df.memory_usage(deep=True).sum())
+    conversions = []
+
+    for col in df.columns:
+        series = df[col]
+        old_type = str(series.dtype)
+        non_null = series.dropna()
+
+        if series.dtype == 'object' and not non_null.empty:
+            sample = non_null.iloc[:100]
+            if sample.map(lambda v: isinstance(v, str) and bool(DATE_PATTERN.match(v))).all():
+                parsed = parse_dates(series)
+                # Conversion seulement si toutes les valeurs renseignées sont des dates valides
+                if parsed is not None and parsed.notna().sum() == len(non_null):
+                    df[col] = parsed
+            elif non_null.nunique() <= CATEGORY_MAX_RATIO * len(non_null):
+                df[col] = series.astype('category')
+
+        elif pd.api.types.is_bool_dtype(series) or not pd.api.types.is_numeric_dtype(series):
+            continue
+
+        elif pd.api.types.is_integer_dtype(series) and not pd.api.types.is_extension_array_dtype(series):
+            df[col] = pd.to_numeric(series, downcast='integer')
+
+        elif pd.api.types.is_float_dtype(series) and not non_null.empty:
+            values = non_null.to_numpy(dtype='float64')
+            if np.isfinite(values).all() and (values % 1 == 0).all() and np.abs(values).max() < 2 ** 53:
+                # Flottants entiers : entier compact, nullable s'il y a des valeurs manquantes
+                smallest = pd.to_numeric(pd.Series(values), downcast='integer').dtype
+                if len(non_null) < len(series):
+                    df[col] = series.astype(str(smallest).capitalize())
+                else:
+                    df[col] = series.astype(smallest)
+            elif np.array_equal(values.astype('float32').astype('float64'), values):
+                df[col] = series.astype('float32')
+
+        if str(df[col].dtype) != old_type:
+            conversions.append({'Variable': col, 'Avant': old_type, 'Après': str(df[col].dtype)})
+
+    memory_after = int(df.memory_usage(deep=True).sum())
+    return {'memory_before': memory_before, 'memory_after': memory_after, 'conversions': conversions}
+
+def to_fillable_float(series):
+    """Return nullable integer columns as float64 so they accept non-integer fill values"""
+    if pd.api.types.is_integer_dtype(series) and pd.api.types.is_extension_array_dtype(series):
+        return series.astype('float64')
+    return series
+
+def ingest_dataframe(df):
+    """Prepare a freshly parsed DataFrame for the registry and return it with the dtype report"""
+    # Noms de colonnes en texte (identifiants DataTable et schéma Arrow)
+    df.columns = df.columns.astype(str)
+
+    # Format numeric values before storing
+    df = format_numeric_values(df)
+    report = optimize_dtypes(df)
+    return df, report
+
+def format_memory(n_bytes):
+    if n_bytes < 1024 * 1024:
+        return f"{n_bytes / 1024:.1f} Ko"
+    return f"{n_bytes / (1024 * 1024):.1f} Mo"
+
+def upload_success_message(dtype_report):
+    return (
+        f"Fichier chargé avec succès! Mémoire : {format_memory(dtype_report['memory_before'])} → "
+        f"{format_memory(dtype_report['memory_after'])} ({len(dtype_report['conversions'])} colonnes optimisées)"
+    )
+
+#-----------------------------------------------
+# Upload par morceaux avec reprise (routes Flask)
+#-----------------------------------------------
+# Le navigateur (assets/chunked_upload.js) envoie le fichier brut par morceaux, écrits
+# directement sur disque ; l'analyse a lieu une seule fois à la finalisation, hors des callbacks Dash.
+# Les métadonnées sont sur disque : n'importe quel worker peut reprendre un envoi interrompu.
+# Chaque morceau reçu rafraîchit la date des deux fichiers (un envoi actif n'est jamais purgé) et
+# un seul morceau à la fois est écrit par upload_id, la position étant vérifiée une fois l'écriture réservée.
+UPLOAD_DIR = os.environ.get('EXPLORA_UPLOAD_DIR', os.path.join('cache', 'uploads'))
+UPLOAD_MAX_BYTES = int(os.environ.get('EXPLORA_UPLOAD_MAX_MB', 4096)) * 1024 * 1024
+UPLOAD_MAX_AGE_SECONDS = 24 * 3600
+UPLOAD_STATUS = {}  # Avancement de l'analyse par upload_id (worker courant)
+UPLOAD_WRITES = set()  # upload_id dont un morceau est en cours d'écriture
+UPLOAD_WRITES_LOCK = threading.Lock()
+
+def upload_paths(upload_id):
+    base = os.path.join(UPLOAD_DIR, upload_id)
+    return f"{base}.part", f"{base}.json"
+
+def load_upload_meta(upload_id):
+    if not re.match(r'^[0-9a-f]{32}$', upload_id or ''):
+        return None
+    _, meta_path = upload_paths(upload_id)
+    try:
+        with open(meta_path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def remove_stale_uploads():
+    """Delete partial uploads that have not been touched for a day"""
+    now = datetime.datetime.now().timestamp()
+    for name in os.listdir(UPLOAD_DIR):
+        path = os.path.join(UPLOAD_DIR, name)
+        try:
+            if now - os.path.getmtime(path) > UPLOAD_MAX_AGE_SECONDS:
+                os.remove(path)
+        except OSError:
+            continue
+
+@app.server.route('/api/upload', methods=['POST'])
+def create_chunked_upload():
+    params = request.get_json(silent=True) or {}
+    filename = os.path.basename(str(params.get('filename', '')))
+    size = params.get('size')
+    if not filename.endswith(SUPPORTED_EXTENSIONS):
+        return {'error': "Format de fichier non supporté."}, 400
+    if not isinstance(size, int) or size <= 0 or size > UPLOAD_MAX_BYTES:
+        return {'error': f"Taille de fichier invalide (maximum {format_memory(UPLOAD_MAX_BYTES)})."}, 400
+
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    remove_stale_uploads()
+    upload_id = uuid.uuid4().hex
+    part_path, meta_path = upload_paths(upload_id)
+    open(part_path, 'wb').close()
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump({'filename': filename, 'size': size}, f)
+    return {'upload_id': upload_id, 'received': 0}
+
+@app.server.route('/api/upload/<upload_id>', methods=['GET'])
+def chunked_upload_status(upload_id):
+    meta = load_upload_meta(upload_id)
+    if meta is None:
+        return {'error': "Upload inconnu."}, 404
+    part_path, _ = upload_paths(upload_id)
+    received = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    return {**meta, 'received': received, 'status': UPLOAD_STATUS.get(upload_id)}
+
+@app.server.route('/api/upload/<upload_id>', methods=['PUT'])
+def receive_upload_chunk(upload_id):
+    meta = load_upload_meta(upload_id)
+    if meta is None:
+        return {'error': "Upload inconnu."}, 404
+    part_path, meta_path = upload_paths(upload_id)
+    with UPLOAD_WRITES_LOCK:
+        busy = upload_id in UPLOAD_WRITES
+        UPLOAD_WRITES.add(upload_id)
+    if busy:
+        # Un autre morceau (requête répétée par le client) est en cours d'écriture
+        return {'error': "Morceau en cours d'écriture.", 'received': os.path.getsize(part_path), 'busy': True}, 409
+    try:
+        received = os.path.getsize(part_path)
+        offset = request.args.get('offset', type=int)
+        if offset != received:
+            # Morceau déjà reçu ou hors séquence : le client reprend à partir de 'received'
+            return {'error': "Position inattendue.", 'received': received}, 409
+
+        os.utime(meta_path)
+        with open(part_path, 'ab') as f:
+            while True:
+                block = request.stream.read(1024 * 1024)
+                if not block:
+                    break
+                if f.tell() + len(block) > meta['size']:
+                    f.truncate(received)
+                    return {'error': "Morceau au-delà de la taille annoncée.", 'received': received}, 400
+                f.write(block)
+            received = f.tell()
+        return {'received': received}
+    finally:
+        with UPLOAD_WRITES_LOCK:
+            UPLOAD_WRITES.discard(upload_id)
+
+@app.server.route('/api/upload/<upload_id>/complete', methods=['POST'])
+def complete_chunked_upload(upload_id):
+    meta = load_upload_meta(upload_id)
+    if meta is None:
+        return {'error': "Upload inconnu."}, 404
+    part_path, meta_path = upload_paths(upload_id)
+    received = os.path.getsize(part_path)
+    if received != meta['size']:
+        return {'error': "Fichier incomplet.", 'received': received}, 409
+
+    def report_progress(bytes_read, total_bytes, rows_read):
+        UPLOAD_STATUS[upload_id] = {'phase': 'parsing', 'bytes_read': bytes_read, 'total_bytes': total_bytes, 'rows_read': rows_read}
+
+    try:
+        # Même logique d'analyse que la zone de dépôt, directement depuis le fichier reçu
+        df = read_uploaded_file(part_path, meta['filename'], report_progress)
+        df, dtype_report = ingest_dataframe(df)
+        store = register_dataset(df)
+        # Statistiques et esquisses construites dès l'import
+        get_dataset_stats(store, df)
+    except Exception as e:
+        return {'error': f"Erreur lors du chargement: {str(e)}"}, 400
+    finally:
+        UPLOAD_STATUS.pop(upload_id, None)
+
+    for path in (part_path, meta_path):
+        os.remove(path)
+    return {'store': store, 'filename': meta['filename'], 'message': upload_success_message(dtype_report)}
+
+#-------------------------------------------------------------
+# Tables paginées côté serveur (pagination, tri et filtre pandas)
+#-------------------------------------------------------------
+# Le navigateur ne reçoit que la page affichée ; le tri et le filtre sont évalués en pandas
+# et l'ordre des lignes obtenu est mis en cache, les changements de page restent donc en O(page).
+TABLE_PAGE_SIZE = 10
+TABLE_VIEW_CACHE = OrderedDict()
+TABLE_VIEW_CACHE_SIZE = 32
+TABLE_VIEW_LOCK = threading.Lock()
+FILTER_OPERATORS = [['ge ', '>='], ['le ', '<='], ['lt ', '<'], ['gt ', '>'], ['ne ', '!='], ['eq ', '='],
+                    ['contains '], ['datestartswith ']]
+
+def split_filter_part(filter_part):
+    """Split one DataTable filter expression into (column, operator, value)"""
+    for operator_type in FILTER_OPERATORS:
+        for operator in operator_type:
+            if operator in filter_part:
+                name_part, value_part = filter_part.split(operator, 1)
+                name = name_part[name_part.find('{') + 1: name_part.rfind('}')]
+                value_part = value_part.strip()
+                v0 = value_part[0] if value_part else ''
+                if v0 and v0 == value_part[-1] and v0 in ("'", '"', '`'):
+                    value = value_part[1: -1].replace('\\' + v0, v0)
+                else:
+                    try:
+                        value = float(value_part)
+                    except ValueError:
+                        value = value_part
+                return name, operator_type[0].strip(), value
+    return None, None, None
+
+def evaluate_filter(series, operator, value):
+    """Evaluate one filter operator on a Series and return a boolean numpy array"""
+    if isinstance(value, float) and pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        values = series
+    else:
+        # Comparaison textuelle ('5' et non '5.0' pour une valeur saisie entière)
+        values = series.astype(str)
+        value = str(int(value)) if isinstance(value, float) and value.is_integer() else str(value)
+    if operator == 'contains':
+        part = values.astype(str).str.contains(str(value), case=False, regex=False)
+    elif operator == 'datestartswith':
+        part = values.astype(str).str.startswith(str(value))
+    elif operator == 'eq':
+        part = values == value
+    elif operator == 'ne':
+        part = values != value
+    elif operator == 'lt':
+        part = values < value
+    elif operator == 'le':
+        part = values <= value
+    elif operator == 'gt':
+        part = values > value
+    else:
+        part = values >= value
+    return part.fillna(False).to_numpy(dtype=bool)
+
+def filter_mask(df, filter_query):
+    """Evaluate a DataTable filter_query on the DataFrame and return a boolean mask"""
+    mask = np.ones(len(df), dtype=bool)
+    for filter_part in filter_query.split(' && '):
+        col, operator, value = split_filter_part(filter_part)
+        if col not in df.columns:
+            continue
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Filtre évalué une seule fois par catégorie puis propagé par les codes
+            category_part = evaluate_filter(pd.Series(series.cat.categories), operator, value)
+            codes = series.cat.codes.to_numpy()
+            mask &= (codes >= 0) & category_part[np.maximum(codes, 0)]
+        else:
+            mask &= evaluate_filter(series, operator, value)
+    return mask
+
+def resolve_table_rows(dataset_id, df, sort_by, filter_query):
+    """Return the row positions matching the filter in sort order (None = all rows, natural order)"""
+    if not sort_by and not filter_query:
+        return None
+    key = (dataset_id, json.dumps(sort_by or []), filter_query or '')
+    with TABLE_VIEW_LOCK:
+        if key in TABLE_VIEW_CACHE:
+            TABLE_VIEW_CACHE.move_to_end(key)
+            return TABLE_VIEW_CACHE[key]
+
+    positions = np.arange(len(df))
+    if filter_query:
+        positions = np.flatnonzero(filter_mask(df, filter_query))
+    sort_cols = [s['column_id'] for s in (sort_by or []) if s['column_id'] in df.columns]
+    if sort_cols:
+        subset = df[sort_cols].iloc[positions].reset_index(drop=True)
+        order = subset.sort_values(
+            sort_cols,
+            ascending=[s['direction'] == 'asc' for s in sort_by if s['column_id'] in df.columns],
+            kind='mergesort',
+            na_position='last'
+        ).index.to_numpy()
+        positions = positions[order]
+
+    with TABLE_VIEW_LOCK:
+        TABLE_VIEW_CACHE[key] = positions
+        while len(TABLE_VIEW_CACHE) > TABLE_VIEW_CACHE_SIZE:
+            TABLE_VIEW_CACHE.popitem(last=False)
+    return positions
+
+def query_table_page(stored_data, columns, page_current, page_size, sort_by, filter_query):
+    """Return (records of the requested page, page count) for a server-side paginated DataTable"""
+    df = get_dataset(stored_data)
+    if df is None:
+        return [], 1
+    page_current = page_current or 0
+    page_size = page_size or TABLE_PAGE_SIZE
+    positions = resolve_table_rows(stored_data['dataset_id'], df, sort_by, filter_query)
+    n_rows = len(df) if positions is None else len(positions)
+    start = page_current * page_size
+    if positions is None:
+        page = df.iloc[start:start + page_size]
+    else:
+        page = df.iloc[positions[start:start + page_size]]
+    page_count = max(1, -(-n_rows // page_size))
+    return page[columns].to_dict('records'), page_count
+
+def table_column_spec(df, col):
+    """DataTable column definition with the column type used by the custom filter"""
+    if pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col]):
+        return {
+            'name': col,
+            'id': col,
+            'type': 'numeric',
+            'format': dash_table.Format.Format(
+                precision=2,
+                scheme=dash_table.Format.Scheme.fixed
+            )
+        }
+    if pd.api.types.is_datetime64_any_dtype(df[col]):
+        return {'name': col, 'id': col, 'type': 'datetime'}
+    return {'name': col, 'id': col, 'type': 'text'}
+
+def build_upload_preview(df):
+    """DataTable shown under the upload zone, paginated on the server"""
+    return dash_table.DataTable(
+        id='upload-preview-table',
+        data=df.head(TABLE_PAGE_SIZE).to_dict('records'),
+        columns=[table_column_spec(df, col) for col in df.columns],
+        page_action='custom',
+        page_current=0,
+        page_size=TABLE_PAGE_SIZE,
+        page_count=max(1, -(-len(df) // TABLE_PAGE_SIZE)),
+        sort_action='custom',
+        sort_mode='multi',
+        sort_by=[],
+        filter_action='custom',
+        filter_query='',
+        style_table={'overflowX': 'auto'}
+    )
+
 @app.callback(
     [Output('store-data', 'data'),  # Réinitialiser ou mettre à jour les données dans le store
      Output('output-data-table', 'children'),  # Mettre à jour la table
      Output('output-message', 'children')],  # Mettre à jour le message
     [Input('upload-data', 'contents'),  # Gestion du téléchargement de fichier
-     Input('reset-btn', 'n_clicks')],  # Action sur le bouton "Réinitialiser"
+     Input('reset-btn', 'n_clicks'),  # Action sur le bouton "Réinitialiser"
+     Input('chunked-upload-result', 'data')],  # Fin d'un envoi par morceaux
     State('upload-data', 'filename'),  # État pour récupérer le nom du fichier
     prevent_initial_call=True  # Empêche l'exécution lors du démarrage
 )
 
-def handle_upload_and_reset(contents, reset_clicks, filename):
+def handle_upload_and_reset(contents, reset_clicks, chunked_result, filename):
     triggered_id = callback_context.triggered[0]['prop_id'].split('.')[0]
 
     if triggered_id == 'reset-btn' and reset_clicks:
@@ -1458,40 +4046,37 @@ def handle_upload_and_reset(contents, reset_clicks, filename):
         global_df = None
         return None, "", "Les données ont été réinitialisées."
 
+    if triggered_id == 'chunked-upload-result' and chunked_result:
+        # Le fichier a déjà été analysé et enregistré par la route de finalisation
+        if chunked_result.get('error'):
+            return None, "", chunked_result['error']
+        df = get_dataset(chunked_result.get('store'))
+        if df is None:
+            return None, "", "Erreur lors du chargement: jeu de données introuvable."
+        return chunked_result['store'], build_upload_preview(df), chunked_result['message']
+
     if triggered_id == 'upload-data' and contents:
-        content_type, content_string = contents.split(',')
-        decoded = base64.b64decode(content_string)
+        if not filename.endswith(SUPPORTED_EXTENSIONS):
+            return None, "", "Format de fichier non supporté."
 
         try:
-            if filename.endswith('.csv'):
-                df = pd.read_csv(io.StringIO(decoded.decode('utf-8')))
-            elif filename.endswith(('.xls', '.xlsx')):
-                df = pd.read_excel(io.BytesIO(decoded))
-            elif filename.endswith('.txt'):
-                df = pd.read_csv(io.StringIO(decoded.decode('utf-8')), delimiter='\t')
-            else:
-                return None, "", "Format de fichier non supporté."
-
-            # Format numeric values before storing
-            df = format_numeric_values(df)
+            # Décodage sur disque puis lecture par blocs
+            upload_path = spool_base64_upload(contents)
+            try:
+                df = read_uploaded_file(upload_path, filename)
+            finally:
+                os.remove(upload_path)
+
+            # Types compacts conservés pendant toute la durée de vie du jeu de données
+            df, dtype_report = ingest_dataframe(df)
+            store = register_dataset(df)
+            # Statistiques et esquisses construites dès l'import
+            get_dataset_stats(store, df)
             
             return (
-                df.to_dict('records'),
-                dash_table.DataTable(
-                    data=df.to_dict('records'),
-                    columns=[{
-                        'name': col,
-                        'id': col,
-                        'type': 'numeric',
-                        'format': dash_table.Format.Format(
-                            precision=2,
-                            scheme=dash_table.Format.Scheme.fixed
-                        ) if pd.api.types.is_numeric_dtype(df[col]) else {}
-                    } for col in df.columns],
-                    page_size=10,
-                    style_table={'overflowX': 'auto'}
-                ),
-                "Fichier chargé avec succès!"
+                store,
+                build_upload_preview(df),
+                upload_success_message(dtype_report)
             )
 
         except Exception as e:
@@ -1503,17 +4088,32 @@ def handle_upload_and_reset(contents, reset_clicks, filename):
 # Callback pour filtrer les variables en fonction de la recherche
 #----------------------------------------------------------------
 
+@app.callback(
+    [Output('upload-preview-table', 'data'),
+     Output('upload-preview-table', 'page_count')],
+    [Input('upload-preview-table', 'page_current'),
+     Input('upload-preview-table', 'page_size'),
+     Input('upload-preview-table', 'sort_by'),
+     Input('upload-preview-table', 'filter_query')],
+    State('store-data', 'data'),
+    prevent_initial_call=True
+)
+def page_upload_preview(page_current, page_size, sort_by, filter_query, stored_data):
+    df = get_dataset(stored_data)
+    if df is None:
+        raise PreventUpdate
+    return query_table_page(stored_data, list(df.columns), page_current, page_size, sort_by, filter_query)
+
 @app.callback(
     Output('filtered-table', 'children'),
     Input('search-input', 'value'),
     State('store-data', 'data')  # Utilisation du composant dcc.Store pour récupérer les données
 )
 def filter_table(search_value, stored_data):
-    if search_value is None or not stored_data:
+    # Récupération du jeu de données référencé par le store
+    global_df = get_dataset(stored_data)
+    if search_value is None or global_df is None:
         return ""  # Si aucune donnée ou aucune recherche, on ne fait rien
-    
-    # Récupération des données stockées dans le store
-    global_df = pd.DataFrame(stored_data)
 
     # Filtrage des variables par le nom (en fonction de la recherche)
     filtered_df = global_df.loc[:, global_df.columns.str.contains(search_value, case=False)]
@@ -1521,16 +4121,41 @@ def filter_table(search_value, stored_data):
     if filtered_df.empty:
         return html.Div("Aucune variable trouvée.")  # Si aucun résultat, affiche un message
 
-    # Retourne une table avec les résultats filtrés
+    # Retourne une table avec les résultats filtrés (seule la page affichée est envoyée)
     return dash_table.DataTable(
-        data=filtered_df.to_dict('records'),
-        columns=[{'name': i, 'id': i} for i in filtered_df.columns],
+        id='filtered-data-table',
+        data=filtered_df.head(TABLE_PAGE_SIZE).to_dict('records'),
+        columns=[table_column_spec(filtered_df, i) for i in filtered_df.columns],
         style_table={'overflowX': 'auto', 'margin': '0 auto', 'width': '80%'},  # Style de la table
         style_cell={'textAlign': 'center', 'padding': '10px', 'fontSize': '14px', 'border': '1px solid #ddd'},
         style_header={'backgroundColor': '#f1f1f1', 'fontWeight': 'bold', 'textAlign': 'center'},
-        page_size=10
+        page_action='custom',
+        page_current=0,
+        page_size=TABLE_PAGE_SIZE,
+        page_count=max(1, -(-len(filtered_df) // TABLE_PAGE_SIZE)),
+        sort_action='custom',
+        sort_mode='multi',
+        sort_by=[],
+        filter_action='custom',
+        filter_query=''
     )
 
+@app.callback(
+    [Output('filtered-data-table', 'data'),
+     Output('filtered-data-table', 'page_count')],
+    [Input('filtered-data-table', 'page_current'),
+     Input('filtered-data-table', 'page_size'),
+     Input('filtered-data-table', 'sort_by'),
+     Input('filtered-data-table', 'filter_query')],
+    [State('filtered-data-table', 'columns'),
+     State('store-data', 'data')],
+    prevent_initial_call=True
+)
+def page_filtered_table(page_current, page_size, sort_by, filter_query, columns, stored_data):
+    if get_dataset(stored_data) is None or not columns:
+        raise PreventUpdate
+    return query_table_page(stored_data, [c['id'] for c in columns], page_current, page_size, sort_by, filter_query)
+
 @app.callback(
     Output('url', 'pathname'),
     Input('summary-btn', 'n_clicks'),
@@ -1563,16 +4188,18 @@ def navigate_to_summary(n_clicks):
 def show_preprocessing_interface(btn_missing, btn_replace, btn_convert, btn_normalize, 
                                 btn_deduplicate, stored_data):
     ctx = callback_context
-    if not stored_data:
+    # Seules les premières lignes sont évaluées : types et noms des colonnes
+    df = pipeline_preview(stored_data)
+    if df is None:
         return dbc.Alert("Veuillez d'abord charger des données", color='danger'), None
 
     triggered_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    df = pd.DataFrame(stored_data)
     output_content = html.Div()
     confirmation_button = None
 
     if triggered_id == 'btn-missing':
-     missing = df.isnull().sum()
+     dataset_stats = get_dataset_stats(stored_data)
+     missing = pd.Series({col: col_stats['nulls'] for col, col_stats in dataset_stats['columns'].items()}, dtype='int64')
      missing = missing[missing > 0].sort_values(ascending=False)
     
      if missing.empty:
@@ -1581,8 +4208,8 @@ def show_preprocessing_interface(btn_missing, btn_replace, btn_convert, btn_norm
         missing_df = pd.DataFrame({
             "Variable": missing.index,
             "Valeurs manquantes": missing.values.astype(int),  # Conversion en entier
-            "% Manquant": (missing / len(df) * 100).round(2),
-            "Type": [str(df[col].dtype) for col in missing.index]
+            "% Manquant": (missing / dataset_stats['n_rows'] * 100).round(2),
+            "Type": [dataset_stats['columns'][col]['dtype'] for col in missing.index]
         })
         
         # Création du graphique avec des valeurs entières
@@ -1638,10 +4265,10 @@ def show_preprocessing_interface(btn_missing, btn_replace, btn_convert, btn_norm
         ])
 
     elif triggered_id == 'btn-replace':
-     missing_count = df.isnull().sum()
-     numeric_missing = df.select_dtypes(include=['number']).columns[df.select_dtypes(include=['number']).isnull().any()].tolist()
-     categorical_missing = df.select_dtypes(include=['object', 'category']).columns[df.select_dtypes(include=['object', 'category']).isnull().any()].tolist()
-     all_missing = df.columns[df.isnull().any()].tolist()
+     dataset_stats = get_dataset_stats(stored_data)
+     numeric_missing = columns_of_kind(dataset_stats, 'numeric', with_missing=True)
+     categorical_missing = columns_of_kind(dataset_stats, 'qualitative', with_missing=True)
+     all_missing = columns_of_kind(dataset_stats, 'numeric', 'boolean', 'qualitative', 'datetime', 'other', with_missing=True)
     
      if not all_missing:
         output_content = dbc.Alert("Aucune valeur manquante à remplacer.", color="info")
@@ -1692,7 +4319,9 @@ def show_preprocessing_interface(btn_missing, btn_replace, btn_convert, btn_norm
                                 )
                             ], width=6)
                         ], className="mt-2"),
-                        html.P("Utilise la métrique 'nan_euclidean', optimisée pour les données avec valeurs manquantes.",
+                        html.P("Voisins cherchés parmi les lignes complètes, distance euclidienne sur les variables "
+                               "renseignées de chaque ligne (sans ligne complète : parmi les lignes où la "
+                               "variable est renseignée, sur les variables communes).",
                                className="text-muted small mt-2")
                     ], className="mt-3", style={'border': '1px solid #eee', 'padding': '10px', 'borderRadius': '5px'})
                 ], style={'border-right': '1px solid #ddd', 'padding-right': '15px', 'height': '100%'})  # Séparateur 1
@@ -1754,7 +4383,22 @@ def show_preprocessing_interface(btn_missing, btn_replace, btn_convert, btn_norm
             method_boxes,
             html.Div(id='replace-validation', className="text-danger mb-3"),
             html.Div(id='replace-preview', className="mt-3"),
-            html.Div(id='replace-confirm-button-container')
+            html.Div(id='replace-confirm-button-container'),
+            html.Hr(),
+            html.H5("Appliquer un plan d'imputation enregistré", className="text-primary"),
+            dcc.Upload(
+                id='upload-imputation-plan',
+                children=html.Div([
+                    html.Span("Déposez un plan (.arrow) ici ou "),
+                    html.A("cliquez pour sélectionner un fichier", className="text-primary fw-bold")
+                ]),
+                style={'width': '100%', 'padding': '10px', 'borderWidth': '1px', 'borderStyle': 'dashed',
+                       'borderRadius': '5px', 'textAlign': 'center', 'backgroundColor': '#f8f9fa', 'cursor': 'pointer'},
+                accept='.arrow',
+                multiple=False
+            ),
+            html.P("Les valeurs de remplacement du plan sont réutilisées telles quelles, sans réapprentissage sur ces données.",
+                   className="text-muted small mt-2")
         ])
     ])
      
@@ -1838,11 +4482,13 @@ def show_preprocessing_interface(btn_missing, btn_replace, btn_convert, btn_norm
      return output_content, None
     
     elif triggered_id == 'btn-normalize':
-     output_content = create_normalization_interface(pd.DataFrame(stored_data))
+     output_content = create_normalization_interface(df)
      return output_content, None  # Ajout de None pour la deuxième sortie
 
     elif triggered_id == 'btn-deduplicate':
-     dup_count = df.duplicated().sum()
+     # Lignes conservées mémorisées : réutilisées si le dédoublonnage porte sur toutes les colonnes
+     dedupe_store = record_step(stored_data, {'op': 'dedupe', 'subset': None, 'keep': 'first'})
+     dup_count = stored_data['n_rows'] - pipeline_row_count(dedupe_store)
     
      output_content = dbc.Card([
         dbc.CardHeader(
@@ -1883,7 +4529,8 @@ def show_preprocessing_interface(btn_missing, btn_replace, btn_convert, btn_norm
     prevent_initial_call=True
 )
 def show_modes(n_clicks, stored_data):
-    if not n_clicks or not stored_data:
+    df = get_dataset(stored_data)
+    if not n_clicks or df is None:
         raise PreventUpdate
     
     # Get the replace-mode value directly from the callback context if it exists
@@ -1896,7 +4543,6 @@ def show_modes(n_clicks, stored_data):
     if not mode_cols:
         raise PreventUpdate
     
-    df = pd.DataFrame(stored_data)
     modes_data = []
     
     for col in mode_cols:
@@ -1941,7 +4587,8 @@ def show_modes(n_clicks, stored_data):
     prevent_initial_call=True
 )
 def update_preview_on_selection(mean_cols, knn_cols, zero_cols, mode_cols, knn_neighbors, knn_aggregation, stored_data):
-    if not stored_data:
+    df = get_dataset(stored_data)
+    if df is None:
         raise PreventUpdate
     
     # Initialize all variables as lists if they are None
@@ -1955,7 +4602,6 @@ def update_preview_on_selection(mean_cols, knn_cols, zero_cols, mode_cols, knn_n
     # Now we can safely concatenate all lists
     all_selected = mean_cols + knn_cols + zero_cols + mode_cols
     
-    df = pd.DataFrame(stored_data)
     validation_msg = ""
     preview_content = html.Div()
     
@@ -1965,43 +4611,32 @@ def update_preview_on_selection(mean_cols, knn_cols, zero_cols, mode_cols, knn_n
     if duplicates:
         validation_msg = f"Erreur: Variables sélectionnées dans plusieurs méthodes: {', '.join(set(duplicates))}"
     
-    # Vérification des variables non traitées
-    missing_cols = df.columns[df.isnull().any()].tolist()
-    untreated = set(missing_cols) - set(all_selected)
+    # Vérification des variables non traitées (effectifs de manquants déjà calculés)
+    missing_sample = missing_value_sample(stored_data, df)
+    untreated = set(missing_sample) - set(all_selected)
     
     if untreated and not duplicates:
         validation_msg = f"Attention: Variables sans méthode sélectionnée: {', '.join(untreated)}"
     
-    # Prévisualisation des modifications
+    # Prévisualisation des modifications, limitée aux premières valeurs manquantes de chaque variable
     if not validation_msg and (mean_cols or knn_cols or zero_cols or mode_cols):
-        preview_df = df.copy()
-        modified_rows = set()
         preview_data = []
         
         # Traitement par la moyenne
         for col in mean_cols:
-            na_indices = preview_df[col].isnull()
-            mean_val = preview_df[col].mean()
-            preview_df.loc[na_indices, col] = mean_val
-            modified_rows.update(preview_df.index[na_indices].tolist())
-            
-            # Ajout à la prévisualisation
-            for idx in preview_df.index[na_indices][:3]:  # Limité à 3 exemples par colonne
+            mean_val = fill_value(stored_data, df, col, 'mean')
+            for idx in df.index[missing_sample.get(col, [])]:
                 preview_data.append({
                     'Variable': col,
                     'Index': idx,
                     'Avant': 'NA',
-                    'Après': f"{preview_df.loc[idx, col]:.2f}",
+                    'Après': f"{mean_val:.2f}",
                     'Méthode': 'Moyenne'
                 })
         
         # Traitement par zéro
         for col in zero_cols:
-            na_indices = preview_df[col].isnull()
-            preview_df.loc[na_indices, col] = 0
-            modified_rows.update(preview_df.index[na_indices].tolist())
-            
-            for idx in preview_df.index[na_indices][:3]:
+            for idx in df.index[missing_sample.get(col, [])]:
                 preview_data.append({
                     'Variable': col,
                     'Index': idx,
@@ -2012,46 +4647,36 @@ def update_preview_on_selection(mean_cols, knn_cols, zero_cols, mode_cols, knn_n
         
         # Traitement par le mode (variables qualitatives)
         for col in mode_cols:
-            na_indices = preview_df[col].isnull()
-            if na_indices.any():
-                mode_val = preview_df[col].mode()
-                if not mode_val.empty:
-                    mode_val = mode_val.iloc[0]
-                    preview_df.loc[na_indices, col] = mode_val
-                    modified_rows.update(preview_df.index[na_indices].tolist())
-                    
-                    for idx in preview_df.index[na_indices][:3]:
-                        preview_data.append({
-                            'Variable': col,
-                            'Index': idx,
-                            'Avant': 'NA',
-                            'Après': str(mode_val),
-                            'Méthode': 'Mode'
-                        })
+            mode_val = fill_value(stored_data, df, col, 'mode')
+            if mode_val is not None:
+                for idx in df.index[missing_sample.get(col, [])]:
+                    preview_data.append({
+                        'Variable': col,
+                        'Index': idx,
+                        'Avant': 'NA',
+                        'Après': str(mode_val),
+                        'Méthode': 'Mode'
+                    })
         
-        # Traitement KNN (seulement numérique)
+        # Traitement KNN (seulement numérique), sur les seules lignes affichées
         if knn_cols:
-            numeric_cols = preview_df.select_dtypes(include=['number']).columns.tolist()
+            numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
             knn_cols = [col for col in knn_cols if col in numeric_cols]
             
             if knn_cols:
                 try:
-                    numeric_data = preview_df[numeric_cols].copy()
-                    imputer = KNNImputer(n_neighbors=knn_neighbors, weights='uniform')
-                    imputed_values = imputer.fit_transform(numeric_data)
+                    positions = np.unique(np.concatenate([missing_sample.get(col, []) for col in knn_cols])).astype(int)
+                    imputed_cols, imputed_values = knn_preview_values(stored_data, df, knn_cols, positions,
+                                                                      knn_neighbors, knn_aggregation)
                     
-                    for i, col in enumerate(numeric_cols):
-                        if col in knn_cols:
-                            na_indices = preview_df[col].isnull()
-                            preview_df.loc[na_indices, col] = imputed_values[na_indices.values, i]
-                            modified_rows.update(preview_df.index[na_indices].tolist())
-                            
-                            for idx in preview_df.index[na_indices][:3]:
+                    for i, col in enumerate(imputed_cols):
+                        for row, position in enumerate(positions):
+                            if position in missing_sample.get(col, []):
                                 preview_data.append({
                                     'Variable': col,
-                                    'Index': idx,
+                                    'Index': df.index[position],
                                     'Avant': 'NA',
-                                    'Après': f"{preview_df.loc[idx, col]:.2f}",
+                                    'Après': f"{imputed_values[row, i]:.2f}",
                                     'Méthode': 'KNN'
                                 })
                 except Exception as e:
@@ -2099,10 +4724,10 @@ def update_preview_on_selection(mean_cols, knn_cols, zero_cols, mode_cols, knn_n
      State('replace-mode', 'value'),
      State('knn-n-neighbors', 'value'),
      State('knn-aggregation', 'value')],
-    prevent_initial_call=True
+    **job_callback('cleaning', 'btn-confirm-replace')
 )
-def apply_cleaning(n_clicks, stored_data, mean_cols, knn_cols, zero_cols, mode_cols, knn_neighbors, knn_aggregation):
-    if not n_clicks or not stored_data:
+def apply_cleaning(set_progress, n_clicks, stored_data, mean_cols, knn_cols, zero_cols, mode_cols, knn_neighbors, knn_aggregation):
+    if not n_clicks or not pipeline_available(stored_data):
         raise PreventUpdate
     
     # Initialize all variables as lists if they are None
@@ -2117,8 +4742,24 @@ def apply_cleaning(n_clicks, stored_data, mean_cols, knn_cols, zero_cols, mode_c
     if not any([mean_cols, knn_cols, zero_cols, mode_cols]):
         return stored_data, html.Div("Veuillez sélectionner au moins une méthode de remplacement.", className="alert alert-warning")
     
-    df_original = pd.DataFrame(stored_data)
-    df = df_original.copy()
+    # L'imputation peut durer plusieurs minutes : elle s'exécute en arrière-plan
+    result, failure = run_job(set_progress, clean_dataset, stored_data, mean_cols, knn_cols, zero_cols, mode_cols,
+                              knn_neighbors, knn_aggregation)
+    return (no_update, failure) if failure is not None else result
+
+def clean_dataset(job, stored_data, mean_cols, knn_cols, zero_cols, mode_cols, knn_neighbors, knn_aggregation):
+    """Background job: fit the replacement of missing values and record it as a pipeline step; returns the new store-data and the summary to display"""
+    df = get_dataset(stored_data)
+    if df is None:
+        raise ValueError("Données expirées, veuillez recharger le fichier")
+    
+    # Le plan est appris sur la version courante ; les valeurs ne sont remplacées qu'à la lecture du jeu
+    report_progress(job, 0.05, "Calcul des valeurs de remplacement...")
+    stats_before = get_dataset_stats(stored_data, df)
+    try:
+        plan = fit_imputation_plan(stored_data, df, mean_cols, knn_cols, zero_cols, mode_cols, knn_neighbors, knn_aggregation)
+    except ValueError as e:
+        return stored_data, html.Div(f"Erreur lors de l'imputation KNN : {str(e)}", className="alert alert-danger")
     
     # Dictionaries to store changes for each method
     mean_changes = []
@@ -2126,73 +4767,23 @@ def apply_cleaning(n_clicks, stored_data, mean_cols, knn_cols, zero_cols, mode_c
     zero_changes = []
     mode_changes = []
     
-    # Apply mean replacement
-    for col in mean_cols:
-        if col in df.columns and df[col].isna().any():
-            missing_before = df[col].isna().sum()
-            mean_value = df[col].mean()
-            df[col] = df[col].fillna(mean_value)
-            missing_after = df[col].isna().sum()
-            if missing_before > missing_after:
-                mean_changes.append({
-                    'Variable': col,
-                    'Valeurs manquantes avant': missing_before,
-                    'Valeurs manquantes après': missing_after,
-                    'Moyenne utilisée': f"{mean_value:.2f}"
-                })
-    
-    # Apply KNN imputation
-    if knn_cols:
-        try:
-            numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-            knn_cols = [col for col in knn_cols if col in numeric_cols]
-            
-            if knn_cols:
-                missing_before_dict = {col: df[col].isna().sum() for col in knn_cols}
-                
-                imputer = KNNImputer(n_neighbors=knn_neighbors, weights='uniform')
-                df[knn_cols] = imputer.fit_transform(df[knn_cols])
-                
-                for col in knn_cols:
-                    missing_after = df[col].isna().sum()
-                    if missing_before_dict[col] > missing_after:
-                        knn_changes.append({
-                            'Variable': col,
-                            'Valeurs manquantes avant': missing_before_dict[col],
-                            'Valeurs manquantes après': missing_after,
-                            'Paramètres KNN': f"k={knn_neighbors}, {knn_aggregation}"
-                        })
-        except Exception as e:
-            return stored_data, html.Div(f"Erreur lors de l'imputation KNN : {str(e)}", className="alert alert-danger")
-    
-    # Apply zero replacement
-    for col in zero_cols:
-        if col in df.columns and df[col].isna().any():
-            missing_before = df[col].isna().sum()
-            df[col] = df[col].fillna(0)
-            missing_after = df[col].isna().sum()
-            if missing_before > missing_after:
-                zero_changes.append({
-                    'Variable': col,
-                    'Valeurs manquantes avant': missing_before,
-                    'Valeurs manquantes après': missing_after
-                })
-    
-    # Apply mode replacement
-    for col in mode_cols:
-        if col in df.columns and df[col].isna().any():
-            missing_before = df[col].isna().sum()
-            mode_value = df[col].mode().values
-            if len(mode_value) > 0:
-                df[col] = df[col].fillna(mode_value[0])
-                missing_after = df[col].isna().sum()
-                if missing_before > missing_after:
-                    mode_changes.append({
-                        'Variable': col,
-                        'Valeurs manquantes avant': missing_before,
-                        'Valeurs manquantes après': missing_after,
-                        'Mode utilisé': str(mode_value[0])
-                    })
+    for step, missing_before, missing_after in plan_changes(plan, stats_before['columns']):
+        change = {
+            'Variable': step['column'],
+            'Valeurs manquantes avant': missing_before,
+            'Valeurs manquantes après': missing_after
+        }
+        if step['method'] == 'mean':
+            change['Moyenne utilisée'] = f"{step['value']:.2f}"
+            mean_changes.append(change)
+        elif step['method'] == 'knn':
+            change['Paramètres KNN'] = f"k={knn_neighbors}, {knn_aggregation}"
+            knn_changes.append(change)
+        elif step['method'] == 'zero':
+            zero_changes.append(change)
+        else:
+            change['Mode utilisé'] = str(step['value'])
+            mode_changes.append(change)
     
     # Create the summary tables
     tables = []
@@ -2248,9 +4839,21 @@ def apply_cleaning(n_clicks, stored_data, mean_cols, knn_cols, zero_cols, mode_c
     if not any([mean_changes, knn_changes, zero_changes, mode_changes]):
         return stored_data, html.Div("Aucune valeur manquante n'a été trouvée dans les colonnes sélectionnées.", className="alert alert-info")
     
+    # L'étape enregistrée référence le plan : il est écrit pour que tout worker puisse recalculer le pipeline
+    report_progress(job, 0.1, "Enregistrement du plan d'imputation...")
+    register_imputation_plan(plan)
+    plan_id = plan['plan_id']
+    new_store = record_step(stored_data, {'op': 'impute', 'plan_id': plan_id,
+                                          'columns': [step['column'] for step in plan['steps']]})
+    # Imputation calculée ici (avancement et annulation) plutôt qu'à la première lecture
+    report_progress(job, 0.15, "Remplacement des valeurs manquantes...")
+    compute_job_dataset(new_store, progress=lambda fraction: report_progress(job, 0.15 + 0.8 * fraction))
+    
     # Create the final summary
-    total_missing_before = df_original.isna().sum().sum()
-    total_missing_after = df.isna().sum().sum()
+    total_missing_before = sum(col_stats['nulls'] for col_stats in stats_before['columns'].values())
+    total_filled = sum(change['Valeurs manquantes avant'] - change['Valeurs manquantes après']
+                       for change in mean_changes + knn_changes + zero_changes + mode_changes)
+    total_missing_after = total_missing_before - total_filled
     
     summary = html.Div([
         html.H4("Résumé des modifications", className="text-primary mb-4"),
@@ -2261,13 +4864,96 @@ def apply_cleaning(n_clicks, stored_data, mean_cols, knn_cols, zero_cols, mode_c
         ], className="alert alert-success mb-4")
     ])
     
+    plan_card = dbc.Card([
+        dbc.CardHeader("Plan d'imputation"),
+        dbc.CardBody([
+            html.P("Les valeurs de remplacement apprises sur ces données peuvent être appliquées, "
+                   "sans réapprentissage, à un autre fichier de même structure.", className="text-muted"),
+            html.P(f"Plan : {plan_id} ({len(plan['steps'])} variables, {len(plan['donors'])} lignes de référence KNN"
+                   + (", partiellement renseignées : aucune ligne complète" if np.isnan(plan['donors']).any() else "")
+                   + ")"),
+            html.A("Télécharger le plan (.arrow)", href=f"/api/plans/{plan_id}", className="fw-bold"),
+            html.P(["Lots de lignes supplémentaires (CSV) : ", html.Code(f"POST /api/plans/{plan_id}/apply"),
+                    " (une dernière ligne ", html.Code(PLAN_STREAM_ERROR_MARKER),
+                    " signale un lot invalide)"],
+                   className="small mt-2 mb-0")
+        ])
+    ], className="mt-4")
+    
     # Combine all tables
     result_content = html.Div([
         summary,
-        *tables
+        *tables,
+        plan_card
     ])
     
-    return df.to_dict('records'), result_content
+    return new_store, result_content
+
+@app.callback(
+    [Output('store-data', 'data', allow_duplicate=True),
+     Output('preprocessing-output', 'children', allow_duplicate=True)],
+    Input('upload-imputation-plan', 'contents'),
+    State('store-data', 'data'),
+    **job_callback('plan', 'upload-imputation-plan')
+)
+def apply_uploaded_plan(set_progress, contents, stored_data):
+    if not contents or not pipeline_available(stored_data):
+        raise PreventUpdate
+    path = spool_base64_upload(contents)
+    try:
+        plan = read_imputation_plan(path)
+    except ValueError as e:
+        return no_update, dbc.Alert(f"Erreur : {str(e)}", color="danger")
+    finally:
+        os.remove(path)
+    # Nouvel identifiant : un fichier importé ne remplace jamais un plan déjà référencé par un pipeline
+    plan['plan_id'] = uuid.uuid4().hex
+    register_imputation_plan(plan)
+    result, failure = run_job(set_progress, apply_imputation_plan, stored_data, plan['plan_id'])
+    return (no_update, failure) if failure is not None else result
+
+def apply_imputation_plan(job, stored_data, plan_id):
+    """Background job: record a saved plan as a pipeline step; returns the new store-data and the summary"""
+    if not pipeline_available(stored_data):
+        raise ValueError("Données expirées, veuillez recharger le fichier")
+    plan = get_imputation_plan(plan_id)
+    if plan is None:
+        raise ValueError("Plan d'imputation introuvable")
+    
+    report_progress(job, 0.05, "Vérification du plan d'imputation...")
+    stats_before = get_dataset_stats(stored_data)
+    absent = [step['column'] for step in plan['steps'] if step['column'] not in stats_before['columns']]
+    if absent:
+        raise ValueError(f"Colonnes du plan absentes du jeu de données : {', '.join(absent)}")
+    
+    knn = plan['knn']
+    changes = [{
+        'Variable': step['column'],
+        'Méthode': PLAN_METHOD_LABELS[step['method']],
+        'Valeurs manquantes avant': missing_before,
+        'Valeurs manquantes après': missing_after,
+        'Valeur utilisée': f"k={knn['n_neighbors']}, {knn['aggregation']}" if step['method'] == 'knn' else str(step['value'])
+    } for step, missing_before, missing_after in plan_changes(plan, stats_before['columns'])]
+    if not changes:
+        return stored_data, html.Div("Aucune valeur manquante n'a été trouvée dans les colonnes du plan.", className="alert alert-info")
+    
+    # Imputation calculée ici (avancement et annulation) plutôt qu'à la première lecture
+    new_store = record_step(stored_data, {'op': 'impute', 'plan_id': plan_id,
+                                          'columns': [step['column'] for step in plan['steps']]})
+    report_progress(job, 0.1, "Application du plan d'imputation...")
+    compute_job_dataset(new_store, progress=lambda fraction: report_progress(job, 0.1 + 0.85 * fraction))
+    
+    return new_store, html.Div([
+        html.H4("Plan d'imputation appliqué", className="text-primary mb-4"),
+        html.P(f"Plan {plan_id}, appris le {plan['created']} sur {plan['source_rows']} lignes.", className="alert alert-success mb-4"),
+        dash_table.DataTable(
+            data=changes,
+            columns=[{'name': col, 'id': col} for col in changes[0].keys()],
+            style_table={'overflowX': 'auto'},
+            style_cell={'textAlign': 'center', 'padding': '5px'},
+            style_header={'backgroundColor': 'rgb(230, 230, 230)', 'fontWeight': 'bold'}
+        )
+    ])
 
 #-------------------------------------
 # Callback pour la conversion de types
@@ -2282,15 +4968,16 @@ def apply_cleaning(n_clicks, stored_data, mean_cols, knn_cols, zero_cols, mode_c
     prevent_initial_call=True
 )
 def apply_conversion(n_clicks, conversion_data, stored_data):
-    if not n_clicks or not stored_data:
+    df = pipeline_preview(stored_data)
+    if not n_clicks or df is None:
         raise PreventUpdate
     
     ctx = dash.callback_context
     if not ctx.triggered:
         raise PreventUpdate
     
-    # Get DataFrame from stored data
-    df = pd.DataFrame(stored_data)
+    # Chaque conversion est une étape du pipeline : le jeu de données n'est pas copié
+    new_store = stored_data
     report = []
     
     # Check if conversion data is available
@@ -2299,54 +4986,38 @@ def apply_conversion(n_clicks, conversion_data, stored_data):
         conversion_data = [{'variable': col, 'current_type': str(df[col].dtype), 'new_type': str(df[col].dtype)} 
                         for col in df.columns]
     
-    # Perform conversions based on conversion_data
+    # Record conversions based on conversion_data
     for item in conversion_data:
         col = item.get('variable')
         current_type = item.get('current_type')
         new_type = item.get('new_type')
         
         # Skip if no change in type
-        if current_type == new_type or not col or not new_type:
+        if current_type == new_type or not col or new_type not in PIPELINE_CAST_TYPES:
             continue
         
         try:
-            # Handle different type conversions
-            if new_type == 'int64':
-                # Check if conversion is possible
-                if df[col].isnull().any():
-                    # Fill NA values with 0 before conversion to int (or could use other strategies)
-                    df[col] = df[col].fillna(0)
-                df[col] = df[col].astype('int64')
-                report.append(f"{col}: {current_type} → {new_type} (valeurs NaN remplacées par 0)")
-            
-            elif new_type == 'float64':
-                df[col] = df[col].astype('float64')
-                report.append(f"{col}: {current_type} → {new_type}")
-            
-            elif new_type == 'category':
-                df[col] = df[col].astype('category')
-                report.append(f"{col}: {current_type} → {new_type}")
-            
-            elif new_type == 'object':
-                df[col] = df[col].astype('object')
-                report.append(f"{col}: {current_type} → {new_type}")
-            
-            elif new_type == 'datetime64[ns]':
-                df[col] = pd.to_datetime(df[col], errors='coerce')
-                report.append(f"{col}: {current_type} → {new_type}")
-            
+            # La conversion est vérifiée sur la seule colonne concernée avant d'être enregistrée
+            cast_column(pipeline_frame(new_store, columns=[col])[col], new_type)
         except Exception as e:
             report.append(f"Erreur conversion {col}: {str(e)}")
+            continue
+        new_store = record_step(new_store, {'op': 'cast', 'column': col, 'dtype': new_type})
+        if new_type == 'int64':
+            report.append(f"{col}: {current_type} → {new_type} (valeurs NaN remplacées par 0)")
+        else:
+            report.append(f"{col}: {current_type} → {new_type}")
     
     if report:
+        preview_df = pipeline_preview(new_store)
         result_content = dbc.Card([
             dbc.CardHeader("Rapport de conversion des types"),
             dbc.CardBody([
                 html.Ul([html.Li(item) for item in report]),
                 html.H5("Aperçu des données converties:"),
                 dash_table.DataTable(
-                    data=df.head().to_dict('records'),
-                    columns=[{'name': col, 'id': col} for col in df.columns],
+                    data=preview_df.to_dict('records'),
+                    columns=[{'name': col, 'id': col} for col in preview_df.columns],
                     page_size=5,
                     style_table={'overflowX': 'auto'}
                 )
@@ -2354,8 +5025,9 @@ def apply_conversion(n_clicks, conversion_data, stored_data):
         ])
     else:
         result_content = dbc.Alert("Aucune conversion effectuée.", color="warning")
+        return stored_data, result_content
     
-    return df.to_dict('records'), result_content
+    return new_store, result_content
 
 @app.callback(
     Output('normalization-preview', 'children'),
@@ -2364,56 +5036,42 @@ def apply_conversion(n_clicks, conversion_data, stored_data):
     [State('store-data', 'data')]
 )
 def update_normalization_preview(selected_var, method, stored_data):
-    if not selected_var or not stored_data:
+    if not selected_var:
+        raise PreventUpdate
+    # Seule la colonne choisie est évaluée ; le tableau n'évalue que les lignes affichées
+    column = pipeline_frame(stored_data, columns=[selected_var])
+    if column is None:
         raise PreventUpdate
-    
-    df = pd.DataFrame(stored_data)
-    preview_df = df[[selected_var]].copy()
     
     # Appliquer la normalisation temporaire pour la prévisualisation
     try:
-        if method == 'standard':
-            scaler = StandardScaler()
-            preview_df[f'{selected_var}_norm'] = scaler.fit_transform(preview_df[[selected_var]])
-        elif method == 'minmax':
-            scaler = MinMaxScaler()
-            preview_df[f'{selected_var}_norm'] = scaler.fit_transform(preview_df[[selected_var]])
-        elif method == 'robust':
-            scaler = RobustScaler()
-            preview_df[f'{selected_var}_norm'] = scaler.fit_transform(preview_df[[selected_var]])
-        elif method == 'log':
-            preview_df[f'{selected_var}_norm'] = np.log1p(preview_df[selected_var])
+        original = get_sorted_column(stored_data, column, selected_var)
+        step = scale_step(selected_var, method, original)
+        preview_df = pipeline_preview(stored_data, [selected_var])
+        preview_df = preview_df.assign(**{step['target']: scale_values(
+            preview_df[selected_var].to_numpy(dtype='float64', na_value=np.nan), step)})
         
         # Créer les visualisations
         fig = make_subplots(rows=1, cols=2, subplot_titles=("Avant Normalisation", "Après Normalisation"))
         
-        fig.add_trace(
-            go.Histogram(
-                x=preview_df[selected_var],
-                name='Original',
-                marker_color='blue',
-                nbinsx=30
-            ),
-            row=1, col=1
-        )
+        if len(original):
+            edges, counts = histogram_from_sorted(original, 30)
+            fig.add_trace(histogram_trace(edges, counts, name='Original', marker_color='blue'), row=1, col=1)
         
-        fig.add_trace(
-            go.Histogram(
-                x=preview_df[f'{selected_var}_norm'],
-                name='Normalisé',
-                marker_color='orange',
-                nbinsx=30
-            ),
-            row=1, col=2
-        )
+        # Transformation croissante : les valeurs normalisées restent triées
+        normalized = scale_values(original, step)
+        normalized = normalized[np.isfinite(normalized)]
+        if len(normalized):
+            edges, counts = histogram_from_sorted(normalized, 30)
+            fig.add_trace(histogram_trace(edges, counts, name='Normalisé', marker_color='orange'), row=1, col=2)
         
-        fig.update_layout(height=400, showlegend=False)
+        fig.update_layout(height=400, showlegend=False, bargap=0)
         
         return html.Div([
             dbc.Row([
                 dbc.Col(
                     dash_table.DataTable(
-                        data=preview_df.head().to_dict('records'),
+                        data=preview_df.to_dict('records'),
                         columns=[{'name': col, 'id': col} for col in preview_df.columns],
                         page_size=5,
                         style_table={'overflowX': 'auto'}
@@ -2444,43 +5102,39 @@ def update_normalization_preview(selected_var, method, stored_data):
     prevent_initial_call=True
 )
 def apply_normalization(n_clicks, selected_var, method, stored_data):
-    if not n_clicks:
+    if not n_clicks or not selected_var:
+        raise PreventUpdate
+    column = pipeline_frame(stored_data, columns=[selected_var])
+    if column is None:
         raise PreventUpdate
-    
-    df = pd.DataFrame(stored_data)
-    new_col = f"{selected_var}_norm"
     
     try:
-        if method == 'standard':
-            scaler = StandardScaler()
-            df[new_col] = scaler.fit_transform(df[[selected_var]])
-        elif method == 'minmax':
-            scaler = MinMaxScaler()
-            df[new_col] = scaler.fit_transform(df[[selected_var]])
-        elif method == 'robust':
-            scaler = RobustScaler()
-            df[new_col] = scaler.fit_transform(df[[selected_var]])
-        elif method == 'log':
-            df[new_col] = np.log1p(df[selected_var])
+        # Les paramètres sont appris maintenant ; la colonne n'est calculée qu'à la lecture du jeu
+        original = get_sorted_column(stored_data, column, selected_var)
+        step = scale_step(selected_var, method, original)
+        new_col = step['target']
+        normalized = pd.Series(scale_values(original, step))
+        original = pd.Series(original)
         
         # Créer le rapport de modification
         stats = pd.DataFrame({
             'Statistique': ['Min', 'Max', 'Moyenne', 'Écart-type'],
             'Original': [
-                df[selected_var].min(),
-                df[selected_var].max(),
-                df[selected_var].mean(),
-                df[selected_var].std()
+                original.min(),
+                original.max(),
+                original.mean(),
+                original.std()
             ],
             'Normalisé': [
-                df[new_col].min(),
-                df[new_col].max(),
-                df[new_col].mean(),
-                df[new_col].std()
+                normalized.min(),
+                normalized.max(),
+                normalized.mean(),
+                normalized.std()
             ]
         })
         
-        return df.to_dict('records'), dbc.Card([
+        n_cols = stored_data['n_cols'] + (0 if new_col in pipeline_preview(stored_data).columns else 1)
+        return record_step(stored_data, step, n_cols=n_cols), dbc.Card([
             dbc.CardHeader("Normalisation appliquée avec succès ✅"),
             dbc.CardBody([
                 html.H5(f"Nouvelle colonne créée : {new_col}", className="text-success"),
@@ -2568,19 +5222,25 @@ def create_normalization_interface(df):
     prevent_initial_call=True
 )
 def execute_deduplication(n_clicks, stored_data, columns, keep):
-    if not n_clicks:
+    if not n_clicks or not pipeline_available(stored_data):
         raise PreventUpdate
     
-    df = pd.DataFrame(stored_data)
-    initial_count = len(df)
+    initial_count = stored_data['n_rows']
     
     try:
         # Utiliser toutes les colonnes si aucune sélection
         subset = columns if columns else None
         
-        # Appliquer la suppression
-        df_clean = df.drop_duplicates(subset=subset, keep=keep)
-        removed_count = initial_count - len(df_clean)
+        # Seules les colonnes comparées sont évaluées pour trouver les lignes conservées
+        new_store = record_step(stored_data, {'op': 'dedupe', 'subset': subset, 'keep': keep})
+        remaining_count = pipeline_row_count(new_store)
+        removed_count = initial_count - remaining_count
+        # Sans doublon supprimé les lignes sont inchangées : la version courante est conservée
+        if removed_count == 0:
+            new_store = stored_data
+        else:
+            new_store['n_rows'] = remaining_count
+        preview_df = pipeline_preview(new_store)
         
         # Préparer le rapport
         result_content = dbc.Card([
@@ -2596,14 +5256,14 @@ def execute_deduplication(n_clicks, stored_data, columns, keep):
                 dbc.Row([
                     dbc.Col([
                         html.Div(f"Lignes initiales: {initial_count}"),
-                        html.Div(f"Lignes restantes: {len(df_clean)}"),
+                        html.Div(f"Lignes restantes: {remaining_count}"),
                         html.Div(f"Pourcentage supprimé: {removed_count/initial_count:.1%}")
                     ], width=6),
                     dbc.Col([
                         html.H5("Aperçu des données nettoyées:"),
                         dash_table.DataTable(
-                            data=df_clean.head().to_dict('records'),
-                            columns=[{'name': col, 'id': col} for col in df_clean.columns],
+                            data=preview_df.to_dict('records'),
+                            columns=[{'name': col, 'id': col} for col in preview_df.columns],
                             page_size=5
                         )
                     ], width=6)
@@ -2611,7 +5271,7 @@ def execute_deduplication(n_clicks, stored_data, columns, keep):
             ])
         ])
         
-        return df_clean.to_dict('records'), result_content
+        return new_store, result_content
     
     except Exception as e:
         return dash.no_update, dbc.Alert(
@@ -2632,10 +5292,10 @@ def execute_deduplication(n_clicks, stored_data, columns, keep):
     [State('store-data', 'data')]
 )
 def update_quali_chart(variable, chart_type, stored_data):
-    if not variable or not stored_data:
+    df = get_dataset(stored_data)
+    if not variable or df is None:
         raise PreventUpdate
     
-    df = pd.DataFrame(stored_data)
     counts = df[variable].value_counts().reset_index()
     counts.columns = ['category', 'count']
     
@@ -2686,31 +5346,85 @@ def update_quali_chart(variable, chart_type, stored_data):
         print(f"Erreur lors de la création du graphique: {e}")
         return go.Figure()
 
+MAX_BOX_OUTLIERS = 2000
+
+def sketched_quanti_chart(df, variable, col_stats, n_bins, chart_type):
+    """Histogram or boxplot of a large column built from its sketch (only O(bins) points sent)"""
+    note = approximation_note(col_stats)
+    fig = go.Figure()
+    if chart_type == 'hist':
+        edges, counts = rebin_histogram(col_stats['sketch']['histogram'], n_bins)
+        fig.add_trace(histogram_trace(edges, counts, marker_color='#636EFA', opacity=0.75))
+        fig.update_layout(
+            title=f"Histogramme de {variable}<br><sup>{note}</sup>",
+            xaxis_title=variable,
+            yaxis_title="Fréquence",
+            bargap=0.1
+        )
+    else:
+        q1, median, q3 = kll_quantiles(col_stats['sketch']['quantiles'], [0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        values = df[variable].to_numpy(dtype='float64', na_value=np.nan)
+        values = values[~np.isnan(values)]
+        inside = (values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)
+        outliers = values[~inside]
+        # Échantillon des valeurs atypiques pour borner la taille de la figure
+        if len(outliers) > MAX_BOX_OUTLIERS:
+            outliers = SKETCH_RNG.choice(outliers, MAX_BOX_OUTLIERS, replace=False)
+        fig.add_trace(go.Box(
+            x=[variable],
+            q1=[q1], median=[median], q3=[q3],
+            lowerfence=[values[inside].min()], upperfence=[values[inside].max()],
+            mean=[col_stats['mean']],
+            name=variable,
+            boxpoints=False,
+            marker_color='#636EFA'
+        ))
+        if len(outliers):
+            fig.add_trace(go.Scatter(
+                x=[variable] * len(outliers),
+                y=outliers,
+                mode='markers',
+                marker=dict(color='#636EFA', size=4),
+                name="Valeurs atypiques",
+                showlegend=False
+            ))
+        fig.update_layout(title=f"Distribution de {variable}<br><sup>{note}</sup>", yaxis_title=variable)
+    return fig
+
 # Modifier le callback quanti-quanti pour ajouter plus d'interactivité
 @app.callback(
     Output('quanti-chart', 'figure'),
     [Input('quanti-var', 'value'),
      Input('num-bins', 'value'),
-     Input('quanti-chart-type', 'value')],
+     Input('quanti-chart-type', 'value'),
+     Input('viz-exact-toggle', 'value')],
     [State('store-data', 'data')]
 )
-def update_quanti_chart(variable, n_bins, chart_type, stored_data):
-    if not variable or not stored_data or not n_bins:
+def update_quanti_chart(variable, n_bins, chart_type, exact, stored_data):
+    df = get_dataset(stored_data)
+    if not variable or df is None or not n_bins:
         raise PreventUpdate
     
-    df = pd.DataFrame(stored_data)
-    data = df[variable].dropna()
-    
     try:
+        # Grande colonne : réponse depuis l'esquisse sans parcourir les valeurs
+        col_stats = sketched_column_stats(stored_data, df, variable, exact)
+        if col_stats is not None and chart_type in ('hist', 'box'):
+            fig = sketched_quanti_chart(df, variable, col_stats, n_bins, chart_type)
+            fig.update_layout(
+                height=400,
+                margin=dict(l=20, r=20, t=60, b=20),
+                hovermode="closest"
+            )
+            return fig
+        
         if chart_type == 'hist':
-            # Version avec Graph Objects au lieu de Plotly Express
+            # Classes calculées sur la colonne triée en cache, seules les barres sont envoyées
             fig = go.Figure()
-            fig.add_trace(go.Histogram(
-                x=data,
-                nbinsx=n_bins,
-                marker_color='#636EFA',
-                opacity=0.75
-            ))
+            sorted_values = get_sorted_column(stored_data, df, variable)
+            if len(sorted_values):
+                edges, counts = histogram_from_sorted(sorted_values, int(n_bins))
+                fig.add_trace(histogram_trace(edges, counts, marker_color='#636EFA', opacity=0.75))
             fig.update_layout(
                 title=f"Histogramme de {variable}",
                 xaxis_title=variable,
@@ -2719,11 +5433,18 @@ def update_quanti_chart(variable, n_bins, chart_type, stored_data):
             )
             
         elif chart_type == 'box':  # boxplot
-            fig = px.box(
-                df,
-                y=variable,
-                title=f"Distribution de {variable}"
-            )
+            sorted_values = get_sorted_column(stored_data, df, variable)
+            if len(sorted_values) > MIXED_CHART_ROW_BUDGET:
+                # Boîte calculée depuis l'index trié, sans envoyer toutes les valeurs
+                fig = go.Figure()
+                add_box_traces(fig, variable, group_box_stats(sorted_values), '#636EFA')
+                fig.update_layout(title=f"Distribution de {variable}", yaxis_title=variable, showlegend=False)
+            else:
+                fig = px.box(
+                    df,
+                    y=variable,
+                    title=f"Distribution de {variable}"
+                )
         else:
             raise PreventUpdate  # Empêcher la mise à jour si un type non pris en charge est sélectionné
         
@@ -2740,6 +5461,84 @@ def update_quanti_chart(variable, n_bins, chart_type, stored_data):
         print(f"Erreur dans update_quanti_chart: {e}")
         return go.Figure()  # Retourne une figure vide en cas d'erreur
     
+#-------------------------------------------------------
+# Rendu agrégé du graphique mixte (grands jeux de données)
+#-------------------------------------------------------
+# Au-delà de MIXED_CHART_ROW_BUDGET lignes, les boîtes sont décrites par leurs statistiques
+# calculées sur le serveur (quartiles, moustaches, échantillon borné de valeurs atypiques)
+# et le strip plot n'affiche qu'un échantillon stratifié par groupe.
+MIXED_CHART_ROW_BUDGET = int(os.environ.get('EXPLORA_MIXED_ROW_BUDGET', 5000))
+GROUP_OUTLIER_BUDGET = 200
+MIN_POINTS_PER_GROUP = 20
+
+def group_sorted_values(groups, values):
+    """Factorize the groups and sort the values inside each group (contiguous slices)"""
+    codes, labels = pd.factorize(groups, sort=False)
+    order = np.lexsort((values, codes))
+    bounds = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=len(labels)))])
+    return codes, labels, values[order], bounds
+
+def group_box_stats(sorted_values):
+    """Quartiles, Tukey whiskers, notch span, mean and a bounded sample of outliers of one sorted group"""
+    n = len(sorted_values)
+    q1, median, q3 = sorted_quantiles(sorted_values, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    low = np.searchsorted(sorted_values, q1 - 1.5 * iqr, side='left')
+    high = np.searchsorted(sorted_values, q3 + 1.5 * iqr, side='right')
+    outliers = np.concatenate([sorted_values[:low], sorted_values[high:]])
+    if len(outliers) > GROUP_OUTLIER_BUDGET:
+        outliers = SKETCH_RNG.choice(outliers, GROUP_OUTLIER_BUDGET, replace=False)
+    return {
+        'q1': q1, 'median': median, 'q3': q3,
+        'lowerfence': sorted_values[low], 'upperfence': sorted_values[high - 1],
+        'mean': sorted_values.mean(), 'sd': sorted_values.std(ddof=1) if n > 1 else 0.0,
+        'notchspan': 1.57 * iqr / np.sqrt(n),
+        'outliers': outliers
+    }
+
+def precomputed_box_figure(groups, values):
+    """Grouped notched boxplot drawn from server-side statistics instead of raw points"""
+    _, labels, sorted_values, bounds = group_sorted_values(groups.to_numpy(), values.to_numpy(dtype='float64'))
+    return grouped_box_figure(labels, sorted_values, bounds)
+
+def grouped_box_figure(labels, sorted_values, bounds, notched=True):
+    """Boxplot of groups already sorted into contiguous slices"""
+    colors = px.colors.qualitative.Plotly
+    fig = go.Figure()
+    for i, label in enumerate(labels):
+        add_box_traces(fig, label, group_box_stats(sorted_values[bounds[i]:bounds[i + 1]]), colors[i % len(colors)], notched=notched)
+    return fig
+
+def add_box_traces(fig, label, box, color, notched=False):
+    """Add a box drawn from precomputed statistics and its sampled outliers to a figure"""
+    fig.add_trace(go.Box(
+        x=[label], q1=[box['q1']], median=[box['median']], q3=[box['q3']],
+        lowerfence=[box['lowerfence']], upperfence=[box['upperfence']],
+        mean=[box['mean']], sd=[box['sd']], notchspan=[box['notchspan']],
+        notched=notched, boxmean=True, boxpoints=False,
+        name=str(label), marker_color=color
+    ))
+    if len(box['outliers']):
+        fig.add_trace(go.Scatter(
+            x=[label] * len(box['outliers']),
+            y=box['outliers'],
+            mode='markers',
+            marker=dict(size=4, opacity=0.5, color=color),
+            name=str(label),
+            hoverinfo='y'
+        ))
+
+def stratified_sample_positions(groups, budget):
+    """Row positions of a stratified random sample: shares proportional to group sizes, small groups kept whole"""
+    codes, labels = pd.factorize(groups, sort=False)
+    counts = np.bincount(codes, minlength=len(labels))
+    quotas = np.minimum(counts, np.maximum(budget * counts // counts.sum(), MIN_POINTS_PER_GROUP))
+    # Rang aléatoire de chaque ligne dans son groupe
+    order = np.lexsort((SKETCH_RNG.random(len(codes)), codes))
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    rank = np.arange(len(codes)) - starts[codes[order]]
+    return np.sort(order[rank < quotas[codes[order]]])
+
 @app.callback(
     Output('mixed-chart', 'figure'),
     [Input('mixed-quali-var', 'value'),
@@ -2748,10 +5547,10 @@ def update_quanti_chart(variable, n_bins, chart_type, stored_data):
     [State('store-data', 'data')]
 )
 def update_mixed_chart(quali_var, quanti_var, chart_type, stored_data):
-    if not quali_var or not quanti_var or not stored_data:
+    df = get_dataset(stored_data)
+    if not quali_var or not quanti_var or df is None:
         raise PreventUpdate
     
-    df = pd.DataFrame(stored_data)
     
     # Vérification que les colonnes existent
     if quali_var not in df.columns or quanti_var not in df.columns:
@@ -2766,8 +5565,9 @@ def update_mixed_chart(quali_var, quanti_var, chart_type, stored_data):
             }]
         )
     
-    # Conversion des types si nécessaire
+    # Conversion des types si nécessaire (sur une copie des deux colonnes utilisées)
     try:
+        df = df[[quali_var, quanti_var]].copy()
         df[quanti_var] = pd.to_numeric(df[quanti_var], errors='coerce')
         df[quali_var] = df[quali_var].astype(str)
     except Exception as e:
@@ -2800,26 +5600,32 @@ def update_mixed_chart(quali_var, quanti_var, chart_type, stored_data):
     
     try:
         if chart_type == 'box':
-            fig = px.box(
-                df,
-                x=quali_var,
-                y=quanti_var,
-                color=quali_var,
-                title=f"Distribution de {quanti_var} par {quali_var}",
-                points="all",
-                notched=True
-            )
-            
-            # Amélioration du style
-            fig.update_traces(
-                boxmean=True,  # Affiche la moyenne
-                jitter=0.3,    # Espacement des points
-                pointpos=-1.8, # Position des points
-                marker=dict(size=4, opacity=0.5),
-                boxpoints='all'
-            )
+            if len(df) > MIXED_CHART_ROW_BUDGET:
+                # Boîtes calculées sur le serveur, seules les valeurs atypiques échantillonnées sont envoyées
+                fig = precomputed_box_figure(df[quali_var], df[quanti_var])
+                fig.update_layout(title=f"Distribution de {quanti_var} par {quali_var}<br>"
+                                        f"<sup>Statistiques calculées sur {len(df):,} lignes</sup>".replace(',', ' '))
+            else:
+                fig = px.box(
+                    df,
+                    x=quali_var,
+                    y=quanti_var,
+                    color=quali_var,
+                    title=f"Distribution de {quanti_var} par {quali_var}",
+                    points="all",
+                    notched=True
+                )
+                
+                # Amélioration du style
+                fig.update_traces(
+                    boxmean=True,  # Affiche la moyenne
+                    jitter=0.3,    # Espacement des points
+                    pointpos=-1.8, # Position des points
+                    marker=dict(size=4, opacity=0.5),
+                    boxpoints='all'
+                )
             
-            # Ajout des statistiques par groupe
+            # Ajout des statistiques par groupe (exactes, sur toutes les lignes)
             stats = df.groupby(quali_var)[quanti_var].agg(['mean', 'std', 'count']).round(2)
             stats_text = "<br>".join([
                 f"<b>{group}</b>: n={row['count']}, Moyenne={row['mean']:.2f}, Écart-type={row['std']:.2f}"
@@ -2840,12 +5646,18 @@ def update_mixed_chart(quali_var, quanti_var, chart_type, stored_data):
             )
             
         elif chart_type == 'strip':
+            title = f"Distribution de {quanti_var} par {quali_var}"
+            plot_df = df
+            if len(df) > MIXED_CHART_ROW_BUDGET:
+                # Échantillon stratifié par groupe ; les moyennes restent calculées sur toutes les lignes
+                plot_df = df.iloc[stratified_sample_positions(df[quali_var].to_numpy(), MIXED_CHART_ROW_BUDGET)]
+                title += f"<br><sup>Échantillon stratifié de {len(plot_df):,} points sur {len(df):,}</sup>".replace(',', ' ')
             fig = px.strip(
-                df,
+                plot_df,
                 x=quali_var,
                 y=quanti_var,
                 color=quali_var,
-                title=f"Distribution de {quanti_var} par {quali_var}",
+                title=title,
                 hover_data=[quali_var, quanti_var]
             )
             
@@ -2937,23 +5749,54 @@ def update_mixed_chart(quali_var, quanti_var, chart_type, stored_data):
 
 # Modifier le callback pour la matrice de corrélation
 @app.callback(
-    Output('correlation-chart', 'figure'),
+    [Output('correlation-chart', 'figure'),
+     Output('corr-top-pairs', 'children')],
     [Input('corr-vars', 'value'),
-     Input('corr-annot', 'value')],
+     Input('corr-annot', 'value'),
+     Input('corr-method', 'value'),
+     Input('corr-cluster', 'value')],
     [State('store-data', 'data')]
 )
-def update_correlation_matrix(selected_vars, show_annot, stored_data):
-    if not selected_vars or not stored_data:
+def update_correlation_matrix(selected_vars, show_annot, method, cluster, stored_data):
+    df = get_dataset(stored_data)
+    if (not selected_vars and not cluster) or df is None:
         raise PreventUpdate
     
-    df = pd.DataFrame(stored_data)[selected_vars].dropna()
-    corr_matrix = df.corr()
+    # Extraction de la matrice complète mise en cache (paires complètes)
+    corr_matrix = get_correlation_matrix(stored_data, df, method or 'pearson')
+    if not cluster:
+        selected_vars = [col for col in selected_vars if col in corr_matrix.columns]
+        corr_matrix = corr_matrix.loc[selected_vars, selected_vars]
+    
+    top_pairs = top_correlation_pairs(corr_matrix)
+    top_pairs_table = html.Div([
+        html.H6(f"Paires les plus corrélées ({len(top_pairs)})", className="text-primary"),
+        dash_table.DataTable(
+            data=top_pairs.to_dict('records'),
+            columns=[{'name': col, 'id': col} for col in top_pairs.columns],
+            sort_action='native',
+            page_size=10,
+            style_table={'overflowX': 'auto'},
+            style_cell={'textAlign': 'center'}
+        )
+    ]) if len(top_pairs) else None
+    
+    z_values, labels = corr_matrix.values, list(corr_matrix.columns)
+    hover_label = "Corrélation"
+    if cluster:
+        # Variables réordonnées par classification puis agrégées en tuiles
+        order = cluster_order(corr_matrix)
+        labels = [labels[i] for i in order]
+        z_values, labels = tile_matrix(z_values[np.ix_(order, order)], labels)
+        if len(labels) < len(corr_matrix.columns):
+            hover_label = "Corrélation la plus forte du bloc (|r| max)"
+        show_annot = show_annot and len(labels) <= 15
     
     fig = px.imshow(
-        corr_matrix,
+        z_values,
         labels=dict(color="Correlation"),
-        x=selected_vars,
-        y=selected_vars,
+        x=labels,
+        y=labels,
         color_continuous_scale='RdBu',
         zmin=-1,
         zmax=1,
@@ -2962,17 +5805,19 @@ def update_correlation_matrix(selected_vars, show_annot, stored_data):
     
     if show_annot:
         fig.update_traces(
-            text=np.round(corr_matrix.values, 2),
+            text=np.round(z_values, 2),
             texttemplate="%{text}",
-            hovertemplate="<b>%{x}</b> vs <b>%{y}</b><br>Corrélation: %{z:.2f}<extra></extra>"
+            hovertemplate=f"<b>%{{x}}</b> vs <b>%{{y}}</b><br>{hover_label}: %{{z:.2f}}<extra></extra>"
         )
     else:
         fig.update_traces(
-            hovertemplate="<b>%{x}</b> vs <b>%{y}</b><br>Corrélation: %{z:.2f}<extra></extra>"
+            hovertemplate=f"<b>%{{x}}</b> vs <b>%{{y}}</b><br>{hover_label}: %{{z:.2f}}<extra></extra>"
         )
     
+    approximate = corr_matrix.attrs.get('approximate_pairs', 0)
     fig.update_layout(
-        title="Matrice de Corrélation",
+        title=f"Matrice de Corrélation ({(method or 'pearson').capitalize()})"
+              + (f" — {approximate} paires approchées (rangs des colonnes entières)" if approximate else ""),
         xaxis_side="top",
         margin=dict(l=0, r=0, b=0, t=40),
         coloraxis_colorbar=dict(
@@ -2988,19 +5833,20 @@ def update_correlation_matrix(selected_vars, show_annot, stored_data):
         )
     )
     
-    return fig
+    return fig, top_pairs_table
 
 @app.callback(
     Output('distribution-chart', 'figure'),
     [Input('dist-var', 'value'),
-     Input('dist-type', 'value')],
+     Input('dist-type', 'value'),
+     Input('viz-exact-toggle', 'value')],
     [State('store-data', 'data')]
 )
-def update_distribution_chart(variable, dist_type, stored_data):
-    if not variable or not stored_data:
+def update_distribution_chart(variable, dist_type, exact, stored_data):
+    df = get_dataset(stored_data)
+    if not variable or df is None:
         raise PreventUpdate
     
-    df = pd.DataFrame(stored_data)
     data = df[variable].dropna()
     
     # Check if data is empty after dropping NA values
@@ -3017,27 +5863,32 @@ def update_distribution_chart(variable, dist_type, stored_data):
         )
     
     try:
+        col_stats = sketched_column_stats(stored_data, df, variable, exact)
         if dist_type == 'kde':
             fig = go.Figure()
             
             # Add histogram with improved styling
-            fig.add_trace(go.Histogram(
-                x=data,
+            if col_stats is not None:
+                # Densité calculée depuis l'histogramme de l'esquisse
+                edges, counts = rebin_histogram(col_stats['sketch']['histogram'], 30)
+            else:
+                edges, counts = histogram_from_sorted(get_sorted_column(stored_data, df, variable), 30)
+            fig.add_trace(histogram_trace(
+                edges, counts,
+                density=True,
                 name='Histogramme',
                 opacity=0.7,
-                nbinsx=30,
                 marker_color='#636EFA',
                 marker_line_color='white',
-                marker_line_width=1,
-                histnorm='probability density'
+                marker_line_width=1
             ))
             
             # Add KDE with improved styling
-            kde = stats.gaussian_kde(data)
+            grid, density = column_kde(stored_data, df, variable, col_stats)
             x_range = np.linspace(data.min(), data.max(), 100)
             fig.add_trace(go.Scatter(
                 x=x_range,
-                y=kde(x_range),
+                y=np.interp(x_range, grid, density),
                 name='Densité',
                 line=dict(color='red', width=2),
                 fill='tozeroy',
@@ -3046,7 +5897,10 @@ def update_distribution_chart(variable, dist_type, stored_data):
             
             # Add mean and median lines
             mean_val = data.mean()
-            median_val = data.median()
+            if col_stats is not None:
+                median_val = col_stats['quantiles'][SUMMARY_QUANTILES.index(0.5)]
+            else:
+                median_val = sorted_quantiles(get_sorted_column(stored_data, df, variable), [0.5])[0]
             
             fig.add_vline(
                 x=mean_val,
@@ -3076,9 +5930,10 @@ def update_distribution_chart(variable, dist_type, stored_data):
             ))
             
             fig.update_layout(
-                title=f"Distribution de {variable}",
+                title=f"Distribution de {variable}" + (f"<br><sup>{approximation_note(col_stats)}</sup>" if col_stats is not None else ""),
                 xaxis_title=variable,
                 yaxis_title="Densité",
+                bargap=0,
                 showlegend=True,
                 legend=dict(
                     yanchor="top",
@@ -3091,9 +5946,11 @@ def update_distribution_chart(variable, dist_type, stored_data):
         else:  # QQ-Plot
             fig = go.Figure()
             
-            # Calcul des quantiles théoriques et observés
-            theoretical = stats.norm.ppf(np.linspace(0.01, 0.99, len(data)))
-            observed = np.sort(data)
+            # Calcul des quantiles théoriques et observés (au plus QQ_PLOT_POINTS points)
+            if col_stats is not None:
+                theoretical, observed = qq_points(quantile_sketch=col_stats['sketch']['quantiles'], n_values=len(data))
+            else:
+                theoretical, observed = qq_points(get_sorted_column(stored_data, df, variable))
             
             # Ajout des points du QQ-plot
             fig.add_trace(go.Scatter(
@@ -3196,15 +6053,16 @@ def update_distribution_chart(variable, dist_type, stored_data):
     [State('store-data', 'data')]
 )
 def update_dropdown_options(ts, stored_data):
-    if not stored_data:
+    df = get_dataset(stored_data)
+    if df is None:
         return [], [], [], [], [], []
     
-    df = pd.DataFrame(stored_data)
     
+    dataset_stats = get_dataset_stats(stored_data, df)
     # Variables qualitatives
-    categorical_cols = [col for col in df.columns if pd.api.types.is_categorical_dtype(df[col]) or df[col].dtype == 'object']
+    categorical_cols = columns_of_kind(dataset_stats, 'qualitative')
     # Variables quantitatives
-    numerical_cols = [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col])]
+    numerical_cols = columns_of_kind(dataset_stats, 'numeric', 'boolean')
     
     quali_options = [{'label': col, 'value': col} for col in categorical_cols]
     quanti_options = [{'label': col, 'value': col} for col in numerical_cols]
@@ -3273,10 +6131,10 @@ def export_graph(png_clicks, svg_clicks, html_clicks, figure):
 )
 def display_selected_data(quanti_selected, mixed_selected, stored_data):
     ctx = dash.callback_context
-    if not ctx.triggered or not stored_data:
+    df = get_dataset(stored_data)
+    if not ctx.triggered or df is None:
         raise PreventUpdate
     
-    df = pd.DataFrame(stored_data)
     selected_indices = []
     
     if ctx.triggered[0]['prop_id'] == 'quanti-quanti-chart.selectedData':
@@ -3313,16 +6171,17 @@ def display_selected_data(quanti_selected, mixed_selected, stored_data):
     [Input("btn-normality", "n_clicks"),
      Input("btn-correlation", "n_clicks"),
      Input("btn-chi-squared", "n_clicks"),
-     Input("btn-t-student", "n_clicks")],
+     Input("btn-t-student", "n_clicks"),
+     Input("btn-resampling", "n_clicks")],
     [State("store-data", "data")]
 )
-def display_test_interface(norm_clicks, corr_clicks, chi_clicks, t_clicks, data):
+def display_test_interface(norm_clicks, corr_clicks, chi_clicks, t_clicks, resampling_clicks, data):
     ctx = dash.callback_context
-    if not ctx.triggered or not data:
+    df = get_dataset(data)
+    if not ctx.triggered or df is None:
         raise PreventUpdate
     
     triggered_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    df = pd.DataFrame(data)
     
     # Test de Normalité
     if triggered_id == "btn-normality":
@@ -3359,8 +6218,14 @@ def display_test_interface(norm_clicks, corr_clicks, chi_clicks, t_clicks, data)
                 dbc.Button("Lancer le test", 
                          id="btn-run-normality", 
                          color="success",
+                         className="mt-3 me-2"),
+                dbc.Button("Tester toutes les colonnes", 
+                         id="btn-run-normality-all", 
+                         color="primary",
                          className="mt-3"),
-                html.Div(id="normality-results", className="mt-4")
+                html.Div(id="normality-results", className="mt-4"),
+                job_panel('normality-bulk', "Dépistage de normalité de toutes les colonnes..."),
+                html.Div(id="bulk-test-results", className="mt-4")
             ])
         ])
     
@@ -3410,7 +6275,27 @@ def display_test_interface(norm_clicks, corr_clicks, chi_clicks, t_clicks, data)
                          id="btn-run-correlation", 
                          color="success",
                          className="mt-3"),
-                html.Div(id="correlation-results", className="mt-4")
+                html.Div(id="correlation-results", className="mt-4"),
+                html.Hr(),
+                dbc.Row([
+                    dbc.Col([
+                        dbc.Label("Correction des tests multiples :"),
+                        dbc.RadioItems(
+                            id="corr-correction-select",
+                            options=[
+                                {'label': 'Benjamini-Hochberg (taux de fausses découvertes)', 'value': 'bh'},
+                                {'label': 'Bonferroni (erreur globale)', 'value': 'bonferroni'}
+                            ],
+                            value='bh'
+                        )
+                    ], width=12)
+                ]),
+                dbc.Button("Tester toutes les paires", 
+                         id="btn-run-correlation-all", 
+                         color="primary",
+                         className="mt-3"),
+                job_panel('correlation-bulk', "Test de toutes les paires de variables numériques..."),
+                html.Div(id="bulk-test-results", className="mt-4")
             ])
         ])
     
@@ -3446,8 +6331,14 @@ def display_test_interface(norm_clicks, corr_clicks, chi_clicks, t_clicks, data)
                 dbc.Button("Lancer le test", 
                          id="btn-run-chi", 
                          color="success",
+                         className="mt-3 me-2"),
+                dbc.Button("Tester toutes les paires", 
+                         id="btn-run-chi-all", 
+                         color="primary",
                          className="mt-3"),
-                html.Div(id="chi-results", className="mt-4")
+                html.Div(id="chi-results", className="mt-4"),
+                job_panel('chi-bulk', "Test de toutes les paires de variables catégoriques..."),
+                html.Div(id="bulk-test-results", className="mt-4")
             ])
         ])
     
@@ -3457,10 +6348,11 @@ def display_test_interface(norm_clicks, corr_clicks, chi_clicks, t_clicks, data)
         categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
         return dbc.Card([
             dbc.CardHeader([
-                html.H4("Test t de Student", className="text-white"),
-                html.P("Compare les moyennes de deux groupes indépendants. Suppose que les données sont normalement "
-                      "distribuées et que les variances sont égales (test de Welch disponible si variances inégales). "
-                      "Idéal pour comparer un résultat numérique entre deux catégories.", className="text-dark mb-0")
+                html.H4("Comparaison de groupes", className="text-white"),
+                html.P("Compare une variable numérique entre les groupes d'une variable catégorique. Avec deux groupes : "
+                      "t de Student (variances égales) et t de Welch (variances inégales) ; avec plus de deux groupes : "
+                      "ANOVA et tests post-hoc par paires. Kruskal-Wallis est l'alternative non paramétrique.",
+                      className="text-dark mb-0")
             ], className="bg-info"),
             dbc.CardBody([
                 dbc.Row([
@@ -3473,7 +6365,7 @@ def display_test_interface(norm_clicks, corr_clicks, chi_clicks, t_clicks, data)
                         )
                     ], width=6),
                     dbc.Col([
-                        dbc.Label("Variable catégorique (2 groupes) :"),
+                        dbc.Label("Variable catégorique (2 groupes ou plus) :"),
                         dcc.Dropdown(
                             id="t-cat-var-select",
                             options=[{'label': col, 'value': col} for col in categorical_cols],
@@ -3489,6 +6381,66 @@ def display_test_interface(norm_clicks, corr_clicks, chi_clicks, t_clicks, data)
             ])
         ])
     
+    # Tests par rééchantillonnage
+    elif triggered_id == "btn-resampling":
+        numerical_cols = df.select_dtypes(include=['number']).columns.tolist()
+        categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
+        return dbc.Card([
+            dbc.CardHeader([
+                html.H4("Tests par Rééchantillonnage", className="text-white"),
+                html.P("Test de permutation et intervalle de confiance bootstrap, sans hypothèse sur la distribution "
+                      "des données. Adapté aux petits échantillons ou aux distributions asymétriques. La graine rend "
+                      "les résultats reproductibles.", className="text-dark mb-0")
+            ], className="bg-info"),
+            dbc.CardBody([
+                dbc.Row([
+                    dbc.Col([
+                        dbc.Label("Statistique :"),
+                        dbc.RadioItems(
+                            id="resampling-statistic",
+                            options=[
+                                {'label': 'Différence de moyennes (2 groupes)', 'value': 'mean_diff'},
+                                {'label': 'Corrélation de Pearson', 'value': 'correlation'}
+                            ],
+                            value='mean_diff'
+                        )
+                    ], width=4),
+                    dbc.Col([
+                        dbc.Label("Variable numérique :"),
+                        dcc.Dropdown(
+                            id="resampling-var1-select",
+                            options=[{'label': col, 'value': col} for col in numerical_cols],
+                            value=numerical_cols[0] if numerical_cols else None
+                        )
+                    ], width=4),
+                    dbc.Col([
+                        dbc.Label("Groupes (catégorique) ou 2e variable numérique :"),
+                        dcc.Dropdown(
+                            id="resampling-var2-select",
+                            options=[{'label': col, 'value': col} for col in categorical_cols + numerical_cols],
+                            value=categorical_cols[0] if categorical_cols else None
+                        )
+                    ], width=4)
+                ]),
+                dbc.Row([
+                    dbc.Col([
+                        dbc.Label("Nombre de rééchantillonnages :"),
+                        dbc.Input(id="resampling-count", type="number", min=100, max=1000000, step=100, value=10000)
+                    ], width=4),
+                    dbc.Col([
+                        dbc.Label("Graine aléatoire :"),
+                        dbc.Input(id="resampling-seed", type="number", min=0, step=1, value=0)
+                    ], width=4)
+                ], className="mt-3"),
+                dbc.Button("Lancer le test", 
+                         id="btn-run-resampling", 
+                         color="success",
+                         className="mt-3"),
+                job_panel('resampling', "Permutations et tirages bootstrap en cours..."),
+                html.Div(id="resampling-results", className="mt-4")
+            ])
+        ])
+    
     return html.Div()
 
 # Callbacks pour exécuter les tests
@@ -3501,16 +6453,23 @@ def display_test_interface(norm_clicks, corr_clicks, chi_clicks, t_clicks, data)
     prevent_initial_call=True
 )
 def run_normality_test(n_clicks, var, test_type, data):
-    if n_clicks is None:
+    df = get_dataset(data)
+    if n_clicks is None or df is None:
         raise PreventUpdate
     
-    df = pd.DataFrame(data)
     results = []
+    sample_note = None
     
     try:
         if test_type == 'shapiro':
-            stat, p = shapiro(df[var].dropna())
+            # Même sous-échantillon que le tableau de tous les tests (tiré de la colonne triée)
+            data_clean = get_sorted_column(data, df, var)
+            sample = shapiro_sample(data_clean)
+            stat, p = shapiro(sample)
             test_name = "Shapiro-Wilk"
+            if len(sample) < len(data_clean):
+                sample_note = (f"Test calculé sur un sous-échantillon aléatoire de {len(sample)} valeurs "
+                               f"parmi {len(data_clean)} (la valeur p de Shapiro-Wilk n'est pas fiable au-delà).")
         elif test_type == 'ks':
             # Standardize data for better KS test results
             data_clean = df[var].dropna()
@@ -3538,12 +6497,61 @@ def run_normality_test(n_clicks, var, test_type, data):
                 className="mt-3"
             )
         ]
+        if sample_note:
+            results.append(html.Small(sample_note, className="text-muted"))
         
     except Exception as e:
         return dbc.Alert(f"Erreur : {str(e)}", color="danger")
     
     return results
 
+@app.callback(
+    Output("bulk-test-results", "children", allow_duplicate=True),
+    [Input("btn-run-normality-all", "n_clicks")],
+    [State("store-data", "data")],
+    **job_callback('normality-bulk', 'btn-run-normality-all')
+)
+def run_all_normality_tests(set_progress, n_clicks, data):
+    if n_clicks is None or get_dataset(data) is None:
+        raise PreventUpdate
+    result, failure = run_job(set_progress, normality_screen_job, data)
+    return result if failure is None else failure
+
+def normality_screen_job(job, data):
+    """Background job: normality screen of every numeric column, rendered for the results panel"""
+    df = get_dataset(data)
+    if df is None:
+        raise ValueError("Données expirées, veuillez recharger le fichier")
+    results = normality_screen(data, df, progress=lambda fraction: report_progress(job, fraction))
+    
+    if results.empty:
+        return dbc.Alert("Aucune variable numérique.", color="warning")
+    
+    n_normal = int((results['Conclusion'] == 'Normale').sum())
+    return html.Div([
+        dbc.Alert(
+            f"{n_normal} variable(s) sur {len(results)} compatibles avec une loi normale au seuil de 5 % "
+            f"(test de D'Agostino-Pearson). Shapiro-Wilk est calculé sur au plus {SHAPIRO_MAX_SAMPLE} "
+            f"valeurs tirées aléatoirement (graine {SHAPIRO_SEED}).",
+            color="info"
+        ),
+        dash_table.DataTable(
+            data=results.to_dict('records'),
+            columns=[
+                {'name': col, 'id': col, 'type': 'numeric',
+                 'format': dash_table.Format.Format(precision=4, scheme=dash_table.Format.Scheme.exponent)}
+                if col.startswith('p ') else {'name': col, 'id': col}
+                for col in results.columns
+            ],
+            sort_action='native',
+            filter_action='native',
+            page_size=15,
+            style_table={'overflowX': 'auto'},
+            style_cell={'textAlign': 'center'},
+            style_header={'backgroundColor': 'rgb(230, 230, 230)', 'fontWeight': 'bold'}
+        )
+    ])
+
 @app.callback(
     Output("correlation-results", "children"),
     [Input("btn-run-correlation", "n_clicks")],
@@ -3553,15 +6561,22 @@ def run_normality_test(n_clicks, var, test_type, data):
      State("store-data", "data")]
 )
 def run_correlation_test(n_clicks, var1, var2, method, data):
-    if n_clicks is None:
+    full_df = get_dataset(data)
+    if n_clicks is None or full_df is None:
         raise PreventUpdate
     
-    df = pd.DataFrame(data).dropna()
+    # Lignes complètes pour les deux variables testées uniquement
+    df = full_df[[var1, var2]].dropna()
     results = []
     
     try:
         if method == 'pearson':
             corr, p = pearsonr(df[var1], df[var2])
+        elif len(df) == len(full_df) and len(df) > 2:
+            # Aucune ligne écartée : rangs lus depuis l'index trié de chaque colonne
+            corr, _ = pearsonr(column_ranks(data, full_df, var1), column_ranks(data, full_df, var2))
+            t_stat = corr * np.sqrt((len(df) - 2) / max(1 - corr ** 2, np.finfo(float).tiny))
+            p = 2 * stats.t.sf(abs(t_stat), len(df) - 2)
         else:
             corr, p = spearmanr(df[var1], df[var2])
             
@@ -3585,6 +6600,56 @@ def run_correlation_test(n_clicks, var1, var2, method, data):
     
     return results
 
+@app.callback(
+    Output("bulk-test-results", "children", allow_duplicate=True),
+    [Input("btn-run-correlation-all", "n_clicks")],
+    [State("corr-method-select", "value"),
+     State("corr-correction-select", "value"),
+     State("store-data", "data")],
+    **job_callback('correlation-bulk', 'btn-run-correlation-all')
+)
+def run_all_correlation_tests(set_progress, n_clicks, method, correction, data):
+    if n_clicks is None or get_dataset(data) is None:
+        raise PreventUpdate
+    result, failure = run_job(set_progress, correlation_tests_job, data, method, correction)
+    return result if failure is None else failure
+
+def correlation_tests_job(job, data, method, correction):
+    """Background job: all-pairs correlation tests, rendered for the results panel"""
+    df = get_dataset(data)
+    if df is None:
+        raise ValueError("Données expirées, veuillez recharger le fichier")
+    report_progress(job, 0.0, "Calcul de la matrice de corrélation...")
+    results = all_pairs_correlation_tests(data, df, method or 'pearson', correction or 'bh')
+    
+    if results.empty:
+        return dbc.Alert("Il faut au moins deux variables numériques.", color="warning")
+    
+    n_significant = int((results['Significatif'] == 'Oui').sum())
+    correction_label = 'Bonferroni' if correction == 'bonferroni' else 'Benjamini-Hochberg'
+    return html.Div([
+        dbc.Alert(
+            f"{len(results)} paires testées ({(method or 'pearson').capitalize()}), "
+            f"{n_significant} significatives au seuil de 5 % après correction de {correction_label}.",
+            color="info"
+        ),
+        dash_table.DataTable(
+            data=results.to_dict('records'),
+            columns=[
+                {'name': col, 'id': col, 'type': 'numeric',
+                 'format': dash_table.Format.Format(precision=4, scheme=dash_table.Format.Scheme.exponent)}
+                if col in ('Valeur p', 'Valeur p corrigée') else {'name': col, 'id': col}
+                for col in results.columns
+            ],
+            sort_action='native',
+            filter_action='native',
+            page_size=15,
+            style_table={'overflowX': 'auto'},
+            style_cell={'textAlign': 'center'},
+            style_header={'backgroundColor': 'rgb(230, 230, 230)', 'fontWeight': 'bold'}
+        )
+    ])
+
 @app.callback(
     Output("chi-results", "children"),
     [Input("btn-run-chi", "n_clicks")],
@@ -3593,10 +6658,10 @@ def run_correlation_test(n_clicks, var1, var2, method, data):
      State("store-data", "data")]
 )
 def run_chi_test(n_clicks, var1, var2, data):
-    if n_clicks is None:
+    df = get_dataset(data)
+    if n_clicks is None or df is None:
         raise PreventUpdate
     
-    df = pd.DataFrame(data)
     results = []
     
     try:
@@ -3635,6 +6700,58 @@ def run_chi_test(n_clicks, var1, var2, data):
     
     return results
 
+@app.callback(
+    Output("bulk-test-results", "children", allow_duplicate=True),
+    [Input("btn-run-chi-all", "n_clicks")],
+    [State("store-data", "data")],
+    **job_callback('chi-bulk', 'btn-run-chi-all')
+)
+def run_all_chi_tests(set_progress, n_clicks, data):
+    if n_clicks is None or get_dataset(data) is None:
+        raise PreventUpdate
+    result, failure = run_job(set_progress, chi2_matrix_job, data)
+    return result if failure is None else failure
+
+def chi2_matrix_job(job, data):
+    """Background job: chi-square matrix of all qualitative pairs, rendered for the results panel"""
+    df = get_dataset(data)
+    if df is None:
+        raise ValueError("Données expirées, veuillez recharger le fichier")
+    columns, results = chi2_matrix(data, df, progress=lambda fraction: report_progress(job, fraction))
+    
+    if len(columns) < 2:
+        return dbc.Alert("Il faut au moins deux variables catégoriques.", color="warning")
+    
+    upper = np.triu_indices(len(columns), 1)
+    n_significant = int((results['p'][upper] < 0.05).sum())
+    fig = go.Figure(go.Heatmap(
+        z=results['cramer_v'],
+        x=columns,
+        y=columns,
+        zmin=0,
+        zmax=1,
+        colorscale='Blues',
+        colorbar=dict(title="V de Cramér"),
+        customdata=np.dstack([results['chi2'], results['p'], results['dof'], results['n']]),
+        hovertemplate="%{y} × %{x}<br>V de Cramér : %{z:.3f}<br>Chi² : %{customdata[0]:.2f}"
+                      "<br>Valeur p : %{customdata[1]:.3g}<br>ddl : %{customdata[2]:.0f}"
+                      "<br>n : %{customdata[3]:.0f}<extra></extra>",
+        texttemplate="%{z:.2f}" if len(columns) <= 20 else None
+    ))
+    fig.update_layout(
+        title="Association entre variables catégoriques (V de Cramér)",
+        height=max(450, 30 * len(columns)),
+        yaxis=dict(autorange='reversed')
+    )
+    return html.Div([
+        dbc.Alert(
+            f"{len(upper[0])} paires testées, {n_significant} dépendances significatives au seuil de 5 % "
+            "(Chi-carré de Pearson sans correction de Yates ; détails au survol).",
+            color="info"
+        ),
+        dcc.Graph(figure=fig)
+    ])
+
 @app.callback(
     Output("t-results", "children"),
     [Input("btn-run-t", "n_clicks")],
@@ -3643,39 +6760,64 @@ def run_chi_test(n_clicks, var1, var2, data):
      State("store-data", "data")]
 )
 def run_t_test(n_clicks, num_var, cat_var, data):
-    if n_clicks is None:
+    df = get_dataset(data)
+    if n_clicks is None or df is None:
         raise PreventUpdate
     
-    df = pd.DataFrame(data).dropna()
     results = []
     
     try:
-        groups = df[cat_var].unique()
-        if len(groups) != 2:
-            return dbc.Alert("La variable catégorique doit avoir exactement 2 groupes", color="danger")
-            
-        group1 = df[df[cat_var] == groups[0]][num_var]
-        group2 = df[df[cat_var] == groups[1]][num_var]
+        comparison = group_comparison(df, num_var, cat_var)
+        table_style = dict(
+            style_table={'overflowX': 'auto'},
+            style_cell={'textAlign': 'center'},
+            style_header={'backgroundColor': 'rgb(230, 230, 230)', 'fontWeight': 'bold'}
+        )
         
-        t_stat, p = ttest_ind(group1, group2)
+        results.append(html.H5("Statistiques par groupe :"))
+        results.append(dash_table.DataTable(
+            data=comparison['summary'].to_dict('records'),
+            columns=[{'name': col, 'id': col} for col in comparison['summary'].columns],
+            sort_action='native',
+            page_size=10,
+            **table_style
+        ))
         
-        results.append(html.H5("Résultats du test t de Student :"))
-        results.append(dbc.Row([
-            dbc.Col(html.Strong("Statistique t :"), width=4),
-            dbc.Col(f"{t_stat:.3f}", width=8)
-        ]))
-        results.append(dbc.Row([
-            dbc.Col(html.Strong("Valeur p :"), width=4),
-            dbc.Col(f"{p:.4f}", width=8)
-        ]))
+        results.append(html.H5("Résultats des tests :", className="mt-4"))
+        for test_name, (stat, p, dof) in comparison['tests'].items():
+            results.append(dbc.Row([
+                dbc.Col(html.Strong(f"{test_name} :"), width=4),
+                dbc.Col(f"statistique = {stat:.3f}, ddl = {dof}, valeur p = {p:.4f}", width=8)
+            ]))
+        main_test = 't de Welch' if 't de Welch' in comparison['tests'] else 'ANOVA à un facteur'
+        p = comparison['tests'][main_test][1]
         results.append(dbc.Alert(
-            "Différence significative" if p < 0.05 else "Pas de différence significative",
+            f"Différence significative ({main_test})" if p < 0.05 else f"Pas de différence significative ({main_test})",
             color="success" if p < 0.05 else "warning",
             className="mt-3"
         ))
         
-        # Boxplot comparatif
-        fig = px.box(df, x=cat_var, y=num_var, color=cat_var)
+        if not comparison['posthoc'].empty:
+            results.append(html.H5("Comparaisons post-hoc par paires :", className="mt-4"))
+            results.append(dash_table.DataTable(
+                data=comparison['posthoc'].to_dict('records'),
+                columns=[
+                    {'name': col, 'id': col, 'type': 'numeric',
+                     'format': dash_table.Format.Format(precision=4, scheme=dash_table.Format.Scheme.exponent)}
+                    if col.startswith('p ') else {'name': col, 'id': col}
+                    for col in comparison['posthoc'].columns
+                ],
+                sort_action='native',
+                page_size=10,
+                **table_style
+            ))
+        elif len(comparison['summary']) > POSTHOC_MAX_GROUPS:
+            results.append(html.Small(f"Tests post-hoc non calculés au-delà de {POSTHOC_MAX_GROUPS} groupes.",
+                                      className="text-muted"))
+        
+        # Boxplot comparatif (quartiles calculés côté serveur)
+        fig = comparison['figure']
+        fig.update_layout(xaxis_title=cat_var, yaxis_title=num_var, showlegend=False)
         results.append(dcc.Graph(figure=fig))
         
     except Exception as e:
@@ -3683,6 +6825,74 @@ def run_t_test(n_clicks, num_var, cat_var, data):
     
     return results
 
+@app.callback(
+    Output("resampling-results", "children"),
+    [Input("btn-run-resampling", "n_clicks")],
+    [State("resampling-statistic", "value"),
+     State("resampling-var1-select", "value"),
+     State("resampling-var2-select", "value"),
+     State("resampling-count", "value"),
+     State("resampling-seed", "value"),
+     State("store-data", "data")],
+    **job_callback('resampling', 'btn-run-resampling')
+)
+def start_resampling_test(set_progress, n_clicks, statistic, var1, var2, n_resamples, seed, data):
+    df = get_dataset(data)
+    if n_clicks is None or df is None:
+        raise PreventUpdate
+    
+    try:
+        if not var1 or not var2 or var1 == var2:
+            raise ValueError("Choisissez deux variables différentes")
+        subset = df[[var1, var2]].dropna()
+        x = subset[var1].to_numpy(dtype='float64')
+        if statistic == 'mean_diff':
+            groups = subset[var2].unique()
+            if len(groups) != 2:
+                raise ValueError("La variable de groupes doit avoir exactement 2 groupes")
+            y = (subset[var2] == groups[0]).to_numpy()
+            statistic_label = f"Différence de moyennes ({groups[0]} − {groups[1]})"
+        else:
+            if not pd.api.types.is_numeric_dtype(subset[var2]):
+                raise ValueError("La corrélation demande une seconde variable numérique")
+            y = subset[var2].to_numpy(dtype='float64')
+            statistic_label = f"Corrélation de Pearson ({var1}, {var2})"
+        if len(x) < 3:
+            raise ValueError("Pas assez d'observations complètes")
+    except Exception as e:
+        return dbc.Alert(f"Erreur : {str(e)}", color="danger")
+    
+    result, failure = run_job(set_progress, resampling_job, statistic, x, y, int(n_resamples or 10000), int(seed or 0),
+                              statistic_label)
+    return result if failure is None else failure
+
+def resampling_job(job, statistic, x, y, n_resamples, seed, statistic_label):
+    """Background job: permutation test and bootstrap interval, rendered for the results panel"""
+    result = run_resampling(statistic, x, y, n_resamples, seed, progress=lambda fraction: report_progress(job, fraction))
+    p = result['p_value']
+    return [
+        html.H5("Résultats du test par rééchantillonnage :"),
+        dbc.Row([
+            dbc.Col(html.Strong(f"{statistic_label} :"), width=4),
+            dbc.Col(f"{result['observed']:.4f}", width=8)
+        ]),
+        dbc.Row([
+            dbc.Col(html.Strong("Valeur p (permutation) :"), width=4),
+            dbc.Col(f"{p:.4f}", width=8)
+        ]),
+        dbc.Row([
+            dbc.Col(html.Strong(f"IC bootstrap à {RESAMPLING_CONFIDENCE:.0%} :"), width=4),
+            dbc.Col(f"[{result['ci'][0]:.4f} ; {result['ci'][1]:.4f}]", width=8)
+        ]),
+        dbc.Alert(
+            "Effet significatif" if p < 0.05 else "Pas d'effet significatif",
+            color="success" if p < 0.05 else "warning",
+            className="mt-3"
+        ),
+        html.Small(f"{result['n_resamples']} permutations et {result['n_resamples']} tirages bootstrap, "
+                   f"graine {result['seed']}.", className="text-muted")
+    ]
+
 # =============================================
 #partie bloc_notes
 # =============================================
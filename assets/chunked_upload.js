@@ -0,0 +1,120 @@
+// Upload par morceaux avec reprise pour les fichiers volumineux.
+// Le fichier est envoyé brut (sans base64) vers les routes /api/upload de app.py ;
+// l'identifiant d'upload est gardé dans localStorage pour reprendre un envoi interrompu
+// en resélectionnant le même fichier.
+(function () {
+    var CHUNK_SIZE = 8 * 1024 * 1024;
+    var MAX_RETRIES = 3;
+
+    function setProps(id, props) {
+        if (window.dash_clientside && window.dash_clientside.set_props) {
+            window.dash_clientside.set_props(id, props);
+        }
+    }
+
+    function showProgress(percent, label) {
+        setProps('chunked-upload-progress', {value: percent, label: label});
+    }
+
+    function wait(ms) {
+        return new Promise(function (resolve) { setTimeout(resolve, ms); });
+    }
+
+    async function readJson(response) {
+        try {
+            return await response.json();
+        } catch (e) {
+            return {error: 'Réponse invalide du serveur (' + response.status + ')'};
+        }
+    }
+
+    async function startOrResume(file, key) {
+        var uploadId = window.localStorage.getItem(key);
+        if (uploadId) {
+            var status = await fetch('/api/upload/' + uploadId);
+            if (status.ok) {
+                var body = await readJson(status);
+                return {uploadId: uploadId, received: body.received};
+            }
+            window.localStorage.removeItem(key);
+        }
+        var created = await fetch('/api/upload', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({filename: file.name, size: file.size})
+        });
+        var createdBody = await readJson(created);
+        if (!created.ok) {
+            throw new Error(createdBody.error);
+        }
+        window.localStorage.setItem(key, createdBody.upload_id);
+        return {uploadId: createdBody.upload_id, received: 0};
+    }
+
+    async function sendChunk(uploadId, file, offset) {
+        for (var attempt = 0; ; attempt++) {
+            try {
+                var response = await fetch('/api/upload/' + uploadId + '?offset=' + offset, {
+                    method: 'PUT',
+                    headers: {'Content-Type': 'application/octet-stream'},
+                    body: file.slice(offset, offset + CHUNK_SIZE)
+                });
+                var body = await readJson(response);
+                // 409 : le serveur indique la position à laquelle reprendre
+                if (response.ok || response.status === 409) {
+                    if (body.busy) {
+                        // Morceau précédent encore en cours d'écriture côté serveur
+                        await wait(1000);
+                    }
+                    return body.received;
+                }
+                throw new Error(body.error);
+            } catch (err) {
+                if (attempt >= MAX_RETRIES) {
+                    throw err;
+                }
+                await wait(1000 * (attempt + 1));
+            }
+        }
+    }
+
+    async function uploadFile(file) {
+        var key = 'explora-upload:' + file.name + ':' + file.size + ':' + file.lastModified;
+        var state = await startOrResume(file, key);
+        var received = state.received;
+
+        while (received < file.size) {
+            showProgress(Math.floor(100 * received / file.size), 'Envoi ' + Math.floor(100 * received / file.size) + '%');
+            received = await sendChunk(state.uploadId, file, received);
+        }
+
+        showProgress(100, 'Analyse du fichier...');
+        var completed = await fetch('/api/upload/' + state.uploadId + '/complete', {method: 'POST'});
+        var result = await readJson(completed);
+        if (completed.ok) {
+            window.localStorage.removeItem(key);
+            showProgress(100, 'Terminé');
+        }
+        setProps('chunked-upload-result', {data: result});
+    }
+
+    // Le bouton Dash 'chunked-upload-button' ouvre un sélecteur de fichier natif
+    document.addEventListener('click', function (event) {
+        if (!event.target || !event.target.closest || !event.target.closest('#chunked-upload-button')) {
+            return;
+        }
+        var input = document.createElement('input');
+        input.type = 'file';
+        input.accept = '.csv,.txt,.xls,.xlsx';
+        input.addEventListener('change', function () {
+            if (!input.files || !input.files.length) {
+                return;
+            }
+            showProgress(0, '');
+            uploadFile(input.files[0]).catch(function (err) {
+                setProps('chunked-upload-result', {data: {error: 'Erreur lors du chargement: ' + err.message}});
+            });
+        });
+        input.click();
+    });
+})();
@@ -0,0 +1,54 @@
+#---------------------------------------
+# Lots de rééchantillonnage (processus du pool)
+#---------------------------------------
+# Fonctions exécutées par les processus du pool de rééchantillonnage d'app.py. Elles sont dans un
+# module à part, qui ne dépend que de numpy, pour que ces processus n'importent pas l'application.
+import numpy as np
+
+# Données du dernier calcul lu par un processus du pool
+RESAMPLING_DATA = {}
+
+def resampling_data(path):
+    """Data of a run in the worker process, read from its file on the first batch"""
+    if RESAMPLING_DATA.get('path') != path:
+        with np.load(path) as data:
+            RESAMPLING_DATA.clear()
+            RESAMPLING_DATA.update(path=path, kind=str(data['kind']), x=data['x'], y=data['y'])
+    return RESAMPLING_DATA
+
+def resampling_statistic(kind, x, y):
+    """Observed statistic: difference of means (y is the group-1 mask) or Pearson correlation"""
+    if kind == 'mean_diff':
+        return x[y].mean() - x[~y].mean()
+    return np.corrcoef(x, y)[0, 1]
+
+def rowwise_correlation(x, y):
+    """Pearson correlation of each row of two 2-D arrays"""
+    x = x - x.mean(axis=1, keepdims=True)
+    y = y - y.mean(axis=1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (x * y).sum(axis=1) / np.sqrt((x * x).sum(axis=1) * (y * y).sum(axis=1))
+
+def resampling_batch(path, seed, size):
+    """Permutation and bootstrap statistics of one batch of resamples, in the worker process"""
+    data = resampling_data(path)
+    kind, x, y = data['kind'], data['x'], data['y']
+    rng = np.random.default_rng(seed)
+    n = len(x)
+    if kind == 'mean_diff':
+        n1 = int(y.sum())
+        # Permutation : réaffectation aléatoire des étiquettes de groupe
+        masks = rng.permuted(np.tile(y, (size, 1)), axis=1)
+        total = x.sum()
+        sums1 = masks @ x
+        permuted = sums1 / n1 - (total - sums1) / (n - n1)
+        # Bootstrap : tirage avec remise à l'intérieur de chaque groupe
+        x1, x2 = x[y], x[~y]
+        boot = x1[rng.integers(0, n1, (size, n1))].mean(axis=1) - x2[rng.integers(0, n - n1, (size, n - n1))].mean(axis=1)
+    else:
+        zx = (x - x.mean()) / x.std()
+        zy = (y - y.mean()) / y.std()
+        permuted = rng.permuted(np.tile(zy, (size, 1)), axis=1) @ zx / n
+        rows = rng.integers(0, n, (size, n))
+        boot = rowwise_correlation(x[rows], y[rows])
+    return permuted, boot